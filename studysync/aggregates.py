@@ -0,0 +1,164 @@
+import os
+import sys
+import json
+import argparse
+from rich.console import Console
+
+from logger import LOGS_DIR, create_logs_dir, _catalog_lock
+
+console = Console()
+
+AGGREGATES_FILE = os.path.join(LOGS_DIR, ".aggregates")
+
+# Version 3 records the catalog signature the totals match; any other version is rebuilt on first use
+AGGREGATES_VERSION = 3
+
+def empty_aggregates():
+
+    return {
+        "version": AGGREGATES_VERSION,
+        "catalog": None,
+        "sessions": 0,
+        "total_minutes": 0,
+        "topics": {},
+        "days": {}
+    }
+
+def apply_entry(aggregates, entry, sign=1):
+
+    duration = (entry.get("duration", 0) or 0) * sign
+
+    aggregates["sessions"] += sign
+    aggregates["total_minutes"] += duration
+
+    topic = entry.get("topic")
+    if topic:
+        topic_totals = aggregates["topics"].setdefault(topic, {"sessions": 0, "minutes": 0})
+        topic_totals["sessions"] += sign
+        topic_totals["minutes"] += duration
+        if topic_totals["sessions"] <= 0:
+            del aggregates["topics"][topic]
+
+    day = (entry.get("date") or "")[:10]
+    if day:
+        day_totals = aggregates["days"].setdefault(day, {"sessions": 0, "total_duration": 0, "focus_total": 0, "focus_count": 0})
+        day_totals["sessions"] += sign
+        day_totals["total_duration"] += duration
+        day_totals["focus_total"] += (entry.get("focus_total", 0) or 0) * sign
+        day_totals["focus_count"] += (entry.get("focus_count", 0) or 0) * sign
+        if day_totals["sessions"] <= 0:
+            del aggregates["days"][day]
+
+    return aggregates
+
+def _read_aggregates_file():
+
+    try:
+        with open(AGGREGATES_FILE, 'r') as f:
+            aggregates = json.load(f)
+        if aggregates.get("version") == AGGREGATES_VERSION:
+            return aggregates
+    except (json.JSONDecodeError, FileNotFoundError, AttributeError):
+        pass
+
+    return None
+
+def _stored_signature(signature):
+
+    return list(signature) if signature is not None else None
+
+def load_aggregates():
+
+    from logger import _catalog_signature
+
+    with _catalog_lock:
+        aggregates = _read_aggregates_file()
+
+        # Every catalog write updates the totals with it, so a matching signature means they are current without a scan
+        if aggregates is not None and aggregates["catalog"] == _stored_signature(_catalog_signature()):
+            return aggregates
+
+        return rebuild_aggregates()
+
+def _write_aggregates(aggregates):
+
+    create_logs_dir()
+
+    temp_path = f"{AGGREGATES_FILE}.tmp"
+
+    with open(temp_path, 'w') as f:
+        json.dump(aggregates, f)
+
+    os.replace(temp_path, AGGREGATES_FILE)
+
+def record_catalog_changes(signature, removed=(), added=()):
+
+    from logger import _catalog_signature
+
+    with _catalog_lock:
+        aggregates = _read_aggregates_file()
+
+        # Totals that were already behind the catalog are left for the next read to rebuild
+        if aggregates is None or aggregates["catalog"] != _stored_signature(signature):
+            return
+
+        for entry in removed:
+            apply_entry(aggregates, entry, -1)
+        for entry in added:
+            apply_entry(aggregates, entry)
+
+        aggregates["catalog"] = _stored_signature(_catalog_signature())
+        _write_aggregates(aggregates)
+
+def rebuild_aggregates():
+
+    from logger import load_catalog, _catalog_signature
+
+    with _catalog_lock:
+        aggregates = empty_aggregates()
+
+        # Catalog entries carry each session's totals, so a rebuild reads no session files it has already catalogued
+        for entry in load_catalog():
+            apply_entry(aggregates, entry)
+
+        aggregates["catalog"] = _stored_signature(_catalog_signature())
+        _write_aggregates(aggregates)
+
+        return aggregates
+
+def aggregate_daily_summary(start=None, end=None):
+
+    summary = {}
+
+    for day, totals in load_aggregates()["days"].items():
+        if start is not None and day < str(start):
+            continue
+        if end is not None and day > str(end):
+            continue
+
+        summary[day] = {
+            "sessions": totals["sessions"],
+            "total_duration": totals["total_duration"],
+            "avg_focus": totals["focus_total"] / totals["focus_count"] if totals["focus_count"] else 0,
+            "focus_count": totals["focus_count"]
+        }
+
+    return summary
+
+def main(argv=None):
+
+    parser = argparse.ArgumentParser(description="Maintain the StudySync aggregate totals")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    subparsers.add_parser("rebuild", help="Recompute the aggregate file from the session catalog")
+
+    args = parser.parse_args(argv)
+
+    if args.command == "rebuild":
+        aggregates = rebuild_aggregates()
+        console.print(
+            f"[green]Rebuilt aggregates: {aggregates['sessions']} sessions, "
+            f"{aggregates['total_minutes']} minutes, {len(aggregates['topics'])} topics[/green]"
+        )
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,157 @@
+import numpy as np
+
+from logger import query_sessions
+
+PERCENTILES = (10, 25, 50, 75, 90)
+
+def _to_datetimes(values):
+
+    try:
+        return np.array(values, dtype="datetime64[s]")
+    except ValueError:
+        parsed = []
+        for value in values:
+            try:
+                parsed.append(np.datetime64(value, "s"))
+            except ValueError:
+                parsed.append(np.datetime64("NaT"))
+        return np.array(parsed, dtype="datetime64[s]")
+
+class FocusData:
+
+    def __init__(self, sessions):
+
+        topics = sorted({session.get("topic") or "Unknown" for session in sessions})
+        topic_ids = {topic: i for i, topic in enumerate(topics)}
+
+        session_dates = []
+        session_topics = []
+        durations = []
+        score_values = []
+        score_times = []
+        score_topics = []
+        score_sessions = []
+
+        for session in sessions:
+            date = (session.get("date") or "").replace(" ", "T")
+            if not date:
+                continue
+
+            topic_id = topic_ids[session.get("topic") or "Unknown"]
+            session_number = len(session_dates)
+            session_dates.append(date)
+            session_topics.append(topic_id)
+            durations.append(session.get("duration", 0) or 0)
+
+            for score_data in session.get("focus_scores") or []:
+                score_values.append(score_data.get("score", 0))
+                score_times.append((score_data.get("timestamp") or "").replace(" ", "T") or date)
+                score_topics.append(topic_id)
+                score_sessions.append(session_number)
+
+        self.topics = topics
+        self.session_dates = _to_datetimes(session_dates)
+        self.session_topics = np.array(session_topics, dtype=np.int64)
+        self.durations = np.array(durations, dtype=np.float64)
+
+        scores = np.array(score_values, dtype=np.float64)
+        times = _to_datetimes(score_times)
+        score_topic_ids = np.array(score_topics, dtype=np.int64)
+        score_session_ids = np.array(score_sessions, dtype=np.int64)
+
+        order = np.argsort(times, kind="stable")
+        self.scores = scores[order]
+        self.timestamps = times[order]
+        self.score_topics = score_topic_ids[order]
+        self.score_sessions = score_session_ids[order]
+
+    @classmethod
+    def load(cls, start=None, end=None, topic=None):
+
+        return cls(query_sessions(start, end, topic))
+
+    def __len__(self):
+
+        return len(self.scores)
+
+    def mean(self):
+
+        return float(self.scores.mean()) if len(self.scores) else 0.0
+
+    def percentiles(self, q=PERCENTILES):
+
+        if not len(self.scores):
+            return {p: 0.0 for p in q}
+
+        return dict(zip(q, np.percentile(self.scores, q).tolist()))
+
+    def rolling_average(self, window=5):
+
+        if not len(self.scores):
+            return np.array([], dtype=np.float64)
+
+        window = max(1, min(window, len(self.scores)))
+        cumulative = np.cumsum(np.insert(self.scores, 0, 0.0))
+        return (cumulative[window:] - cumulative[:-window]) / window
+
+    def focus_by_hour(self):
+
+        valid = ~np.isnat(self.timestamps)
+        timestamps = self.timestamps[valid]
+        hours = (timestamps.astype("datetime64[h]") - timestamps.astype("datetime64[D]")).astype(np.int64)
+        counts = np.bincount(hours, minlength=24)[:24]
+        totals = np.bincount(hours, weights=self.scores[valid], minlength=24)[:24]
+
+        means = np.divide(totals, counts, out=np.zeros(24), where=counts > 0)
+        return means, counts
+
+    def topic_stats(self):
+
+        topic_count = len(self.topics)
+
+        counts = np.bincount(self.score_topics, minlength=topic_count)
+        totals = np.bincount(self.score_topics, weights=self.scores, minlength=topic_count)
+        squares = np.bincount(self.score_topics, weights=self.scores ** 2, minlength=topic_count)
+
+        means = np.divide(totals, counts, out=np.zeros(topic_count), where=counts > 0)
+        variances = np.divide(squares, counts, out=np.zeros(topic_count), where=counts > 0) - means ** 2
+
+        sessions = np.bincount(self.session_topics, minlength=topic_count)
+        minutes = np.bincount(self.session_topics, weights=self.durations, minlength=topic_count)
+
+        return [
+            {
+                "topic": topic,
+                "sessions": int(sessions[i]),
+                "minutes": int(minutes[i]),
+                "scores": int(counts[i]),
+                "mean": float(means[i]),
+                "variance": float(max(variances[i], 0.0))
+            }
+            for i, topic in enumerate(self.topics)
+        ]
+
+    def daily_summary(self):
+
+        if not len(self.session_dates):
+            return {}
+
+        session_days, session_index = np.unique(self.session_dates.astype("datetime64[D]"), return_inverse=True)
+        sessions = np.bincount(session_index, minlength=len(session_days))
+        minutes = np.bincount(session_index, weights=self.durations, minlength=len(session_days))
+
+        # Focus scores count towards the day their session started, as in the weekly stats
+        score_index = session_index[self.score_sessions]
+        focus_counts = np.bincount(score_index, minlength=len(session_days))
+        focus_totals = np.bincount(score_index, weights=self.scores, minlength=len(session_days))
+        focus_means = np.divide(focus_totals, focus_counts, out=np.zeros(len(session_days)), where=focus_counts > 0)
+
+        return {
+            str(day): {
+                "sessions": int(sessions[i]),
+                "total_duration": int(minutes[i]),
+                "avg_focus": float(focus_means[i]),
+                "focus_count": int(focus_counts[i])
+            }
+            for i, day in enumerate(session_days)
+        }
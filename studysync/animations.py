@@ -1,12 +1,21 @@
 
-import time
 import random
+from collections import OrderedDict
 from rich.console import Console
 from rich.panel import Panel
 from rich.align import Align
+from rich.live import Live
+from rich.segment import Segment
+
+from config import fast_mode_enabled
+from clock import get_clock
 
 console = Console()
 
+FRAME_CACHE_SIZE = 64
+
+_frame_cache = OrderedDict()
+
 CAT_FRAMES = [
     """
     /\_/\
@@ -61,6 +70,63 @@ BREAK_CAT_FRAMES = [
     """
 ]
 
+class RenderedFrame:
+
+    def __init__(self, segments):
+
+        self.segments = segments
+
+    def __rich_console__(self, console, options):
+
+        yield from self.segments
+
+def _frame_renderable(frame, message, border_style, title):
+
+    if message:
+        content = f"{frame}\n\n{message}"
+    else:
+        content = frame
+
+    panel = Panel(content, border_style=border_style)
+    if title:
+        panel.title = f"[bold {border_style}]{title}[/bold {border_style}]"
+
+    return Align.center(panel)
+
+def _trim_line(line):
+
+    # Live erases each line before redrawing it, so unstyled right padding is wasted output
+    while line and not line[-1].text.strip() and not line[-1].control and (line[-1].style is None or not line[-1].style.bgcolor):
+        line.pop()
+
+    return line
+
+def render_frames(frames, message="", border_style="cyan", title=""):
+
+    # Frames are laid out for the current terminal width, so a resize renders them again
+    key = (tuple(frames), message, border_style, title, console.width, console.color_system)
+
+    rendered = _frame_cache.get(key)
+    if rendered is not None:
+        _frame_cache.move_to_end(key)
+        return rendered
+
+    options = console.options
+    rendered = []
+    for frame in frames:
+        lines = console.render_lines(_frame_renderable(frame, message, border_style, title), options, pad=False)
+        segments = []
+        for line in lines:
+            segments.extend(_trim_line(line))
+            segments.append(Segment.line())
+        rendered.append(RenderedFrame(segments))
+
+    _frame_cache[key] = rendered
+    while len(_frame_cache) > FRAME_CACHE_SIZE:
+        _frame_cache.popitem(last=False)
+
+    return rendered
+
 def animate_cat(frames=None, duration=3, fps=5, message="", border_style="cyan", title=""):
 
     if frames is None:
@@ -69,22 +135,31 @@ def animate_cat(frames=None, duration=3, fps=5, message="", border_style="cyan",
     total_frames = int(duration * fps)
     frame_duration = 1 / fps
 
-    try:
-        for i in range(total_frames):
-            console.clear()
-            frame = frames[i % len(frames)]
+    # Fast mode keeps the message but shows a single still frame instead of animating
+    if fast_mode_enabled():
+        total_frames = 1
+        frame_duration = 0
 
-            if message:
-                content = f"{frame}\n\n{message}"
-            else:
-                content = frame
+    if total_frames <= 0:
+        return
 
-            panel = Panel(content, border_style=border_style)
-            if title:
-                panel.title = f"[bold {border_style}]{title}[/bold {border_style}]"
+    rendered = render_frames(frames, message, border_style, title)
 
-            console.print(Align.center(panel))
-            time.sleep(frame_duration)
+    try:
+        # Without a terminal to redraw in place the frame is printed once and held for the duration
+        if total_frames == 1 or not console.is_terminal:
+            console.clear()
+            console.print(rendered[0])
+            if frame_duration:
+                get_clock().sleep(total_frames * frame_duration)
+            return
+
+        console.clear()
+        with Live(rendered[0], console=console, auto_refresh=False) as live:
+            for i in range(total_frames):
+                live.update(rendered[i % len(rendered)], refresh=True)
+                if frame_duration:
+                    get_clock().sleep(frame_duration)
     except KeyboardInterrupt:
         pass
 
@@ -121,20 +196,13 @@ def show_loading_animation(message="Loading...", duration=2):
         f"[bold cyan]{message}[/bold cyan] [dim]\\[/dim]"
     ]
 
-    total_frames = int(duration * 4)  
+    if fast_mode_enabled():
+        return
 
-    try:
-        for i in range(total_frames):
-            console.clear()
-            frame = CAT_FRAMES[i % len(CAT_FRAMES)]
-            spinner = frames[i % len(frames)]
+    cycle = len(CAT_FRAMES) * len(frames)
+    loading_frames = [f"{CAT_FRAMES[i % len(CAT_FRAMES)]}\n\n{frames[i % len(frames)]}" for i in range(cycle)]
 
-            content = f"{frame}\n\n{spinner}"
-            panel = Panel(content, border_style="blue", title="[bold blue]Loading[/bold blue]")
-            console.print(Align.center(panel))
-            time.sleep(0.25)  
-    except KeyboardInterrupt:
-        pass
+    animate_cat(loading_frames, duration, 4, border_style="blue", title="Loading")
 
 HOME_CAT_FRAMES = [
     """
@@ -187,6 +255,9 @@ def show_dashboard_cat(message="Your Dashboard", duration=3):
 
 def show_transition_animation(from_screen="", to_screen="", duration=1.5):
 
+    if fast_mode_enabled():
+        return
+
     frames = [
         """
         /\_/\
@@ -0,0 +1,68 @@
+import os
+import json
+import time
+import threading
+
+from logger import LOGS_DIR, create_logs_dir
+from clock import get_clock
+
+CHECKPOINT_FILE = os.path.join(LOGS_DIR, ".checkpoint")
+
+CHECKPOINT_INTERVAL_SECONDS = 15
+
+class CheckpointJournal:
+
+    def __init__(self, path=CHECKPOINT_FILE, min_interval=CHECKPOINT_INTERVAL_SECONDS, clock=None):
+
+        self.path = path
+        self.min_interval = min_interval
+        self.clock = clock if clock is not None else get_clock()
+        self.last_written = None
+        self._lock = threading.Lock()
+
+    def write(self, state, force=False):
+
+        with self._lock:
+            now = self.clock.monotonic()
+
+            # Periodic checkpoints are rate limited; boundaries such as a recorded focus score pass force=True
+            if not force and self.last_written is not None and now - self.last_written < self.min_interval:
+                return False
+
+            create_logs_dir()
+
+            temp_path = f"{self.path}.tmp"
+
+            with open(temp_path, 'w') as f:
+                json.dump(dict(state, version=1, saved_at=time.time()), f)
+                f.flush()
+                os.fsync(f.fileno())
+
+            os.replace(temp_path, self.path)
+            self.last_written = now
+
+            return True
+
+    def clear(self):
+
+        with self._lock:
+            try:
+                os.remove(self.path)
+            except FileNotFoundError:
+                pass
+
+def load_checkpoint(path=CHECKPOINT_FILE):
+
+    try:
+        with open(path, 'r') as f:
+            state = json.load(f)
+        if isinstance(state, dict) and state.get("version") == 1:
+            return state
+    except (json.JSONDecodeError, FileNotFoundError):
+        pass
+
+    return None
+
+def clear_checkpoint(path=CHECKPOINT_FILE):
+
+    CheckpointJournal(path).clear()
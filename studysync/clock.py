@@ -0,0 +1,106 @@
+import time
+import heapq
+import asyncio
+import datetime
+import itertools
+from contextlib import contextmanager
+
+QUIET_ROUNDS = 3
+
+class SystemClock:
+
+    interactive = True
+
+    def monotonic(self):
+
+        return time.monotonic()
+
+    def sleep(self, seconds):
+
+        if seconds > 0:
+            time.sleep(seconds)
+
+    async def async_sleep(self, seconds):
+
+        await asyncio.sleep(max(0, seconds))
+
+    def now(self):
+
+        return datetime.datetime.now()
+
+class SimulatedClock:
+
+    interactive = False
+
+    def __init__(self, start=None):
+
+        self.start = start if start is not None else datetime.datetime.now()
+        self.elapsed = 0.0
+        self._sleepers = []
+        self._order = itertools.count()
+        self._pushes = 0
+
+    def monotonic(self):
+
+        return self.elapsed
+
+    def advance(self, seconds):
+
+        if seconds > 0:
+            self.elapsed += seconds
+
+    def sleep(self, seconds):
+
+        self.advance(seconds)
+
+    async def async_sleep(self, seconds):
+
+        entry = [self.elapsed + max(0, seconds), next(self._order)]
+        heapq.heappush(self._sleepers, entry)
+        self._pushes += 1
+
+        try:
+            # Every sleeping task yields until it holds the earliest deadline, then time jumps straight to it. It must stay
+            # earliest for QUIET_ROUNDS loop passes with no new sleeper, so tasks started in the same step register first
+            quiet = 0
+            while quiet < QUIET_ROUNDS:
+                pushes = self._pushes
+                await asyncio.sleep(0)
+                quiet = quiet + 1 if self._sleepers[0] is entry and self._pushes == pushes else 0
+
+            heapq.heappop(self._sleepers)
+            self.elapsed = max(self.elapsed, entry[0])
+        except BaseException:
+            if entry in self._sleepers:
+                self._sleepers.remove(entry)
+                heapq.heapify(self._sleepers)
+            raise
+
+    def now(self):
+
+        return self.start + datetime.timedelta(seconds=self.elapsed)
+
+_clock = SystemClock()
+
+def get_clock():
+
+    return _clock
+
+def set_clock(clock):
+
+    global _clock
+
+    previous = _clock
+    _clock = clock if clock is not None else SystemClock()
+
+    return previous
+
+@contextmanager
+def use_clock(clock):
+
+    previous = set_clock(clock)
+
+    try:
+        yield clock
+    finally:
+        set_clock(previous)
@@ -0,0 +1,75 @@
+import os
+import sys
+import json
+
+from logger import LOGS_DIR
+from clock import get_clock
+
+CONFIG_FILE = os.path.join(os.path.dirname(LOGS_DIR), "config.json")
+
+FAST_MODE_ENV = "STUDYSYNC_FAST"
+
+_fast_mode = None
+
+def load_config():
+
+    try:
+        with open(CONFIG_FILE, 'r') as f:
+            config = json.load(f)
+        if isinstance(config, dict):
+            return config
+    except (json.JSONDecodeError, FileNotFoundError):
+        pass
+
+    return {}
+
+def save_config(config):
+
+    temp_path = f"{CONFIG_FILE}.tmp"
+
+    with open(temp_path, 'w') as f:
+        json.dump(config, f, indent=4)
+
+    os.replace(temp_path, CONFIG_FILE)
+
+def _flag(value):
+
+    if isinstance(value, str):
+        return value.strip().lower() in ("1", "true", "yes", "on")
+
+    return bool(value)
+
+def _detect_fast_mode():
+
+    if os.environ.get(FAST_MODE_ENV, "").strip():
+        return _flag(os.environ[FAST_MODE_ENV])
+
+    config = load_config()
+    if "fast_mode" in config:
+        return _flag(config["fast_mode"])
+
+    # Piped or redirected output gains nothing from animations
+    try:
+        return not sys.stdout.isatty()
+    except (AttributeError, ValueError):
+        return True
+
+def fast_mode_enabled():
+
+    global _fast_mode
+
+    if _fast_mode is None:
+        _fast_mode = _detect_fast_mode()
+
+    return _fast_mode
+
+def set_fast_mode(enabled):
+
+    global _fast_mode
+
+    _fast_mode = bool(enabled)
+
+def pause(seconds):
+
+    if not fast_mode_enabled():
+        get_clock().sleep(seconds)
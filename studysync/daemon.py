@@ -0,0 +1,425 @@
+import os
+import sys
+import json
+import socket
+import asyncio
+import argparse
+from rich.console import Console
+
+from logger import LOGS_DIR, create_logs_dir, save_session
+from utils import format_time
+from clock import get_clock
+from plan import compile_study_plan, compile_pomodoro_plan
+
+console = Console()
+
+SOCKET_FILE = os.environ.get("STUDYSYNC_SOCKET", os.path.join(LOGS_DIR, ".daemon.sock"))
+
+class DaemonSession:
+
+    def __init__(self, kind, params, plan, clock=None):
+
+        self.kind = kind
+        self.params = params
+        self.plan = plan
+        self.clock = clock if clock is not None else get_clock()
+        self.total_seconds = plan.total_seconds
+
+        self.start_time = self.clock.now()
+        self.accumulated = 0.0
+        self.resumed_at = self.clock.monotonic()
+        self.focus_scores = []
+
+    @property
+    def paused(self):
+
+        return self.resumed_at is None
+
+    def elapsed(self):
+
+        elapsed = self.accumulated
+        if self.resumed_at is not None:
+            elapsed += self.clock.monotonic() - self.resumed_at
+
+        return min(elapsed, self.total_seconds)
+
+    def remaining(self):
+
+        return self.total_seconds - self.elapsed()
+
+    @property
+    def finished(self):
+
+        return self.elapsed() >= self.total_seconds
+
+    def pause(self):
+
+        if not self.paused:
+            self.accumulated = self.elapsed()
+            self.resumed_at = None
+
+    def resume(self):
+
+        if self.paused:
+            self.resumed_at = self.clock.monotonic()
+
+    def record_focus(self, score):
+
+        score = int(score)
+        if not 1 <= score <= 5:
+            raise ValueError("Focus score must be between 1 and 5")
+
+        self.focus_scores.append({
+            "timestamp": self.clock.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "score": score,
+            "interval": self.plan.phase_at(self.elapsed()).number
+        })
+
+    def status(self):
+
+        elapsed = self.elapsed()
+        phase = self.plan.phase_at(elapsed)
+
+        return {
+            "active": True,
+            "kind": self.kind,
+            "topic": self.params.get("topic"),
+            "phase": phase.kind,
+            "interval": phase.number,
+            "phase_remaining": round(phase.end - elapsed, 1),
+            "elapsed": round(elapsed, 1),
+            "remaining": round(self.total_seconds - elapsed, 1),
+            "paused": self.paused,
+            "focus_scores": len(self.focus_scores)
+        }
+
+    def session_data(self):
+
+        elapsed = self.elapsed()
+
+        if self.focus_scores:
+            avg_focus = sum(score["score"] for score in self.focus_scores) / len(self.focus_scores)
+        else:
+            avg_focus = 0
+
+        session_data = {
+            "topic": self.params.get("topic"),
+            "goal": self.params.get("goal"),
+            "date": self.start_time.strftime("%Y-%m-%d %H:%M:%S")
+        }
+
+        if self.kind == "pomodoro":
+            session_data.update({
+                "duration": int(elapsed / 60),
+                "session_type": "pomodoro",
+                "work_interval": self.params["work_minutes"],
+                "short_break": self.params["short_break"],
+                "long_break": self.params["long_break"],
+                "completed_intervals": self.plan.completed_work_intervals(elapsed),
+                "actual_duration_seconds": round(elapsed)
+            })
+        else:
+            # Only study phases count towards a standard session, as in StudySession
+            session_data.update({
+                "duration": self.params["duration"],
+                "break_interval": self.params["break_interval"],
+                "actual_duration_seconds": round(self.plan.work_done(elapsed))
+            })
+
+        session_data.update({"focus_scores": self.focus_scores, "avg_focus": avg_focus})
+
+        return session_data
+
+class TimerDaemon:
+
+    def __init__(self, path=SOCKET_FILE, clock=None):
+
+        self.path = path
+        self.clock = clock
+        self.session = None
+        self.last_saved = None
+        self.save_error = None
+        self._finish_handle = None
+
+    async def serve(self):
+
+        create_logs_dir()
+
+        if os.path.exists(self.path):
+            if daemon_running(self.path):
+                raise RuntimeError(f"A StudySync daemon is already running on {self.path}")
+
+            # Left behind by a daemon that did not shut down cleanly
+            os.remove(self.path)
+
+        server = await asyncio.start_unix_server(self._handle_client, path=self.path)
+        os.chmod(self.path, 0o600)
+        console.print(f"[green]StudySync timer daemon listening on {self.path}[/green]")
+
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            if os.path.exists(self.path):
+                os.remove(self.path)
+
+    async def _handle_client(self, reader, writer):
+
+        # Clients may keep one connection open and poll over it, one JSON request per line
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                writer.write((json.dumps(self.handle_request(line)) + "\n").encode("utf-8"))
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    def handle_request(self, line):
+
+        try:
+            request = json.loads(line)
+            handler = getattr(self, f"cmd_{request.get('command')}", None)
+            if handler is None:
+                raise ValueError(f"Unknown command: {request.get('command')}")
+            return dict(handler(request), ok=True)
+        except (ValueError, KeyError, TypeError, AttributeError, OSError) as e:
+            return {"ok": False, "error": str(e)}
+
+    def _schedule_finish(self):
+
+        if self._finish_handle is not None:
+            self._finish_handle.cancel()
+            self._finish_handle = None
+
+        # The daemon sleeps until the session is due to end instead of ticking every second
+        if self.session is not None and not self.session.paused:
+            loop = asyncio.get_running_loop()
+            self._finish_handle = loop.call_later(self.session.remaining(), self._finish)
+
+    def _finish(self):
+
+        self._finish_handle = None
+
+        if self.session is not None and self.session.finished:
+            try:
+                self._save()
+            except OSError as e:
+                # The finished session stays in memory, so a client can see the error in status and retry with stop
+                self.save_error = str(e)
+                console.print(f"[bold red]Could not save the finished session: {e}[/bold red]")
+
+    def _save(self):
+
+        self.last_saved = save_session(self.session.session_data())
+        self.session = None
+        self.save_error = None
+
+        if self._finish_handle is not None:
+            self._finish_handle.cancel()
+            self._finish_handle = None
+
+        return {"saved": self.last_saved}
+
+    def _require_session(self):
+
+        if self.session is None:
+            raise ValueError("No session is running")
+
+        return self.session
+
+    def cmd_start(self, request):
+
+        if self.session is not None:
+            raise ValueError("A session is already running")
+
+        kind = request.get("kind", "study")
+        params = {"topic": request["topic"], "goal": request.get("goal", "")}
+
+        if kind == "pomodoro":
+            params.update({
+                "work_minutes": int(request.get("work_minutes", 25)),
+                "short_break": int(request.get("short_break", 5)),
+                "long_break": int(request.get("long_break", 15)),
+                "intervals": int(request.get("intervals", 4)),
+                "total_intervals": int(request.get("total_intervals", 8))
+            })
+            plan = compile_pomodoro_plan(
+                params["work_minutes"], params["short_break"], params["long_break"],
+                params["intervals"], params["total_intervals"]
+            )
+        elif kind == "study":
+            params.update({
+                "duration": int(request.get("duration", 60)),
+                "break_interval": int(request.get("break_interval", 25))
+            })
+            plan = compile_study_plan(params["duration"], params["break_interval"])
+        else:
+            raise ValueError(f"Unknown session kind: {kind}")
+
+        self.session = DaemonSession(kind, params, plan, self.clock)
+        self._schedule_finish()
+
+        return self.session.status()
+
+    def cmd_pause(self, request):
+
+        self._require_session().pause()
+        self._schedule_finish()
+
+        return self.session.status()
+
+    def cmd_resume(self, request):
+
+        self._require_session().resume()
+        self._schedule_finish()
+
+        return self.session.status()
+
+    def cmd_status(self, request):
+
+        if self.session is None:
+            return {"active": False, "last_saved": self.last_saved}
+
+        if self.save_error is not None:
+            return dict(self.session.status(), save_error=self.save_error)
+
+        return self.session.status()
+
+    def cmd_focus(self, request):
+
+        self._require_session().record_focus(request["score"])
+
+        return self.session.status()
+
+    def cmd_stop(self, request):
+
+        self._require_session()
+
+        return self._save()
+
+def daemon_running(path=SOCKET_FILE):
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        client.settimeout(0.5)
+        try:
+            client.connect(path)
+        except OSError:
+            return False
+
+    return True
+
+def send_command(command, path=SOCKET_FILE, timeout=2.0, **params):
+
+    request = dict(params, command=command)
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        client.settimeout(timeout)
+        client.connect(path)
+        client.sendall((json.dumps(request) + "\n").encode("utf-8"))
+
+        response = b""
+        while not response.endswith(b"\n"):
+            chunk = client.recv(4096)
+            if not chunk:
+                break
+            response += chunk
+
+    return json.loads(response)
+
+def format_status(status):
+
+    if not status.get("active"):
+        return "StudySync: idle"
+    if status.get("save_error"):
+        return f"StudySync: could not save session ({status['save_error']})"
+
+    label = "Paused" if status["paused"] else status["phase"].replace("_", " ").title()
+    return f"StudySync: {label} {format_time(int(status['phase_remaining']))} ({status['topic']})"
+
+def main(argv=None):
+
+    parser = argparse.ArgumentParser(description="Run or control the StudySync timer daemon")
+    parser.add_argument("--socket", default=SOCKET_FILE, help="Path of the daemon's Unix socket")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    subparsers.add_parser("serve", help="Run the timer daemon in the foreground")
+
+    study_parser = subparsers.add_parser("start", help="Start a standard study session")
+    study_parser.add_argument("topic")
+    study_parser.add_argument("--goal", default="")
+    study_parser.add_argument("--duration", type=int, default=60)
+    study_parser.add_argument("--break-interval", type=int, default=25)
+
+    pomodoro_parser = subparsers.add_parser("pomodoro", help="Start a Pomodoro session")
+    pomodoro_parser.add_argument("topic")
+    pomodoro_parser.add_argument("--goal", default="")
+    pomodoro_parser.add_argument("--work", type=int, default=25)
+    pomodoro_parser.add_argument("--short-break", type=int, default=5)
+    pomodoro_parser.add_argument("--long-break", type=int, default=15)
+    pomodoro_parser.add_argument("--intervals", type=int, default=4)
+    pomodoro_parser.add_argument("--total", type=int, default=8)
+
+    status_parser = subparsers.add_parser("status", help="Show the running session")
+    status_parser.add_argument("--json", action="store_true", help="Print the raw status for scripts")
+
+    focus_parser = subparsers.add_parser("focus", help="Record a focus score for the current interval")
+    focus_parser.add_argument("score", type=int, choices=range(1, 6))
+
+    subparsers.add_parser("pause", help="Pause the running session")
+    subparsers.add_parser("resume", help="Resume a paused session")
+    subparsers.add_parser("stop", help="End the running session now and save it")
+
+    args = parser.parse_args(argv)
+
+    if args.command == "serve":
+        try:
+            asyncio.run(TimerDaemon(args.socket).serve())
+        except RuntimeError as e:
+            console.print(f"[bold red]{e}[/bold red]")
+            return 1
+        except KeyboardInterrupt:
+            pass
+        return 0
+
+    if args.command == "start":
+        params = {"kind": "study", "topic": args.topic, "goal": args.goal, "duration": args.duration, "break_interval": args.break_interval}
+        command = "start"
+    elif args.command == "pomodoro":
+        params = {
+            "kind": "pomodoro", "topic": args.topic, "goal": args.goal, "work_minutes": args.work,
+            "short_break": args.short_break, "long_break": args.long_break,
+            "intervals": args.intervals, "total_intervals": args.total
+        }
+        command = "start"
+    elif args.command == "focus":
+        params = {"score": args.score}
+        command = "focus"
+    else:
+        params = {}
+        command = args.command
+
+    try:
+        response = send_command(command, args.socket, **params)
+    except (FileNotFoundError, ConnectionRefusedError):
+        console.print("[bold red]The StudySync daemon is not running. Start it with: python studysync/daemon.py serve[/bold red]")
+        return 1
+
+    if not response.get("ok"):
+        console.print(f"[bold red]{response.get('error')}[/bold red]")
+        return 1
+
+    if args.command == "status" and args.json:
+        print(json.dumps(response))
+    elif "saved" in response:
+        console.print(f"[green]Session saved: {response['saved']}[/green]")
+    else:
+        print(format_status(response))
+
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,142 @@
+import os
+import datetime
+import threading
+
+from logger import LOGS_DIR, GOALS_FILE, STORAGE_BACKEND, load_goals, load_catalog, session_totals, study_topics, _catalog_signature
+from insights import INSIGHTS_DIR, load_all_insights, count_due_concepts
+
+_snapshot_lock = threading.Lock()
+_snapshot = None
+
+class DashboardSnapshot:
+
+    def __init__(self, totals, topics, streak, goals_data, all_insights=None, signature=None, today=None):
+
+        from streaks import current_streak
+
+        if today is None:
+            today = datetime.date.today()
+
+        self.signature = signature
+        self.total_sessions = totals["sessions"]
+        self.total_minutes = totals["minutes"]
+        self.topics = list(topics)
+        self.last_date = totals["last_date"]
+        self.current_streak = current_streak(streak, today)
+        self.longest_streak = streak["longest_streak"]
+        self.goals = list((goals_data or {}).get("goals", []))
+        self.insights = all_insights or {}
+        # Counted from the insights already loaded, so a prefetch never reads or rebuilds the review index
+        self.due_reviews = count_due_concepts(self.insights, today.strftime("%Y-%m-%d"))
+
+    @classmethod
+    def build(cls, signature=None):
+
+        from streaks import load_streak
+
+        # Refreshing the catalog applies sessions added, edited or deleted outside the app to the totals; SQLite needs no catalog
+        if STORAGE_BACKEND != "sqlite":
+            load_catalog()
+
+        # Loaded without migration, so a prefetch thread never writes topic files
+        return cls(session_totals(), study_topics(), load_streak(), load_goals(), load_all_insights(migrate=False), signature)
+
+    def totals(self):
+
+        return {
+            "sessions": self.total_sessions,
+            "minutes": self.total_minutes,
+            "topics": len(self.topics)
+        }
+
+    def achievements(self):
+
+        achievements = []
+
+        if self.total_sessions >= 10:
+            achievements.append("+ Study Master: Completed 10+ sessions")
+        if self.total_minutes >= 500:
+            achievements.append("* Time Wizard: Studied for 500+ minutes")
+        if self.current_streak >= 3:
+            achievements.append("^ Consistency King: 3+ day streak")
+        if len(self.topics) >= 3:
+            achievements.append("^ Knowledge Explorer: Studied 3+ topics")
+
+        return achievements
+
+def _watched_paths():
+
+    from aggregates import AGGREGATES_FILE
+    from streaks import STREAK_FILE
+
+    paths = [LOGS_DIR, AGGREGATES_FILE, STREAK_FILE, GOALS_FILE]
+
+    if STORAGE_BACKEND == "segments":
+        from segments import SEGMENT_INDEX_FILE
+        paths.append(SEGMENT_INDEX_FILE)
+    elif STORAGE_BACKEND == "sqlite":
+        from database import DB_FILE
+        paths.extend([DB_FILE, f"{DB_FILE}-wal"])
+
+    return paths
+
+def _insights_signature():
+
+    try:
+        # Topic files can be edited in place, so the directory mtime alone misses edits
+        return tuple(sorted(
+            (entry.name, entry.stat().st_mtime_ns, entry.stat().st_size)
+            for entry in os.scandir(INSIGHTS_DIR)
+            if entry.name.endswith('.json')
+        ))
+    except FileNotFoundError:
+        return None
+
+def _snapshot_signature():
+
+    signature = [datetime.date.today().isoformat()]
+
+    for path in _watched_paths():
+        try:
+            stat = os.stat(path)
+            signature.append((stat.st_mtime_ns, stat.st_size))
+        except FileNotFoundError:
+            signature.append(None)
+
+    # Session files can be edited in place without touching the directory, but any catalog refresh that sees it changes the catalog
+    signature.append(_catalog_signature())
+    signature.append(_insights_signature())
+
+    return tuple(signature)
+
+def load_dashboard_snapshot():
+
+    global _snapshot
+
+    signature = _snapshot_signature()
+
+    with _snapshot_lock:
+        if _snapshot is None or _snapshot.signature != signature:
+            _snapshot = DashboardSnapshot.build(signature)
+
+            # The first build can write the aggregate and streak files it was missing
+            signature = _snapshot_signature()
+            if signature != _snapshot.signature:
+                _snapshot = DashboardSnapshot.build(signature)
+
+        return _snapshot
+
+def _prefetch():
+
+    try:
+        load_dashboard_snapshot()
+    except Exception:
+        # The menu loads the snapshot again on the main thread and reports any error there
+        pass
+
+def prefetch_dashboard():
+
+    thread = threading.Thread(target=_prefetch, name="studysync-prefetch", daemon=True)
+    thread.start()
+
+    return thread
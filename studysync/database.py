@@ -0,0 +1,302 @@
+import os
+import sys
+import json
+import sqlite3
+import argparse
+import threading
+from rich.console import Console
+
+from logger import LOGS_DIR, GOALS_FILE, create_logs_dir
+
+console = Console()
+
+DB_FILE = os.path.join(LOGS_DIR, "studysync.db")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS sessions (
+    id TEXT PRIMARY KEY,
+    topic TEXT,
+    goal TEXT,
+    date TEXT,
+    day TEXT,
+    duration INTEGER NOT NULL DEFAULT 0,
+    avg_focus REAL NOT NULL DEFAULT 0,
+    session_type TEXT NOT NULL DEFAULT 'standard',
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_sessions_day ON sessions(day);
+CREATE INDEX IF NOT EXISTS idx_sessions_topic ON sessions(topic);
+
+CREATE TABLE IF NOT EXISTS focus_scores (
+    session_id TEXT NOT NULL REFERENCES sessions(id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    timestamp TEXT,
+    score INTEGER NOT NULL,
+    interval INTEGER,
+    PRIMARY KEY (session_id, position)
+);
+
+CREATE TABLE IF NOT EXISTS goals (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    type TEXT NOT NULL,
+    target INTEGER NOT NULL,
+    deadline TEXT
+);
+"""
+
+_local = threading.local()
+
+def get_connection():
+
+    connection = getattr(_local, "connection", None)
+
+    if connection is None:
+        create_logs_dir()
+        connection = sqlite3.connect(DB_FILE)
+        connection.row_factory = sqlite3.Row
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        connection.execute("PRAGMA foreign_keys=ON")
+        connection.executescript(SCHEMA)
+        _local.connection = connection
+
+    return connection
+
+def _session_row(session_id, session_data):
+
+    date = session_data.get("date") or None
+
+    return (
+        session_id,
+        session_data.get("topic"),
+        session_data.get("goal"),
+        date,
+        date[:10] if date else None,
+        session_data.get("duration", 0) or 0,
+        session_data.get("avg_focus", 0) or 0,
+        session_data.get("session_type", "standard"),
+        json.dumps(session_data)
+    )
+
+def _focus_rows(session_id, session_data):
+
+    return [
+        (session_id, position, score_data.get("timestamp"), score_data.get("score", 0), score_data.get("interval"))
+        for position, score_data in enumerate(session_data.get("focus_scores") or [])
+    ]
+
+def insert_sessions(records):
+
+    connection = get_connection()
+
+    with connection:
+        for session_id, session_data in records:
+            connection.execute("DELETE FROM focus_scores WHERE session_id = ?", (session_id,))
+            connection.execute("INSERT OR REPLACE INTO sessions VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", _session_row(session_id, session_data))
+            connection.executemany("INSERT INTO focus_scores VALUES (?, ?, ?, ?, ?)", _focus_rows(session_id, session_data))
+
+def insert_session(session_id, session_data):
+
+    connection = get_connection()
+
+    try:
+        with connection:
+            connection.execute("INSERT INTO sessions VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", _session_row(session_id, session_data))
+            connection.executemany("INSERT INTO focus_scores VALUES (?, ?, ?, ?, ?)", _focus_rows(session_id, session_data))
+    except sqlite3.IntegrityError:
+        raise FileExistsError(f"Session '{session_id}' already exists in database")
+
+def list_db_sessions():
+
+    rows = get_connection().execute("SELECT id FROM sessions ORDER BY id DESC")
+    return [row["id"] for row in rows]
+
+def read_db_session(session_id):
+
+    row = get_connection().execute("SELECT data FROM sessions WHERE id = ?", (session_id,)).fetchone()
+
+    if row is None:
+        raise FileNotFoundError(f"No session '{session_id}' in database")
+
+    return json.loads(row["data"])
+
+def read_db_sessions(session_ids):
+
+    connection = get_connection()
+    found = {}
+
+    for start in range(0, len(session_ids), 500):
+        chunk = session_ids[start:start + 500]
+        placeholders = ", ".join("?" for _ in chunk)
+        for row in connection.execute(f"SELECT id, data FROM sessions WHERE id IN ({placeholders})", chunk):
+            found[row["id"]] = json.loads(row["data"])
+
+    return [
+        (found[session_id], None) if session_id in found else (None, f"No session '{session_id}' in database")
+        for session_id in session_ids
+    ]
+
+def db_catalog():
+
+    rows = get_connection().execute(
+        "SELECT id, topic, date, duration, avg_focus, session_type FROM sessions ORDER BY id DESC"
+    )
+
+    return [
+        {
+            "file": row["id"],
+            "topic": row["topic"],
+            "date": row["date"],
+            "duration": row["duration"],
+            "avg_focus": row["avg_focus"],
+            "session_type": row["session_type"]
+        }
+        for row in rows
+    ]
+
+def _where(start=None, end=None, topic=None, prefix=""):
+
+    clauses = []
+    params = []
+
+    if start is not None:
+        clauses.append(f"{prefix}day >= ?")
+        params.append(str(start))
+    if end is not None:
+        clauses.append(f"{prefix}day <= ?")
+        params.append(str(end))
+    if topic is not None:
+        clauses.append(f"{prefix}topic = ?")
+        params.append(topic)
+
+    return (" WHERE " + " AND ".join(clauses)) if clauses else "", params
+
+def query_db_sessions(start=None, end=None, topic=None):
+
+    where, params = _where(start, end, topic)
+    rows = get_connection().execute(f"SELECT data FROM sessions{where} ORDER BY id DESC", params)
+    return [json.loads(row["data"]) for row in rows]
+
+def db_daily_summary(start=None, end=None):
+
+    connection = get_connection()
+    where, params = _where(start, end)
+    joined_where, _ = _where(start, end, prefix="s.")
+
+    summary = {}
+    for row in connection.execute(
+        f"SELECT day, COUNT(*) AS sessions, SUM(duration) AS total_duration FROM sessions{where} GROUP BY day", params
+    ):
+        if row["day"]:
+            summary[row["day"]] = {"sessions": row["sessions"], "total_duration": row["total_duration"], "avg_focus": 0, "focus_count": 0}
+
+    for row in connection.execute(
+        "SELECT s.day AS day, AVG(f.score) AS avg_focus, COUNT(f.score) AS focus_count FROM focus_scores f "
+        f"JOIN sessions s ON s.id = f.session_id{joined_where} GROUP BY s.day", params
+    ):
+        if row["day"] in summary:
+            summary[row["day"]]["avg_focus"] = row["avg_focus"] or 0
+            summary[row["day"]]["focus_count"] = row["focus_count"]
+
+    return summary
+
+def db_session_totals():
+
+    row = get_connection().execute(
+        "SELECT COUNT(*) AS sessions, COALESCE(SUM(duration), 0) AS minutes, "
+        "COUNT(DISTINCT topic) AS topics, MAX(day) AS last_date FROM sessions"
+    ).fetchone()
+
+    return {"sessions": row["sessions"], "minutes": row["minutes"], "topics": row["topics"], "last_date": row["last_date"]}
+
+def db_study_topics():
+
+    rows = get_connection().execute("SELECT DISTINCT topic FROM sessions WHERE topic IS NOT NULL ORDER BY topic")
+    return [row["topic"] for row in rows]
+
+def load_db_goals():
+
+    rows = get_connection().execute("SELECT type, target, deadline FROM goals ORDER BY id")
+    return {"goals": [dict(row) for row in rows]}
+
+def save_db_goals(goals_data):
+
+    connection = get_connection()
+
+    with connection:
+        connection.execute("DELETE FROM goals")
+        connection.executemany(
+            "INSERT INTO goals (type, target, deadline) VALUES (?, ?, ?)",
+            [(goal.get("type"), goal.get("target"), goal.get("deadline")) for goal in goals_data.get("goals", [])]
+        )
+
+def import_json_sessions(directory=LOGS_DIR):
+
+    records = []
+
+    for filename in sorted(os.listdir(directory)):
+        if not filename.endswith('.json') or filename == os.path.basename(GOALS_FILE):
+            continue
+        try:
+            with open(os.path.join(directory, filename), 'r') as f:
+                records.append((filename, json.load(f)))
+        except (json.JSONDecodeError, FileNotFoundError) as e:
+            console.print(f"[yellow]Skipping {filename}: {e}[/yellow]")
+
+    insert_sessions(records)
+
+    return len(records)
+
+def import_json_goals(goals_file=GOALS_FILE):
+
+    if not os.path.exists(goals_file):
+        return 0
+
+    with open(goals_file, 'r') as f:
+        goals_data = json.load(f)
+
+    save_db_goals(goals_data)
+
+    return len(goals_data.get("goals", []))
+
+def export_json_sessions(directory):
+
+    if not os.path.exists(directory):
+        os.makedirs(directory)
+
+    count = 0
+    for row in get_connection().execute("SELECT id, data FROM sessions ORDER BY id"):
+        filename = row["id"] if row["id"].endswith('.json') else f"{row['id']}.json"
+        with open(os.path.join(directory, filename), 'w') as f:
+            json.dump(json.loads(row["data"]), f, indent=4)
+        count += 1
+
+    with open(os.path.join(directory, os.path.basename(GOALS_FILE)), 'w') as f:
+        json.dump(load_db_goals(), f, indent=2)
+
+    return count
+
+def main(argv=None):
+
+    parser = argparse.ArgumentParser(description="Manage the StudySync SQLite session database")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    import_parser = subparsers.add_parser("import", help="Import JSON session files and goals.json into the database")
+    import_parser.add_argument("directory", nargs="?", default=LOGS_DIR)
+
+    export_parser = subparsers.add_parser("export", help="Export every session (and the goals) as JSON files")
+    export_parser.add_argument("directory")
+
+    args = parser.parse_args(argv)
+
+    if args.command == "import":
+        count = import_json_sessions(args.directory)
+        goals = import_json_goals()
+        console.print(f"[green]Imported {count} sessions and {goals} goals into {DB_FILE}[/green]")
+        console.print("[dim]Set STUDYSYNC_STORAGE=sqlite to read and write sessions from the database.[/dim]")
+    elif args.command == "export":
+        count = export_json_sessions(args.directory)
+        console.print(f"[green]Exported {count} sessions to {args.directory}[/green]")
+
+if __name__ == "__main__":
+    sys.exit(main())
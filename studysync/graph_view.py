@@ -0,0 +1,209 @@
+import math
+from rich.console import Console
+from rich.prompt import Prompt
+from rich.tree import Tree
+
+console = Console()
+
+PAGE_SIZE = 20
+CHILD_PAGE_SIZE = 10
+DEFAULT_DEPTH = 3
+
+class GraphView:
+
+    def __init__(self, graph, page_size=PAGE_SIZE, child_page_size=CHILD_PAGE_SIZE, max_depth=DEFAULT_DEPTH):
+
+        self.graph = graph
+        self.page_size = page_size
+        self.child_page_size = child_page_size
+        self.max_depth = max_depth
+        self.page = 0
+        self.matches = None
+        self.expanded = set()
+        self.child_limits = {}
+        self.visible = []
+        self._sorted_nodes = None
+
+    def roots(self):
+
+        if self.matches is not None:
+            return self.matches
+
+        # Sorted once, on first render, and only the current page is ever turned into tree nodes
+        if self._sorted_nodes is None:
+            self._sorted_nodes = sorted(range(len(self.graph.nodes)), key=self.graph.nodes.__getitem__)
+
+        return self._sorted_nodes
+
+    def page_count(self):
+
+        return max(1, math.ceil(len(self.roots()) / self.page_size))
+
+    def turn_page(self, step):
+
+        self.page = min(max(0, self.page + step), self.page_count() - 1)
+
+    def set_depth(self, depth):
+
+        self.max_depth = max(0, depth)
+
+    def toggle(self, number):
+
+        if not 1 <= number <= len(self.visible):
+            raise ValueError(f"No topic numbered {number} on this page")
+
+        path = self.visible[number - 1]
+
+        if path in self.expanded:
+            self.expanded.discard(path)
+        elif len(path) <= self.max_depth:
+            self.expanded.add(path)
+        else:
+            raise ValueError(f"Depth limit {self.max_depth} reached; raise it with 'd <depth>'")
+
+    def show_more(self, number):
+
+        if not 1 <= number <= len(self.visible):
+            raise ValueError(f"No topic numbered {number} on this page")
+
+        path = self.visible[number - 1]
+        self.expanded.add(path)
+        self.child_limits[path] = self.child_limits.get(path, self.child_page_size) + self.child_page_size
+
+    def search(self, text):
+
+        text = text.strip().lower()
+        matches = [node for node, topic in enumerate(self.graph.nodes) if text in topic.lower()]
+
+        # An exact name wins over topics that merely contain it
+        exact = [node for node in matches if self.graph.nodes[node].lower() == text]
+        if exact:
+            matches = exact[:1]
+        else:
+            matches.sort(key=self.graph.nodes.__getitem__)
+
+        if not matches:
+            return 0
+
+        self.matches = matches
+        self.page = 0
+
+        # A single match is focused: it becomes the only root and opens straight away
+        if len(matches) == 1:
+            self.expanded.add((matches[0],))
+
+        return len(matches)
+
+    def reset(self):
+
+        self.matches = None
+        self.page = 0
+        self.expanded.clear()
+        self.child_limits.clear()
+
+    def render(self):
+
+        roots = self.roots()
+        first = self.page * self.page_size
+        page_roots = roots[first:first + self.page_size]
+
+        title = "[bold cyan]Knowledge Graph[/bold cyan]"
+        if self.matches is not None:
+            title += f" [dim](search: {len(roots)} match{'es' if len(roots) != 1 else ''})[/dim]"
+
+        tree = Tree(title, guide_style="dim")
+        self.visible = []
+
+        for node in page_roots:
+            self._add_branch(tree, (node,))
+
+        if not page_roots:
+            tree.add("[dim](No topics yet)[/dim]")
+
+        return tree
+
+    def _add_branch(self, parent, path):
+
+        node = path[-1]
+        neighbours = self.graph.adjacency[node]
+        expanded = path in self.expanded
+
+        self.visible.append(path)
+        number = len(self.visible)
+        marker = "▾" if expanded else ("▸" if neighbours else " ")
+        label = f"[dim]{number:>3}[/dim] {marker} [bold green]{self.graph.nodes[node]}[/bold green]"
+        if neighbours:
+            label += f" [dim]({len(neighbours)} link{'s' if len(neighbours) != 1 else ''})[/dim]"
+
+        branch = parent.add(label)
+
+        if not expanded:
+            return
+
+        # Topics already on the path are left out, so cycles in the graph do not repeat forever
+        on_path = set(path)
+        children = [neighbour for neighbour in neighbours if neighbour not in on_path]
+        limit = self.child_limits.get(path, self.child_page_size)
+
+        if not children:
+            branch.add("[dim](No other related topics)[/dim]")
+
+        for child in children[:limit]:
+            if len(path) < self.max_depth:
+                self._add_branch(branch, path + (child,))
+            else:
+                branch.add(f"[blue]{self.graph.nodes[child]}[/blue]")
+
+        if len(children) > limit:
+            branch.add(f"[dim]… {len(children) - limit} more (more {number})[/dim]")
+
+    def footer(self):
+
+        roots = self.roots()
+        first = self.page * self.page_size
+
+        return (
+            f"Topics {min(first + 1, len(roots))}-{min(first + self.page_size, len(roots))} of {len(roots)} · "
+            f"page {self.page + 1}/{self.page_count()} · depth limit {self.max_depth}"
+        )
+
+def browse_graph(graph):
+
+    view = GraphView(graph)
+    message = None
+
+    while True:
+        console.clear()
+        console.print(view.render())
+        console.print(f"\n[dim]{view.footer()}[/dim]")
+        if message:
+            console.print(message)
+            message = None
+
+        command = Prompt.ask(
+            "[bold]<number>[/bold] expand/collapse · [bold]n[/bold]/[bold]p[/bold] page · "
+            "[bold]/topic[/bold] search · [bold]d <depth>[/bold] · [bold]more <number>[/bold] · "
+            "[bold]r[/bold] reset · [bold]q[/bold] quit",
+            default="q"
+        ).strip()
+
+        try:
+            if command in ("q", ""):
+                return
+            elif command == "n":
+                view.turn_page(1)
+            elif command == "p":
+                view.turn_page(-1)
+            elif command == "r":
+                view.reset()
+            elif command.startswith("/"):
+                if not view.search(command[1:]):
+                    message = f"[yellow]No topic matches '{command[1:]}'.[/yellow]"
+            elif command.startswith("d "):
+                view.set_depth(int(command[2:]))
+            elif command.startswith("more "):
+                view.show_more(int(command[5:]))
+            else:
+                view.toggle(int(command))
+        except ValueError as e:
+            message = f"[bold red]{e}[/bold red]"
@@ -1,6 +1,7 @@
 
 import os
 import json
+import uuid
 import datetime
 from pathlib import Path
 from rich.console import Console
@@ -8,10 +9,11 @@ from rich.prompt import Prompt
 from rich.panel import Panel
 from rich.table import Table
 from rich.markdown import Markdown
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 from typing import List, Dict, Optional
 
 from logger import create_logs_dir, LOGS_DIR
+from clock import get_clock
 
 console = Console()
 
@@ -19,8 +21,13 @@ INSIGHTS_DIR = os.path.join(os.path.dirname(LOGS_DIR), "insights")
 
 SR_INTERVALS = [1, 3, 7, 14, 30, 90]  
 
+def new_concept_id():
+
+    return uuid.uuid4().hex
+
 class Concept(BaseModel):
 
+    id: str = Field(default_factory=new_concept_id)
     content: str
     topic: str
     created_at: str
@@ -28,6 +35,9 @@ class Concept(BaseModel):
     next_review: Optional[str] = None
     review_count: int = 0
     retention_level: int = 0  
+    ease_factor: float = 0.0
+    stability: float = 0.0
+    difficulty: float = 0.0
 
 class TopicInsights(BaseModel):
 
@@ -36,6 +46,29 @@ class TopicInsights(BaseModel):
     related_topics: List[str] = Field(default_factory=list)
     last_studied: Optional[str] = None
 
+    _concept_index: Dict[str, Concept] = PrivateAttr(default_factory=dict)
+    _index_key: Optional[tuple] = PrivateAttr(default=None)
+    _version: int = PrivateAttr(default=0)
+
+    def add_concepts(self, concepts):
+
+        self.concepts.extend(concepts)
+        self._version += 1
+
+    def concept_index(self):
+
+        # add_concepts bumps the version; the list identity and length also catch a replaced or resized list
+        key = (self._version, id(self.concepts), len(self.concepts))
+        if key != self._index_key:
+            self._concept_index = {concept.id: concept for concept in self.concepts}
+            self._index_key = key
+
+        return self._concept_index
+
+    def get_concept(self, concept_id):
+
+        return self.concept_index().get(concept_id)
+
 def create_insights_dir():
 
     if not os.path.exists(INSIGHTS_DIR):
@@ -57,84 +90,145 @@ def load_topic_insights(topic):
         try:
             with open(file_path, 'r') as f:
                 data = json.load(f)
-                return TopicInsights(**data)
+            return _parse_topic_insights(data)
         except (json.JSONDecodeError, FileNotFoundError):
             pass
 
     return TopicInsights(topic=topic)
 
+def _parse_topic_insights(data, migrate=True):
+
+    insights = TopicInsights(**data)
+
+    # Files written before concepts had IDs get theirs now and are saved straight away, so the IDs stay stable
+    if migrate and any("id" not in concept for concept in data.get("concepts", [])):
+        save_topic_insights(insights)
+
+    return insights
+
 def save_topic_insights(insights):
 
     create_insights_dir()
 
     file_path = get_topic_insights_file(insights.topic)
+    is_new = not os.path.exists(file_path)
 
-    with open(file_path, 'w') as f:
+    temp_path = f"{file_path}.tmp"
+
+    # Readers never see a half-written topic file, which would parse as empty and lose its concepts on the next save
+    with open(temp_path, 'w') as f:
         json.dump(insights.dict(), f, indent=4)
 
+    os.replace(temp_path, file_path)
+
+    if is_new:
+        from knowledge_graph import record_topic
+        record_topic(insights.topic)
+
+def load_all_insights(migrate=True):
+
+    create_insights_dir()
+
+    all_insights = {}
+    for file in sorted(os.listdir(INSIGHTS_DIR)):
+        if not file.endswith('.json'):
+            continue
+        try:
+            with open(os.path.join(INSIGHTS_DIR, file), 'r') as f:
+                data = json.load(f)
+            insights = _parse_topic_insights(data, migrate)
+            all_insights[insights.topic] = insights
+        except (json.JSONDecodeError, FileNotFoundError):
+            continue
+
+    return all_insights
+
+def count_due_concepts(all_insights=None, today=None):
+
+    if today is None:
+        today = get_clock().now().strftime("%Y-%m-%d")
+
+    if all_insights is None:
+        from review_index import count_due
+        return count_due(today)
+
+    return sum(
+        1
+        for insights in all_insights.values()
+        for concept in insights.concepts
+        if concept.next_review and concept.next_review <= today
+    )
+
 def capture_concepts(topic, goal):
 
     console.print(Panel("[bold cyan]Capture Key Concepts[/bold cyan]"))
     console.print("[yellow]What are 1-3 key concepts you learned in this session?[/yellow]")
     console.print("[dim](Press Enter with empty input when done)[/dim]")
 
+    from scheduling import get_scheduler
+    scheduler = get_scheduler()
+
     concepts = []
     for i in range(1, 4):
         concept = Prompt.ask(f"[bold]Concept {i}[/bold]", default="")
         if not concept:
             break
 
-        now = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        next_review = (datetime.datetime.now() + 
-                      datetime.timedelta(days=SR_INTERVALS[0])).strftime("%Y-%m-%d")
+        now = get_clock().now()
 
-        concepts.append(Concept(
+        concept = Concept(
             content=concept,
             topic=topic,
-            created_at=now,
-            next_review=next_review,
+            created_at=now.strftime("%Y-%m-%d %H:%M:%S"),
             review_count=0,
             retention_level=0
-        ))
+        )
+        concept.next_review = (now + datetime.timedelta(days=scheduler.interval(concept))).strftime("%Y-%m-%d")
+        concepts.append(concept)
 
     if concepts:
         insights = load_topic_insights(topic)
-        insights.concepts.extend(concepts)
-        insights.last_studied = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        insights.add_concepts(concepts)
+        insights.last_studied = get_clock().now().strftime("%Y-%m-%d %H:%M:%S")
         save_topic_insights(insights)
 
+        from review_index import update_review_index, concept_entry
+        update_review_index(added=[concept_entry(concept) for concept in concepts])
+
         console.print(f"[green]Saved {len(concepts)} concepts for future review![/green]")
 
     return concepts
 
-def check_concepts_for_review(topic):
+def review_concept(concept, remembered, now=None, scheduler=None):
 
-    insights = load_topic_insights(topic)
-
-    today = datetime.datetime.now().strftime("%Y-%m-%d")
-    due_concepts = []
+    if now is None:
+        now = get_clock().now()
+    if scheduler is None:
+        from scheduling import get_scheduler
+        scheduler = get_scheduler()
 
-    for concept in insights.concepts:
-        if concept.next_review and concept.next_review <= today:
-            due_concepts.append(concept)
+    scheduler.update(concept, remembered, now)
 
-    return due_concepts
+    concept.review_count += 1
+    concept.last_reviewed = now.strftime("%Y-%m-%d %H:%M:%S")
 
-def review_due_concepts(topic):
+    next_review = now + datetime.timedelta(days=scheduler.interval(concept))
+    concept.next_review = next_review.strftime("%Y-%m-%d")
 
-    due_concepts = check_concepts_for_review(topic)
+    return concept
 
-    if not due_concepts:
-        return False
+def _ask_review(concepts, total, first=1, show_topic=False):
 
-    console.print(Panel(f"[bold cyan]Concept Review for {topic}[/bold cyan]"))
-    console.print(f"[yellow]You have {len(due_concepts)} concepts due for review.[/yellow]")
+    from review_index import concept_entry
+    from scheduling import get_scheduler
 
-    insights = load_topic_insights(topic)
-    updated = False
+    scheduler = get_scheduler()
+    moved = []
 
-    for i, concept in enumerate(due_concepts, 1):
-        console.print(f"\n[bold]Concept {i}/{len(due_concepts)}:[/bold]")
+    for i, concept in enumerate(concepts, first):
+        console.print(f"\n[bold]Concept {i}/{total}:[/bold]")
+        if show_topic:
+            console.print(f"[dim]{concept.topic}[/dim]")
         console.print(Panel(concept.content))
 
         remembered = Prompt.ask(
@@ -143,66 +237,106 @@ def review_due_concepts(topic):
             default="y"
         ).lower() == "y"
 
-        for j, c in enumerate(insights.concepts):
-            if c.content == concept.content and c.created_at == concept.created_at:
-                if remembered:
-                    c.retention_level = min(5, c.retention_level + 1)
-                else:
-                    c.retention_level = max(0, c.retention_level - 1)
+        old_entry = concept_entry(concept)
+        review_concept(concept, remembered, scheduler=scheduler)
+        moved.append((old_entry, concept_entry(concept)))
+
+    return moved
+
+def review_due_concepts(topic):
+
+    from review_index import update_review_index
+
+    insights = load_topic_insights(topic)
+
+    today = get_clock().now().strftime("%Y-%m-%d")
+    due_concepts = [concept for concept in insights.concepts if concept.next_review and concept.next_review <= today]
 
-                c.review_count += 1
-                c.last_reviewed = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    if not due_concepts:
+        return False
 
-                interval_idx = min(c.retention_level, len(SR_INTERVALS) - 1)
-                next_review = (datetime.datetime.now() + 
-                              datetime.timedelta(days=SR_INTERVALS[interval_idx]))
-                c.next_review = next_review.strftime("%Y-%m-%d")
+    console.print(Panel(f"[bold cyan]Concept Review for {topic}[/bold cyan]"))
+    console.print(f"[yellow]You have {len(due_concepts)} concepts due for review.[/yellow]")
 
-                insights.concepts[j] = c
-                updated = True
-                break
+    # The due concepts are the loaded topic's own objects, so they are updated in place
+    moved = _ask_review(due_concepts, len(due_concepts))
 
-    if updated:
+    if moved:
         save_topic_insights(insights)
+        update_review_index(added=[new for _, new in moved], removed=[old for old, _ in moved])
         console.print("\n[green]Concept review completed and saved![/green]")
 
     return True
 
-def display_knowledge_graph():
+def review_all_due_concepts(until=None):
 
-    create_insights_dir()
+    from review_index import due_entries, update_review_index
+
+    # Only the topics that have something due are opened
+    by_topic = {}
+    for entry in due_entries(until):
+        by_topic.setdefault(entry[1], []).append(entry)
+
+    due = []
+    stale = []
+    for topic, entries in by_topic.items():
+        insights = load_topic_insights(topic)
+        concepts = []
+
+        for entry in entries:
+            concept = insights.get_concept(entry[2])
+            if concept is not None:
+                concepts.append(concept)
+            else:
+                stale.append(entry)
+
+        if concepts:
+            due.append((insights, concepts))
 
-    insight_files = [f for f in os.listdir(INSIGHTS_DIR) if f.endswith('.json')]
+    # Entries for concepts removed from their topic file would otherwise be counted as due on every run
+    if stale:
+        update_review_index(removed=stale)
 
-    if not insight_files:
+    total = sum(len(concepts) for _, concepts in due)
+
+    if not total:
+        return False
+
+    console.print(Panel("[bold cyan]Review All Due Concepts[/bold cyan]"))
+    console.print(f"[yellow]You have {total} concepts due for review across {len(due)} topics.[/yellow]")
+
+    reviewed = 0
+    for insights, concepts in due:
+        moved = _ask_review(concepts, total, reviewed + 1, show_topic=True)
+        reviewed += len(moved)
+
+        if moved:
+            save_topic_insights(insights)
+            update_review_index(added=[new for _, new in moved], removed=[old for old, _ in moved])
+
+    console.print("\n[green]Concept review completed and saved![/green]")
+
+    return True
+
+def browse_knowledge_graph():
+
+    create_insights_dir()
+
+    if not any(f.endswith('.json') for f in os.listdir(INSIGHTS_DIR)):
         console.print("[yellow]No insights found to generate knowledge graph.[/yellow]")
         return
 
-    topics = {}
-    for file in insight_files:
-        try:
-            with open(os.path.join(INSIGHTS_DIR, file), 'r') as f:
-                data = json.load(f)
-                insights = TopicInsights(**data)
-                topics[insights.topic] = insights.related_topics
-        except (json.JSONDecodeError, FileNotFoundError):
-            continue
+    from knowledge_graph import load_graph
+    from graph_view import browse_graph
+
+    # The graph index holds every topic and link, so no topic file is opened here
+    graph = load_graph()
 
-    if not topics:
+    if not len(graph):
         console.print("[yellow]No valid insights found to generate knowledge graph.[/yellow]")
         return
 
-    console.print(Panel("[bold cyan]Knowledge Graph[/bold cyan]"))
-
-    for topic, related in topics.items():
-        console.print(f"[bold green]{topic}[/bold green]")
-        if related:
-            for i, rel in enumerate(related):
-                prefix = "└── " if i == len(related) - 1 else "├── "
-                console.print(f"  {prefix}[blue]{rel}[/blue]")
-        else:
-            console.print("  └── [dim](No related topics yet)[/dim]")
-        console.print("")
+    browse_graph(graph)
 
 def add_related_topic(topic, related_topic):
 
@@ -217,6 +351,9 @@ def add_related_topic(topic, related_topic):
             related_insights.related_topics.append(topic)
             save_topic_insights(related_insights)
 
+        from knowledge_graph import record_related_topic
+        record_related_topic(topic, related_topic)
+
 def calculate_learning_effectiveness(topic):
 
     insights = load_topic_insights(topic)
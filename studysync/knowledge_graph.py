@@ -0,0 +1,404 @@
+import os
+import sys
+import json
+import argparse
+import threading
+from collections import deque
+import numpy as np
+from rich.console import Console
+from rich.table import Table
+
+from insights import INSIGHTS_DIR, create_insights_dir, load_all_insights
+
+console = Console()
+
+GRAPH_FILE = os.path.join(INSIGHTS_DIR, ".graph")
+
+_graph_lock = threading.Lock()
+_graph_cache = None
+
+class KnowledgeGraph:
+
+    def __init__(self, nodes=(), edges=()):
+
+        self.nodes = []
+        self.node_ids = {}
+        self.edges = []
+        self.adjacency = []
+        self._edge_set = set()
+
+        for topic in nodes:
+            self.add_node(topic)
+        for source, target in edges:
+            self._link(source, target)
+
+    @classmethod
+    def from_index(cls, index):
+
+        return cls(index["nodes"], index["edges"])
+
+    def to_index(self):
+
+        return {"version": 1, "nodes": self.nodes, "edges": self.edges}
+
+    def __len__(self):
+
+        return len(self.nodes)
+
+    def __contains__(self, topic):
+
+        return topic in self.node_ids
+
+    def add_node(self, topic):
+
+        node = self.node_ids.get(topic)
+
+        if node is None:
+            node = self.node_ids[topic] = len(self.nodes)
+            self.nodes.append(topic)
+            self.adjacency.append([])
+
+        return node
+
+    def _link(self, source, target):
+
+        key = (min(source, target), max(source, target))
+        if source == target or key in self._edge_set:
+            return False
+
+        self._edge_set.add(key)
+        self.edges.append([source, target])
+        self.adjacency[source].append(target)
+        self.adjacency[target].append(source)
+
+        return True
+
+    def add_edge(self, topic, related_topic):
+
+        return self._link(self.add_node(topic), self.add_node(related_topic))
+
+    def _node(self, topic):
+
+        if topic not in self.node_ids:
+            raise KeyError(f"Unknown topic: {topic}")
+
+        return self.node_ids[topic]
+
+    def neighbours(self, topic):
+
+        return [self.nodes[node] for node in self.adjacency[self._node(topic)]]
+
+    def degree(self, topic):
+
+        return len(self.adjacency[self._node(topic)])
+
+    def components(self):
+
+        seen = [False] * len(self.nodes)
+        components = []
+
+        for start in range(len(self.nodes)):
+            if seen[start]:
+                continue
+
+            seen[start] = True
+            queue = deque([start])
+            component = []
+
+            while queue:
+                node = queue.popleft()
+                component.append(self.nodes[node])
+                for neighbour in self.adjacency[node]:
+                    if not seen[neighbour]:
+                        seen[neighbour] = True
+                        queue.append(neighbour)
+
+            components.append(component)
+
+        components.sort(key=len, reverse=True)
+
+        return components
+
+    def shortest_path(self, source, target):
+
+        start, goal = self._node(source), self._node(target)
+
+        if start == goal:
+            return [source]
+
+        # Breadth-first from both ends, always expanding the smaller frontier
+        parents = {start: None}
+        children = {goal: None}
+        forward, backward = [start], [goal]
+
+        while forward and backward:
+            if len(forward) > len(backward):
+                forward, backward = backward, forward
+                parents, children = children, parents
+
+            next_frontier = []
+            for node in forward:
+                for neighbour in self.adjacency[node]:
+                    if neighbour in parents:
+                        continue
+                    parents[neighbour] = node
+                    if neighbour in children:
+                        return self._join_path(neighbour, parents, children, start)
+                    next_frontier.append(neighbour)
+
+            forward = next_frontier
+
+        return None
+
+    def _join_path(self, meeting, parents, children, start):
+
+        head = []
+        node = meeting
+        while node is not None:
+            head.append(node)
+            node = parents[node]
+
+        tail = []
+        node = children[meeting]
+        while node is not None:
+            tail.append(node)
+            node = children[node]
+
+        path = head[::-1] + tail
+
+        # The two searches may have been swapped, so orient the path from the source
+        if path[0] != start:
+            path.reverse()
+
+        return [self.nodes[node] for node in path]
+
+    def neighbourhood(self, topic, hops=1):
+
+        start = self._node(topic)
+        distances = {start: 0}
+        frontier = [start]
+
+        for distance in range(1, hops + 1):
+            next_frontier = []
+            for node in frontier:
+                for neighbour in self.adjacency[node]:
+                    if neighbour not in distances:
+                        distances[neighbour] = distance
+                        next_frontier.append(neighbour)
+            frontier = next_frontier
+
+        return {self.nodes[node]: distance for node, distance in distances.items() if node != start}
+
+    def _edge_arrays(self):
+
+        edges = np.array(self.edges, dtype=np.int64).reshape(-1, 2)
+
+        # Every undirected edge is walked in both directions
+        sources = np.concatenate([edges[:, 0], edges[:, 1]])
+        targets = np.concatenate([edges[:, 1], edges[:, 0]])
+
+        return sources, targets
+
+    def degree_centrality(self):
+
+        if len(self.nodes) < 2:
+            return {topic: 0.0 for topic in self.nodes}
+
+        sources, _ = self._edge_arrays()
+        degrees = np.bincount(sources, minlength=len(self.nodes)) / (len(self.nodes) - 1)
+
+        return dict(zip(self.nodes, degrees.tolist()))
+
+    def pagerank(self, damping=0.85, iterations=100, tolerance=1e-10):
+
+        count = len(self.nodes)
+        if not count:
+            return {}
+
+        sources, targets = self._edge_arrays()
+        out_degree = np.bincount(sources, minlength=count).astype(np.float64)
+        dangling = out_degree == 0
+        share = np.divide(1.0, out_degree, out=np.zeros(count), where=~dangling)
+
+        ranks = np.full(count, 1.0 / count)
+
+        for _ in range(iterations):
+            # Isolated topics spread their rank evenly, as if linked to every topic
+            spread = np.bincount(targets, weights=(ranks * share)[sources], minlength=count)
+            updated = (1 - damping) / count + damping * (spread + ranks[dangling].sum() / count)
+            converged = np.abs(updated - ranks).sum() < tolerance
+            ranks = updated
+            if converged:
+                break
+
+        return dict(zip(self.nodes, ranks.tolist()))
+
+def _read_graph_file():
+
+    try:
+        with open(GRAPH_FILE, 'r') as f:
+            index = json.load(f)
+        if isinstance(index, dict) and index.get("version") == 1:
+            return index
+    except (json.JSONDecodeError, FileNotFoundError):
+        pass
+
+    return None
+
+def _write_graph(graph):
+
+    global _graph_cache
+
+    create_insights_dir()
+
+    temp_path = f"{GRAPH_FILE}.tmp"
+
+    with open(temp_path, 'w') as f:
+        json.dump(graph.to_index(), f)
+
+    os.replace(temp_path, GRAPH_FILE)
+
+    stat = os.stat(GRAPH_FILE)
+    _graph_cache = ((stat.st_mtime_ns, stat.st_size), graph)
+
+def rebuild_graph():
+
+    graph = KnowledgeGraph()
+
+    for topic, insights in load_all_insights().items():
+        graph.add_node(topic)
+        for related_topic in insights.related_topics:
+            graph.add_edge(topic, related_topic)
+
+    _write_graph(graph)
+
+    return graph
+
+def load_graph():
+
+    global _graph_cache
+
+    try:
+        stat = os.stat(GRAPH_FILE)
+        signature = (stat.st_mtime_ns, stat.st_size)
+    except FileNotFoundError:
+        signature = None
+
+    # Interactive queries reuse the parsed graph until the index file changes
+    if signature is not None and _graph_cache is not None and _graph_cache[0] == signature:
+        return _graph_cache[1]
+
+    index = _read_graph_file()
+
+    if index is None:
+        return rebuild_graph()
+
+    graph = KnowledgeGraph.from_index(index)
+    _graph_cache = (signature, graph)
+
+    return graph
+
+def _update_graph(update):
+
+    with _graph_lock:
+        # A missing index is rebuilt from the topic files, which already hold the change, so the update is a no-op
+        graph = load_graph()
+
+        if update(graph):
+            _write_graph(graph)
+
+def record_topic(topic):
+
+    def update(graph):
+        if topic in graph:
+            return False
+        graph.add_node(topic)
+        return True
+
+    _update_graph(update)
+
+def record_related_topic(topic, related_topic):
+
+    _update_graph(lambda graph: graph.add_edge(topic, related_topic))
+
+def main(argv=None):
+
+    parser = argparse.ArgumentParser(description="Query the StudySync knowledge graph")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    subparsers.add_parser("rebuild", help="Recompute the graph index from every topic file")
+
+    link_parser = subparsers.add_parser("link", help="Relate two topics")
+    link_parser.add_argument("topic")
+    link_parser.add_argument("related_topic")
+
+    subparsers.add_parser("components", help="List groups of connected topics")
+
+    path_parser = subparsers.add_parser("path", help="Shortest chain of related topics between two topics")
+    path_parser.add_argument("source")
+    path_parser.add_argument("target")
+
+    central_parser = subparsers.add_parser("central", help="Most connected topics")
+    central_parser.add_argument("--top", type=int, default=10)
+
+    near_parser = subparsers.add_parser("near", help="Topics within k hops of a topic")
+    near_parser.add_argument("topic")
+    near_parser.add_argument("--hops", type=int, default=2)
+
+    args = parser.parse_args(argv)
+
+    if args.command == "rebuild":
+        graph = rebuild_graph()
+        console.print(f"[green]Rebuilt knowledge graph: {len(graph)} topics, {len(graph.edges)} links[/green]")
+        return 0
+
+    if args.command == "link":
+        from insights import add_related_topic
+        add_related_topic(args.topic, args.related_topic)
+        console.print(f"[green]Linked '{args.topic}' and '{args.related_topic}'[/green]")
+        return 0
+
+    graph = load_graph()
+
+    try:
+        if args.command == "components":
+            for number, component in enumerate(graph.components(), 1):
+                console.print(f"[bold green]Group {number}[/bold green] ({len(component)} topic{'s' if len(component) > 1 else ''}): {', '.join(component)}")
+
+        elif args.command == "path":
+            path = graph.shortest_path(args.source, args.target)
+            if path is None:
+                console.print(f"[yellow]'{args.source}' and '{args.target}' are not connected.[/yellow]")
+            else:
+                console.print(" → ".join(f"[blue]{topic}[/blue]" for topic in path))
+
+        elif args.command == "central":
+            degree = graph.degree_centrality()
+            ranks = graph.pagerank()
+
+            table = Table(show_header=True, header_style="bold magenta")
+            table.add_column("Topic")
+            table.add_column("Links")
+            table.add_column("Degree")
+            table.add_column("PageRank")
+
+            for topic in sorted(ranks, key=ranks.get, reverse=True)[:args.top]:
+                table.add_row(topic, str(graph.degree(topic)), f"{degree[topic]:.3f}", f"{ranks[topic]:.4f}")
+
+            console.print(table)
+
+        elif args.command == "near":
+            nearby = graph.neighbourhood(args.topic, args.hops)
+            if not nearby:
+                console.print(f"[yellow]No topics within {args.hops} hops of '{args.topic}'.[/yellow]")
+            for topic, distance in sorted(nearby.items(), key=lambda item: (item[1], item[0])):
+                console.print(f"{distance} hop{'s' if distance > 1 else ''}: [blue]{topic}[/blue]")
+
+    except KeyError as e:
+        console.print(f"[bold red]{e.args[0]}[/bold red]")
+        return 1
+
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,12 +2,115 @@
 import os
 import json
 import datetime
+import threading
+import multiprocessing
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
 from pathlib import Path
 from rich.console import Console
 
 console = Console()
 
-LOGS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "logs")
+LOGS_DIR = os.environ.get("STUDYSYNC_LOGS_DIR") or os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "logs")
+CATALOG_FILE = os.path.join(LOGS_DIR, ".catalog")
+# Version 2 entries carry each session's focus totals; older catalogs are rebuilt from the session files
+CATALOG_VERSION = 2
+# Saves append their entry to the journal; it is folded into the catalog once it grows past this size
+CATALOG_JOURNAL_FILE = f"{CATALOG_FILE}.journal"
+CATALOG_JOURNAL_MAX_BYTES = 256 * 1024
+GOALS_FILE = os.path.join(os.path.dirname(LOGS_DIR), "goals.json")
+
+STORAGE_BACKEND = os.environ.get("STUDYSYNC_STORAGE", "json").lower()
+
+READ_WORKERS = min(32, (os.cpu_count() or 1) + 4)
+PROCESS_POOL_THRESHOLD = 5000
+SESSION_CACHE_MAX_BYTES = int(os.environ.get("STUDYSYNC_CACHE_BYTES", 32 * 1024 * 1024))
+
+_session_id_lock = threading.Lock()
+# Held while the catalog and the aggregate totals change together
+_catalog_lock = threading.RLock()
+_last_session_id = ("", -1)
+
+class SessionCache:
+
+    def __init__(self, max_bytes):
+
+        self.max_bytes = max_bytes
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, path, signature):
+
+        with self._lock:
+            cached = self._entries.get(path)
+            if cached is not None and cached[0] == signature:
+                self._entries.move_to_end(path)
+                self.hits += 1
+                return cached[2]
+
+            self.misses += 1
+            return None
+
+    def put(self, path, signature, size, session_data):
+
+        with self._lock:
+            previous = self._entries.pop(path, None)
+            if previous is not None:
+                self.current_bytes -= previous[1]
+
+            if size > self.max_bytes:
+                return
+
+            self._entries[path] = (signature, size, session_data)
+            self.current_bytes += size
+            self._evict()
+
+    def resize(self, max_bytes):
+
+        with self._lock:
+            self.max_bytes = max_bytes
+            self._evict()
+
+    def clear(self):
+
+        with self._lock:
+            self._entries.clear()
+            self.current_bytes = 0
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self):
+
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self.current_bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses
+            }
+
+    def _evict(self):
+
+        while self.current_bytes > self.max_bytes and self._entries:
+            _, (_, size, _) = self._entries.popitem(last=False)
+            self.current_bytes -= size
+
+_session_cache = SessionCache(SESSION_CACHE_MAX_BYTES)
+
+_date_index = {"signature": None, "days": [], "files": [], "topics": []}
+
+def configure_session_cache(max_bytes):
+
+    _session_cache.resize(max_bytes)
+
+def session_cache_stats():
+
+    return _session_cache.stats()
 
 def create_logs_dir():
 
@@ -15,16 +118,64 @@ def create_logs_dir():
         os.makedirs(LOGS_DIR)
         console.print(f"[green]Created logs directory: {LOGS_DIR}[/green]")
 
+def new_session_id():
+
+    global _last_session_id
+
+    with _session_id_lock:
+        stamp = datetime.datetime.now().strftime("%Y-%m-%d_%H%M%S")
+        last_stamp, last_sequence = _last_session_id
+
+        # Stay on the last stamp if the clock went backwards so IDs keep sorting in save order
+        if stamp <= last_stamp:
+            stamp, sequence = last_stamp, last_sequence + 1
+        else:
+            sequence = 0
+
+        _last_session_id = (stamp, sequence)
+
+    return f"{stamp}_{sequence:06d}"
+
 def save_session(session_data):
 
     create_logs_dir()
 
-    timestamp = datetime.datetime.now().strftime("%Y-%m-%d_%H%M")
-    filename = f"{timestamp}.json"
-    filepath = os.path.join(LOGS_DIR, filename)
+    while True:
+        filename = f"{new_session_id()}.json"
 
-    with open(filepath, 'w') as f:
-        json.dump(session_data, f, indent=4)
+        try:
+            # SQLite answers totals with queries; the other backends keep the aggregate file in step with their catalog
+            if STORAGE_BACKEND == "sqlite":
+                from database import insert_session
+                insert_session(filename, session_data)
+                break
+
+            with _catalog_lock:
+                signature = _catalog_signature()
+
+                if STORAGE_BACKEND == "segments":
+                    from segments import append_session, load_index
+                    append_session(filename, session_data)
+                    entry = load_index()["sessions"][filename]
+                else:
+                    filepath = os.path.join(LOGS_DIR, filename)
+
+                    with open(filepath, 'x') as f:
+                        json.dump(session_data, f, indent=4)
+
+                    stat = os.stat(filepath)
+                    entry = _catalog_entry(filename, session_data, stat.st_mtime, stat.st_size)
+                    _append_catalog_entry(entry)
+
+                from aggregates import record_catalog_changes
+                record_catalog_changes(signature, added=[entry])
+            break
+        except FileExistsError:
+            # Another process saved under the same ID; take the next one
+            continue
+
+    from streaks import record_study_day, session_day
+    record_study_day(session_day(session_data))
 
     return filename
 
@@ -32,6 +183,13 @@ def list_sessions():
 
     create_logs_dir()
 
+    if STORAGE_BACKEND == "segments":
+        from segments import list_segment_sessions
+        return list_segment_sessions()
+    elif STORAGE_BACKEND == "sqlite":
+        from database import list_db_sessions
+        return list_db_sessions()
+
     json_files = [f for f in os.listdir(LOGS_DIR) if f.endswith('.json')]
 
     json_files.sort(reverse=True)
@@ -40,40 +198,382 @@ def list_sessions():
 
 def read_session(filename):
 
-    filepath = os.path.join(LOGS_DIR, filename)
+    if STORAGE_BACKEND in ("segments", "sqlite"):
+        if STORAGE_BACKEND == "segments":
+            from segments import read_segment_session as read_stored_session
+        else:
+            from database import read_db_session as read_stored_session
+        try:
+            return read_stored_session(filename)
+        except (json.JSONDecodeError, FileNotFoundError, KeyError) as e:
+            console.print(f"[bold red]Error reading session file: {e}[/bold red]")
+            return None
+
+    session_data, error = _load_session_files([os.path.join(LOGS_DIR, filename)])[0]
+
+    if error:
+        console.print(f"[bold red]Error reading session file: {error}[/bold red]")
+
+    return session_data
+
+def read_sessions(filenames):
+
+    filenames = list(filenames)
+
+    if STORAGE_BACKEND == "segments":
+        from segments import read_segment_sessions
+        loaded = read_segment_sessions(filenames)
+    elif STORAGE_BACKEND == "sqlite":
+        from database import read_db_sessions
+        loaded = read_db_sessions(filenames)
+    else:
+        loaded = _load_session_files([os.path.join(LOGS_DIR, filename) for filename in filenames])
+
+    sessions = []
+    for session_data, error in loaded:
+        if error:
+            console.print(f"[bold red]Error reading session file: {error}[/bold red]")
+        elif session_data is not None:
+            sessions.append(session_data)
+
+    return sessions
+
+def _load_session_file(filepath):
 
     try:
         with open(filepath, 'r') as f:
-            return json.load(f)
+            return json.load(f), None
     except (json.JSONDecodeError, FileNotFoundError) as e:
-        console.print(f"[bold red]Error reading session file: {e}[/bold red]")
-        return None
+        return None, str(e)
 
-def export_session(session_data, format_type='txt'):
+def _load_session_files(filepaths):
 
-    create_logs_dir()
+    results = [None] * len(filepaths)
+    misses = []
+
+    for position, filepath in enumerate(filepaths):
+        try:
+            stat = os.stat(filepath)
+        except FileNotFoundError as e:
+            results[position] = (None, str(e))
+            continue
+
+        signature = (stat.st_mtime_ns, stat.st_size)
+        session_data = _session_cache.get(filepath, signature)
+        if session_data is not None:
+            results[position] = (session_data, None)
+        else:
+            misses.append((position, filepath, signature))
+
+    loaded = _decode_session_files([filepath for _, filepath, _ in misses])
+
+    for (position, filepath, signature), (session_data, error) in zip(misses, loaded):
+        if session_data is not None:
+            _session_cache.put(filepath, signature, signature[1], session_data)
+        results[position] = (session_data, error)
 
-    if 'date' in session_data:
+    return results
+
+def _decode_session_files(filepaths):
+
+    if len(filepaths) < 2:
+        return [_load_session_file(filepath) for filepath in filepaths]
+
+    # Threads overlap the file I/O; very large histories are decode-bound, so spread them over processes
+    if len(filepaths) >= PROCESS_POOL_THRESHOLD:
         try:
-            date_obj = datetime.datetime.strptime(session_data['date'], "%Y-%m-%d %H:%M:%S")
-            timestamp = date_obj.strftime("%Y-%m-%d_%H%M")
-        except ValueError:
-            timestamp = datetime.datetime.now().strftime("%Y-%m-%d_%H%M")
+            # Workers are spawned, not forked: this can run on the dashboard prefetch thread, and a fork would copy other threads' held locks
+            with ProcessPoolExecutor(mp_context=multiprocessing.get_context("spawn")) as executor:
+                return list(executor.map(_load_session_file, filepaths, chunksize=256))
+        except (OSError, RuntimeError):
+            pass
+
+    with ThreadPoolExecutor(max_workers=READ_WORKERS) as executor:
+        return list(executor.map(_load_session_file, filepaths))
+
+def load_catalog():
+
+    create_logs_dir()
+
+    if STORAGE_BACKEND == "segments":
+        from segments import segment_catalog
+        return segment_catalog()
+    elif STORAGE_BACKEND == "sqlite":
+        from database import db_catalog
+        return db_catalog()
+
+    with _catalog_lock:
+        entries = _read_catalog_file()
+        removed = []
+        added = []
+        seen = set()
+        stale = []
+
+        with os.scandir(LOGS_DIR) as it:
+            for entry in it:
+                if not entry.name.endswith('.json') or not entry.is_file():
+                    continue
+
+                seen.add(entry.name)
+                stat = entry.stat()
+                cached = entries.get(entry.name)
+                if cached and cached.get("mtime") == stat.st_mtime and cached.get("size") == stat.st_size:
+                    continue
+
+                stale.append((entry.name, entry.path, stat))
+
+        loaded = _load_session_files([path for _, path, _ in stale])
+
+        for (name, _, stat), (session_data, _) in zip(stale, loaded):
+            if name in entries:
+                removed.append(entries[name])
+            if isinstance(session_data, dict):
+                entries[name] = _catalog_entry(name, session_data, stat.st_mtime, stat.st_size)
+                added.append(entries[name])
+            else:
+                entries[name] = {"file": name, "mtime": stat.st_mtime, "size": stat.st_size, "invalid": True}
+
+        deleted = [name for name in entries if name not in seen]
+        for name in deleted:
+            removed.append(entries.pop(name))
+
+        if stale or deleted:
+            signature = _catalog_signature()
+            _write_catalog_file(entries)
+
+            # Sessions added, edited or deleted outside the app reach the totals as deltas of their catalog entries
+            from aggregates import record_catalog_changes
+            record_catalog_changes(
+                signature,
+                removed=[entry for entry in removed if not entry.get("invalid")],
+                added=added
+            )
+
+    catalog = [entry for entry in entries.values() if not entry.get("invalid")]
+    catalog.sort(key=lambda entry: entry["file"], reverse=True)
+
+    return catalog
+
+def _catalog_entry(filename, session_data, mtime, size):
+
+    scores = [score_data.get("score", 0) for score_data in session_data.get("focus_scores") or []]
+
+    return {
+        "file": filename,
+        "topic": session_data.get("topic"),
+        "date": session_data.get("date"),
+        "duration": session_data.get("duration", 0),
+        "avg_focus": session_data.get("avg_focus", 0),
+        "session_type": session_data.get("session_type", "standard"),
+        "focus_total": sum(scores),
+        "focus_count": len(scores),
+        "mtime": mtime,
+        "size": size
+    }
+
+def _read_catalog_file():
+
+    entries = {}
+
+    try:
+        with open(CATALOG_FILE, 'r') as f:
+            data = json.load(f)
+        if data.get("version") == CATALOG_VERSION:
+            entries = dict(data.get("sessions", {}))
+    except (json.JSONDecodeError, FileNotFoundError, AttributeError, TypeError, ValueError):
+        pass
+
+    try:
+        with open(CATALOG_JOURNAL_FILE, 'r') as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                    entries[entry["file"]] = entry
+                except (ValueError, KeyError, TypeError):
+                    # A torn final line from an interrupted save; the next catalog scan picks its session up again
+                    continue
+    except FileNotFoundError:
+        pass
+
+    return entries
+
+def _write_catalog_file(entries):
+
+    temp_path = f"{CATALOG_FILE}.tmp"
+
+    with open(temp_path, 'w') as f:
+        json.dump({"version": CATALOG_VERSION, "sessions": entries}, f)
+
+    os.replace(temp_path, CATALOG_FILE)
+
+    # Every journalled entry is in the file just written
+    try:
+        os.remove(CATALOG_JOURNAL_FILE)
+    except FileNotFoundError:
+        pass
+
+def _append_catalog_entry(entry):
+
+    with open(CATALOG_JOURNAL_FILE, 'a') as f:
+        f.write(json.dumps(entry) + "\n")
+        journal_size = f.tell()
+
+    if journal_size > CATALOG_JOURNAL_MAX_BYTES:
+        _write_catalog_file(_read_catalog_file())
+
+def query_sessions(start=None, end=None, topic=None):
+
+    if STORAGE_BACKEND == "sqlite":
+        from database import query_db_sessions
+        return query_db_sessions(start, end, topic)
+
+    if start is None and end is None:
+        filenames = [entry["file"] for entry in load_catalog() if topic is None or entry.get("topic") == topic]
+        return read_sessions(filenames)
+
+    index = session_date_index()
+    low = bisect_left(index["days"], str(start)) if start is not None else 0
+    high = bisect_right(index["days"], str(end)) if end is not None else len(index["days"])
+
+    filenames = [
+        filename
+        for filename, session_topic in zip(index["files"][low:high], index["topics"][low:high])
+        if topic is None or session_topic == topic
+    ]
+    filenames.reverse()
+
+    return read_sessions(filenames)
+
+def session_date_index():
+
+    catalog = load_catalog()
+    signature = _catalog_signature()
+
+    if signature != _date_index["signature"]:
+        dated = sorted(
+            (entry["date"][:10], entry["file"], entry.get("topic"))
+            for entry in catalog if entry.get("date")
+        )
+        _date_index["signature"] = signature
+        _date_index["days"] = [day for day, _, _ in dated]
+        _date_index["files"] = [filename for _, filename, _ in dated]
+        _date_index["topics"] = [session_topic for _, _, session_topic in dated]
+
+    return _date_index
+
+def _catalog_signature():
+
+    if STORAGE_BACKEND == "segments":
+        from segments import SEGMENT_INDEX_FILE
+        paths = [SEGMENT_INDEX_FILE]
     else:
-        timestamp = datetime.datetime.now().strftime("%Y-%m-%d_%H%M")
+        paths = [CATALOG_FILE, CATALOG_JOURNAL_FILE]
+
+    signature = [STORAGE_BACKEND]
 
-    filename = f"{timestamp}_export.{format_type}"
-    filepath = os.path.join(LOGS_DIR, filename)
+    for path in paths:
+        try:
+            stat = os.stat(path)
+            signature.extend((stat.st_mtime_ns, stat.st_size))
+        except FileNotFoundError:
+            signature.extend((None, None))
+
+    return tuple(signature)
+
+def daily_summary(start=None, end=None):
+
+    if STORAGE_BACKEND == "sqlite":
+        from database import db_daily_summary
+        return db_daily_summary(start, end)
+
+    from aggregates import aggregate_daily_summary
+    return aggregate_daily_summary(start, end)
+
+def session_totals():
+
+    if STORAGE_BACKEND == "sqlite":
+        from database import db_session_totals
+        return db_session_totals()
+
+    from aggregates import load_aggregates
+    aggregates = load_aggregates()
+
+    return {
+        "sessions": aggregates["sessions"],
+        "minutes": aggregates["total_minutes"],
+        "topics": len(aggregates["topics"]),
+        "last_date": max(aggregates["days"]) if aggregates["days"] else None
+    }
+
+def study_topics():
+
+    if STORAGE_BACKEND == "sqlite":
+        from database import db_study_topics
+        return db_study_topics()
+
+    from aggregates import load_aggregates
+    return sorted(load_aggregates()["topics"])
+
+def load_goals():
+
+    if STORAGE_BACKEND == "sqlite":
+        from database import load_db_goals
+        return load_db_goals()
+
+    try:
+        with open(GOALS_FILE, 'r') as f:
+            goals_data = json.load(f)
+        if isinstance(goals_data, dict):
+            return goals_data
+    except (json.JSONDecodeError, FileNotFoundError):
+        pass
+
+    return {"goals": []}
+
+def save_goals(goals_data):
+
+    if STORAGE_BACKEND == "sqlite":
+        from database import save_db_goals
+        save_db_goals(goals_data)
+        return
+
+    with open(GOALS_FILE, 'w') as f:
+        json.dump(goals_data, f, indent=2)
+
+def export_session(session_data, format_type='txt', session_id=None):
+
+    create_logs_dir()
+
+    # Exports are named after the session they hold: its stored ID when known, otherwise its own date
+    if session_id is not None:
+        stem = os.path.splitext(session_id)[0]
+    else:
+        try:
+            date_obj = datetime.datetime.strptime(session_data.get('date', ''), "%Y-%m-%d %H:%M:%S")
+            stem = date_obj.strftime("%Y-%m-%d_%H%M%S")
+        except (TypeError, ValueError):
+            stem = datetime.datetime.now().strftime("%Y-%m-%d_%H%M%S")
 
     if format_type == 'md':
         content = _format_markdown(session_data)
     else:  
         content = _format_text(session_data)
 
-    with open(filepath, 'w') as f:
-        f.write(content)
+    suffix = ""
+    copy = 0
 
-    return filename
+    while True:
+        filename = f"{stem}{suffix}_export.{format_type}"
+        filepath = os.path.join(LOGS_DIR, filename)
+
+        try:
+            with open(filepath, 'x') as f:
+                f.write(content)
+            return filename
+        except FileExistsError:
+            # Two sessions from the same second are exported side by side rather than over each other
+            copy += 1
+            suffix = f"_{copy}"
 
 def _format_text(session_data):
 
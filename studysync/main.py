@@ -1,7 +1,7 @@
 
 import os
 import sys
-import time
+import asyncio
 import datetime
 from rich.console import Console
 from rich.prompt import Prompt, IntPrompt
@@ -10,12 +10,18 @@ from rich.align import Align
 from rich.table import Table
 from rich.box import ROUNDED
 
-from session import StudySession
-from logger import list_sessions, read_session, create_logs_dir
-from stats import generate_weekly_stats
-from utils import display_banner
-from insights import review_due_concepts, display_knowledge_graph, calculate_learning_effectiveness
-from animations import show_studying_cat, show_break_cat, show_completion_cat, show_loading_animation, show_home_cat, show_dashboard_cat, show_buddy_cat, show_motivational_cat, show_listening_cat, show_transition_animation
+from session import StudySession, PomodoroSession
+from logger import list_sessions, read_session, create_logs_dir, load_goals, save_goals, study_topics
+from stats import generate_weekly_stats, generate_range_stats, BUCKETS
+from utils import display_banner, get_color_for_focus_score
+from streaks import current_streak, record_study_day
+from dashboard import load_dashboard_snapshot, prefetch_dashboard
+from config import pause, set_fast_mode
+from runtime import timed_interval
+from clock import get_clock
+from checkpoint import load_checkpoint, clear_checkpoint
+from insights import review_due_concepts, review_all_due_concepts, count_due_concepts, browse_knowledge_graph, calculate_learning_effectiveness
+from animations import show_studying_cat, show_completion_cat, show_loading_animation, show_home_cat, show_dashboard_cat, show_buddy_cat, show_motivational_cat, show_listening_cat, show_transition_animation
 
 console = Console()
 
@@ -23,6 +29,9 @@ def main_menu():
 
     create_logs_dir()
 
+    # Sessions, goals and insights load while the welcome animation plays
+    prefetch_dashboard()
+
     show_home_cat("Welcome to StudySync!", 2)
 
     display_banner(console)
@@ -32,9 +41,11 @@ def main_menu():
 
         show_dashboard_cat("Your StudySync Dashboard", 1)
 
-        display_session_stats_widget()
+        snapshot = load_dashboard_snapshot()
+
+        display_session_stats_widget(snapshot)
 
-        display_study_goals()
+        display_study_goals(snapshot)
 
         options = [
             "[1] [bold]Start Study Session[/bold]",
@@ -45,8 +56,15 @@ def main_menu():
             "[6] [bold magenta on white]Knowledge Graph ^[/bold magenta on white]",  
             "[7] [bold green]Set Study Goals[/bold green]",  
             "[8] [bold yellow on blue]Study Buddy 👥[/bold yellow on blue]",  
-            "[9] Exit"
+            "[9] [bold cyan]Focus Trends[/bold cyan]",
+            "[10] Exit"
         ]
+        choices = [str(i) for i in range(1, 11)]
+
+        interrupted = load_checkpoint()
+        if interrupted:
+            options.insert(0, f"[11] [bold red]Resume Interrupted Session[/bold red] ({interrupted.get('topic')})")
+            choices.append("11")
 
         menu_panel = Panel(
             "\n".join(options),
@@ -56,9 +74,9 @@ def main_menu():
         )
         console.print(menu_panel)
 
-        time.sleep(0.5)  
+        pause(0.5)  
 
-        choice = IntPrompt.ask("\nSelect an option", choices=["1", "2", "3", "4", "5", "6", "7", "8", "9"])
+        choice = IntPrompt.ask("\nSelect an option", choices=choices)
 
         if choice == 1:
             start_session()
@@ -79,9 +97,13 @@ def main_menu():
         elif choice == 8:
             study_buddy()
         elif choice == 9:
+            view_focus_trends()
+        elif choice == 10:
             console.print("[bold green]Thank you for using StudySync CLI. Happy studying![/bold green]")
             show_completion_cat("See you next time!", 2)
             sys.exit(0)
+        elif choice == 11:
+            resume_interrupted_session()
 
 def study_buddy():
 
@@ -279,8 +301,9 @@ def display_buddy_achievements(profile):
     achievements_table.add_row("Total Study Time", format_time(total_duration))
     achievements_table.add_row("Topics Explored", str(unique_topics))
 
-    if 'current_streak' in profile:
-        achievements_table.add_row("Current Streak", f"{profile['current_streak']} days 🔥")
+    streak = current_streak()
+    if streak:
+        achievements_table.add_row("Current Streak", f"{streak} days 🔥")
 
     if profile.get('achievements', []):
         latest_achievement = profile['achievements'][-1]
@@ -454,7 +477,7 @@ def chat_with_buddy(profile):
     buddy_response = response_set[response_index]
 
     console.print(f"\n[bold yellow]Study Buddy is typing...[/bold yellow]")
-    time.sleep(1.5)  
+    pause(1.5)  
     console.print(f"[bold yellow]Study Buddy:[/bold yellow] {buddy_response}")
 
     follow_up_questions = [
@@ -479,7 +502,7 @@ def chat_with_buddy(profile):
         ]
 
         console.print(f"\n[bold yellow]Study Buddy:[/bold yellow] {random.choice(goodbyes)}")
-        time.sleep(1)
+        pause(1)
         study_buddy(profile)  
 
 def get_pep_talk(profile):
@@ -570,7 +593,7 @@ def get_pep_talk(profile):
             ]
             console.print(f"\n[bold yellow]Study Buddy:[/bold yellow] {random.choice(farewells)}")
 
-        time.sleep(1)
+        pause(1)
         study_buddy(profile)  
 
 def virtual_study_session(profile):
@@ -642,10 +665,6 @@ def virtual_study_session(profile):
     else:
         console.print(f"[bold yellow]Study Buddy:[/bold yellow] Let's focus together, {user_name}! I'll check in occasionally with some encouragement.")
 
-    from rich.progress import Progress, TextColumn, BarColumn, TimeRemainingColumn
-
-    start_time = datetime.datetime.now()
-
     easy_encouragements = [
         f"You're cruising through this, {user_name}! Great job!",
         f"Since this is easier for you, try explaining the concepts to solidify your understanding, {user_name}.",
@@ -688,37 +707,23 @@ def virtual_study_session(profile):
     if profile.get('preferences', {}).get('favorite_subjects', []) and topic in profile['preferences']['favorite_subjects']:
         encouragements.append(f"I know {topic} is one of your favorites, {user_name}! Your enthusiasm makes learning more effective!")
 
-    if profile.get('stats', {}).get('current_streak', 0) > 2:
-        streak = profile['stats']['current_streak']
+    streak = current_streak()
+    if streak > 2:
         encouragements.append(f"You're on a {streak}-day study streak, {user_name}! That's impressive consistency!")
 
-    with Progress(
-        TextColumn("[bold blue]{task.description}[/bold blue]"),
-        BarColumn(),
-        TextColumn("{task.percentage:>3.0f}%"),
-        TimeRemainingColumn(),
-    ) as progress:
-        task_description = f"Studying {topic} together"
-        task = progress.add_task(task_description, total=duration * 60)
-
-        import random
-        seconds_passed = 0
-
-        while not progress.finished:
-            progress.update(task, advance=1)
-            seconds_passed += 1
-
-            if seconds_passed % random.randint(180, 300) == 0 and seconds_passed > 0:
-                encouragement = random.choice(encouragements)
-                progress.stop()
-                console.print(f"\n[bold yellow]Study Buddy:[/bold yellow] {encouragement}")
-                time.sleep(2)  
-                progress.start()
-
-            time.sleep(1)
-
-    end_time = datetime.datetime.now()
-    duration_seconds = (end_time - start_time).total_seconds()
+    import random
+
+    def encourage(output):
+        # Printing through the progress console keeps the bar live while the buddy talks
+        output.print(f"\n[bold yellow]Study Buddy:[/bold yellow] {random.choice(encouragements)}")
+
+    elapsed, _ = asyncio.run(timed_interval(
+        duration * 60,
+        f"Studying {topic} together",
+        events=[(lambda: random.randint(180, 300), encourage)]
+    ))
+
+    duration_seconds = round(elapsed)
     from utils import format_time
     duration_formatted = format_time(int(duration_seconds))
     actual_minutes = int(duration_seconds / 60)
@@ -727,9 +732,9 @@ def virtual_study_session(profile):
         profile['study_sessions'] = []
 
     session_data = {
-        'date': datetime.datetime.now().strftime("%Y-%m-%d %H:%M"),
+        'date': get_clock().now().strftime("%Y-%m-%d %H:%M"),
         'topic': topic,
-        'planned_duration': minutes,
+        'planned_duration': duration,
         'actual_duration': actual_minutes,
         'difficulty': difficulty,
         'feeling': None  
@@ -796,27 +801,11 @@ def virtual_study_session(profile):
         ]
         console.print(f"\n[bold yellow]Study Buddy:[/bold yellow] {random.choice(self_care_tips)}")
 
-    today = datetime.datetime.now().date()
-    if 'last_study_date' not in profile['stats']:
-        profile['stats']['last_study_date'] = today.isoformat()
-        profile['stats']['current_streak'] = 1
-    else:
-        last_date = datetime.date.fromisoformat(profile['stats']['last_study_date'])
-        delta = (today - last_date).days
-
-        if delta == 0:  
-            pass  
-        elif delta == 1:  
-            profile['stats']['current_streak'] = profile['stats'].get('current_streak', 0) + 1
-            profile['stats']['last_study_date'] = today.isoformat()
+    previous_streak = current_streak()
+    streak = record_study_day()['current_streak']
 
-            if profile['stats']['current_streak'] in [3, 5, 7, 10, 14, 21, 30]:
-                console.print(f"\n[bold magenta]🔥 {profile['stats']['current_streak']} Day Streak! Amazing consistency, {user_name}![/bold magenta]")
-        else:  
-            profile['stats']['current_streak'] = 1
-            profile['stats']['last_study_date'] = today.isoformat()
-
-    save_buddy_profile(profile)
+    if streak != previous_streak and streak in [3, 5, 7, 10, 14, 21, 30]:
+        console.print(f"\n[bold magenta]🔥 {streak} Day Streak! Amazing consistency, {user_name}![/bold magenta]")
 
     if len(profile.get('study_sessions', [])) > 3:
 
@@ -828,8 +817,8 @@ def virtual_study_session(profile):
         if most_studied and most_studied != topic:
             console.print(f"- You've studied {most_studied} the most ({topic_counts[most_studied]} times)")
 
-        if profile.get('stats', {}).get('current_streak', 0) > 1:
-            console.print(f"- You're on a {profile['stats']['current_streak']}-day study streak! 🔥")
+        if streak > 1:
+            console.print(f"- You're on a {streak}-day study streak! 🔥")
 
         if profile.get('stats', {}).get('total_study_minutes', 0) > 0:
             console.print(f"- Total study time: {profile['stats']['total_study_minutes']} minutes")
@@ -853,7 +842,7 @@ def virtual_study_session(profile):
         virtual_study_session()
     else:
         console.print(f"\n[bold yellow]Study Buddy:[/bold yellow] It was great studying with you, {user_name}! Let's do it again soon.")
-        time.sleep(1)
+        pause(1)
         study_buddy()  
 
 def share_thoughts():
@@ -932,7 +921,7 @@ def share_thoughts():
     ]
 
     console.print("\n[bold yellow]Study Buddy is thinking...[/bold yellow]")
-    time.sleep(1.5)  
+    pause(1.5)  
 
     if sentiment == 'positive':
         response = random.choice(positive_responses)
@@ -965,7 +954,7 @@ def share_thoughts():
             console.print(f"\n[bold yellow]Study Buddy:[/bold yellow] I'm here for you, {user_name}. Please tell me more.")
             more_thoughts = Prompt.ask("Share more of your thoughts")
             console.print(f"\n[bold yellow]Study Buddy:[/bold yellow] Thank you for continuing to share, {user_name}. Remember that challenges are temporary, and I believe in your ability to overcome them.")
-            time.sleep(1)
+            pause(1)
             share_thoughts()  
         elif follow_up == "Get advice":
 
@@ -1000,7 +989,7 @@ def share_thoughts():
                 "Self-care during studying"
         ]
 
-        if profile.get('stats', {}).get('current_streak', 0) > 3:
+        if current_streak() > 3:
             advice_topics.append("Maintaining study streaks")
 
         if profile.get('stats', {}).get('total_study_minutes', 0) > 60:
@@ -1032,7 +1021,7 @@ def share_thoughts():
 
             "Concentration techniques": f"For better concentration, {user_name}, try the 'environment reset' technique: change your study location when focus wanes. Also, use noise-cancelling headphones or background sounds that mask distractions. Before starting, write down exactly what you plan to accomplish in the next 30 minutes.",
 
-            "Maintaining study streaks": f"You're on an impressive {profile.get('stats', {}).get('current_streak', 0)}-day streak, {user_name}! To maintain momentum, try studying at the same time each day to build a habit. Even just 10 minutes counts - consistency matters more than duration.",
+            "Maintaining study streaks": f"You're on an impressive {current_streak()}-day streak, {user_name}! To maintain momentum, try studying at the same time each day to build a habit. Even just 10 minutes counts - consistency matters more than duration.",
 
             "Advancing your study techniques": f"Since you've logged over an hour of study time, {user_name}, you might benefit from advanced techniques like spaced repetition or the Feynman Technique. Spaced repetition involves reviewing material at increasing intervals, while the Feynman Technique involves explaining concepts in simple terms as if teaching someone else.",
 
@@ -1071,78 +1060,24 @@ def share_thoughts():
         })
         save_buddy_profile(profile)
 
-        time.sleep(1)
+        pause(1)
         console.print(f"\n[bold yellow]Study Buddy:[/bold yellow] I hope that helps, {user_name}! Remember, you're doing great.")
 
-    time.sleep(1)
+    pause(1)
     study_buddy()
 
-def display_session_stats_widget():
-
-    sessions = list_sessions()
-
-    total_sessions = len(sessions)
-    total_minutes = 0
-    current_streak = 0
-    last_date = None
-    topics_studied = set()
-    achievements = []
-
-    session_dates = []
-    for filename in sessions:
-        session_data = read_session(filename)
-        if session_data and 'date' in session_data:
-            session_dates.append(session_data['date'])
-            total_minutes += session_data.get('duration', 0)
-
-            if 'topic' in session_data:
-                topics_studied.add(session_data['topic'])
-
-    session_dates.sort(reverse=True)
-
-    from datetime import datetime, timedelta
-
-    if session_dates:
-        try:
-
-            try:
-                last_date = datetime.strptime(session_dates[0], "%Y-%m-%d")
-            except ValueError:
-
-                last_date = datetime.strptime(session_dates[0], "%Y-%m-%d %H:%M:%S")
-
-            current_date = datetime.now().date()
-            last_session_date = last_date.date()
-
-            if current_date == last_session_date or current_date - last_session_date == timedelta(days=1):
-                current_streak = 1
+def display_session_stats_widget(snapshot=None):
 
-                for i in range(1, len(session_dates)):
-                    try:
-                        try:
-                            date = datetime.strptime(session_dates[i], "%Y-%m-%d").date()
-                        except ValueError:
-                            date = datetime.strptime(session_dates[i], "%Y-%m-%d %H:%M:%S").date()
+    if snapshot is None:
+        snapshot = load_dashboard_snapshot()
 
-                        if last_session_date - date == timedelta(days=current_streak):
-                            current_streak += 1
-                        else:
-                            break
-                    except ValueError:
-
-                        continue
-        except Exception:
-
-            pass
-
-    if total_sessions >= 10:
-            achievements.append("+ Study Master: Completed 10+ sessions")
-    if total_minutes >= 500:
-        achievements.append("* Time Wizard: Studied for 500+ minutes")
-    if current_streak >= 3:
-        achievements.append("^ Consistency King: 3+ day streak")
-    if len(topics_studied) >= 3:
-        achievements.append("^ Knowledge Explorer: Studied 3+ topics")
+    total_sessions = snapshot.total_sessions
+    total_minutes = snapshot.total_minutes
+    streak_days = snapshot.current_streak
+    longest_streak = snapshot.longest_streak
+    last_date = snapshot.last_date
+    topics_studied = snapshot.topics
+    achievements = snapshot.achievements()
 
     stats_table = Table(box=ROUNDED, border_style="cyan", show_header=False)
     stats_table.add_column("Stat", style="bold cyan")
@@ -1150,15 +1085,15 @@ def display_session_stats_widget():
 
     stats_table.add_row("📊 Total Sessions", f"[bold]{total_sessions}[/bold]")
     stats_table.add_row("⏱️ Total Study Time", f"[bold]{total_minutes}[/bold] minutes")
-    stats_table.add_row("🔥 Current Streak", f"[bold]{current_streak}[/bold] days")
+    stats_table.add_row("🔥 Current Streak", f"[bold]{streak_days}[/bold] days")
+    stats_table.add_row("🏅 Longest Streak", f"[bold]{longest_streak}[/bold] days")
     stats_table.add_row("📚 Topics Studied", f"[bold]{len(topics_studied)}[/bold]")
 
     if last_date:
-        try:
-            stats_table.add_row("📅 Last Session", f"[bold]{last_date.strftime('%Y-%m-%d')}[/bold]")
-        except Exception:
+        stats_table.add_row("📅 Last Session", f"[bold]{last_date}[/bold]")
 
-            stats_table.add_row("📅 Last Session", f"[bold]Recently[/bold]")
+    if snapshot.due_reviews:
+        stats_table.add_row("🧠 Concepts Due", f"[bold]{snapshot.due_reviews}[/bold] for review")
 
     stats_panel = Panel(
         Align.center(stats_table),
@@ -1178,22 +1113,15 @@ def display_session_stats_widget():
         )
         console.print(achievements_panel)
 
-def display_study_goals():
+def display_study_goals(snapshot=None):
 
-    import os
-    import json
     from datetime import datetime
 
-    goals_file = os.path.join(os.path.dirname(os.path.dirname(__file__)), "goals.json")
-
-    if not os.path.exists(goals_file):
-        return
-
     try:
-        with open(goals_file, "r") as f:
-            goals_data = json.load(f)
+        if snapshot is None:
+            snapshot = load_dashboard_snapshot()
 
-        if not goals_data or not goals_data.get("goals"):
+        if not snapshot.goals:
             return
 
         current_date = datetime.now().date()
@@ -1204,19 +1132,12 @@ def display_study_goals():
         goals_table.add_column("Deadline", style="bold")
         goals_table.add_column("Progress", style="bold")
 
-        sessions = list_sessions()
-        total_minutes = 0
-        topics_studied = set()
-        session_count = len(sessions)
-
-        for filename in sessions:
-            session_data = read_session(filename)
-            if session_data:
-                total_minutes += session_data.get('duration', 0)
-                if 'topic' in session_data:
-                    topics_studied.add(session_data['topic'])
+        totals = snapshot.totals()
+        total_minutes = totals["minutes"]
+        topics_studied = totals["topics"]
+        session_count = totals["sessions"]
 
-        for goal in goals_data["goals"]:
+        for goal in snapshot.goals:
             goal_type = goal.get("type")
             target = goal.get("target")
             deadline = goal.get("deadline")
@@ -1242,7 +1163,7 @@ def display_study_goals():
                         progress_style = "yellow"
             elif goal_type == "topics":
                 if target > 0:
-                    percent = min(100, int((len(topics_studied) / target) * 100))
+                    percent = min(100, int((topics_studied / target) * 100))
                     progress = f"{percent}%"
                     if percent >= 100:
                         progress_style = "green"
@@ -1283,21 +1204,11 @@ def display_study_goals():
 
 def set_study_goals():
 
-    import os
-    import json
     from datetime import datetime, timedelta
 
     console.print(Panel(Align.center("[bold cyan]Set Study Goals[/bold cyan]")))
 
-    goals_file = os.path.join(os.path.dirname(os.path.dirname(__file__)), "goals.json")
-
-    goals_data = {"goals": []}
-    if os.path.exists(goals_file):
-        try:
-            with open(goals_file, "r") as f:
-                goals_data = json.load(f)
-        except:
-            pass
+    goals_data = load_goals()
 
     if goals_data.get("goals"):
         console.print("[bold]Current Goals:[/bold]")
@@ -1359,8 +1270,7 @@ def set_study_goals():
 
         goals_data.setdefault("goals", []).append(new_goal)
 
-        with open(goals_file, "w") as f:
-            json.dump(goals_data, f, indent=2)
+        save_goals(goals_data)
 
         console.print("[bold green]Goal added successfully![/bold green]")
 
@@ -1376,8 +1286,7 @@ def set_study_goals():
 
             goals_data["goals"].pop(int(goal_index) - 1)
 
-            with open(goals_file, "w") as f:
-                json.dump(goals_data, f, indent=2)
+            save_goals(goals_data)
 
             console.print("[bold green]Goal removed successfully![/bold green]")
 
@@ -1388,12 +1297,11 @@ def set_study_goals():
         if Confirm.ask("Are you sure you want to clear all goals?", default=False):
             goals_data["goals"] = []
 
-            with open(goals_file, "w") as f:
-                json.dump(goals_data, f, indent=2)
+            save_goals(goals_data)
 
             console.print("[bold green]All goals cleared![/bold green]")
 
-    time.sleep(1)
+    pause(1)
 
 def start_session():
 
@@ -1428,12 +1336,44 @@ def start_session():
     session = StudySession(topic, goal, duration, break_interval, capture_concepts)
     session.start()
 
+def resume_interrupted_session():
+
+    from rich.prompt import Confirm
+    from utils import format_time
+
+    state = load_checkpoint()
+
+    if not state:
+        console.print("[yellow]No interrupted session found.[/yellow]")
+        return
+
+    console.print(Panel("[bold cyan]Resume Interrupted Session[/bold cyan]"))
+    console.print(f"[bold]Topic:[/bold] {state.get('topic')}")
+    console.print(f"[bold]Goal:[/bold] {state.get('goal')}")
+    console.print(f"[bold]Started:[/bold] {state.get('start_time')}")
+    if state.get("kind") == "pomodoro":
+        session_class = PomodoroSession
+        console.print(f"[bold]Elapsed:[/bold] {format_time(int(state.get('elapsed_seconds', 0)))} of {state.get('total_intervals')} work intervals and their breaks")
+    else:
+        session_class = StudySession
+        console.print(f"[bold]Studied:[/bold] {format_time(int(state.get('studied_seconds', 0)))} of {state.get('duration')} minutes")
+    console.print(f"[bold]Focus scores recorded:[/bold] {len(state.get('focus_scores', []))}")
+
+    if Confirm.ask("Resume this session?", default=True):
+        try:
+            session = session_class.from_checkpoint(state)
+        except (KeyError, TypeError, ValueError) as e:
+            console.print(f"[bold red]The checkpoint could not be read: {e}[/bold red]")
+            clear_checkpoint()
+            return
+        session.resume()
+    elif Confirm.ask("Discard it?", default=False):
+        clear_checkpoint()
+        console.print("[green]Interrupted session discarded.[/green]")
+
 def start_pomodoro_session():
 
-    from utils import PomodoroTimer
-    from rich.progress import Progress, TextColumn, BarColumn, TimeRemainingColumn
     from rich.prompt import Confirm
-    from rich.table import Table
 
     console.print(Panel("[bold cyan]Start Pomodoro Study Session[/bold cyan]"))
 
@@ -1494,134 +1434,8 @@ def start_pomodoro_session():
 
     capture_concepts = Confirm.ask("Would you like to capture key concepts during long breaks?", default=True)
 
-    pomodoro = PomodoroTimer(work_minutes, short_break, long_break, intervals)
-
-    start_time = datetime.datetime.now()
-    focus_scores = []
-
-    console.print(f"\n[bold green]Starting Pomodoro session: {topic}[/bold green]")
-    console.print(Align.center(f"[bold]Goal:[/bold] {goal}"))
-    console.print(Align.center(f"[bold]Work interval:[/bold] {work_minutes} minutes"))
-    console.print(Align.center(f"[bold]Short break:[/bold] {short_break} minutes"))
-    console.print(Align.center(f"[bold]Long break:[/bold] {long_break} minutes"))
-    console.print(Align.center(f"[bold]Total work intervals:[/bold] {total_intervals}\n"))
-
-    show_studying_cat("Let's focus with Pomodoro!", 2)
-
-    completed_work_intervals = 0
-
-    while completed_work_intervals < total_intervals:
-
-        interval_type, duration_minutes = pomodoro.get_next_interval_type()
-
-        if interval_type == 'work':
-            completed_work_intervals += 1
-            console.print(f"\n[bold cyan]Work Interval {completed_work_intervals}/{total_intervals}[/bold cyan]")
-            show_studying_cat(f"Focus time! Interval {completed_work_intervals}/{total_intervals}", 1)
-        elif interval_type == 'short_break':
-            console.print("\n[bold yellow]Short Break![/bold yellow]")
-            show_break_cat("Quick break!", 1)
-        else:  
-            console.print("\n[bold green]Long Break![/bold green]")
-            show_break_cat("Time for a longer break!", 1)
-
-            from utils import get_motivational_quote
-            quote = get_motivational_quote()
-            console.print(Panel(f"[italic cyan]\"{quote}\"[/italic cyan]", border_style="yellow"))
-
-        with Progress(
-            TextColumn("[bold blue]{task.description}[/bold blue]"),
-            BarColumn(),
-            TextColumn("{task.percentage:>3.0f}%"),
-            TimeRemainingColumn(),
-        ) as progress:
-            task_description = f"{'Working' if interval_type == 'work' else 'Break'}: {topic}"
-            task = progress.add_task(task_description, total=duration_minutes * 60)
-
-            while not progress.finished:
-                progress.update(task, advance=1)
-                time.sleep(1)
-
-        pomodoro.complete_current_interval()
-
-        if interval_type == 'work':
-            while True:
-                try:
-                    focus_score = IntPrompt.ask(
-                        "How focused were you in this work interval?", 
-                        choices=["1", "2", "3", "4", "5"]
-                    )
-                    break
-                except ValueError:
-                    console.print("[bold red]Please enter a number between 1 and 5![/bold red]")
-
-            timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            focus_scores.append({
-                "timestamp": timestamp,
-                "score": focus_score,
-                "interval": completed_work_intervals
-            })
-
-            console.print(f"Focus score of {focus_score}/5 recorded.")
-
-        if interval_type == 'long_break' and capture_concepts:
-            from insights import capture_concepts
-            console.print("\n[bold cyan]Learning Insights[/bold cyan]")
-            console.print("Let's capture what you've learned so far.")
-            capture_concepts(topic, goal)
-
-    end_time = datetime.datetime.now()
-    duration_seconds = (end_time - start_time).total_seconds()
-    duration_formatted = format_time(int(duration_seconds))
-
-    if focus_scores:
-        avg_focus = sum(score["score"] for score in focus_scores) / len(focus_scores)
-    else:
-        avg_focus = 0
-
-    console.print("\n" + "=" * 50)
-    console.print("[bold green]Pomodoro Session Complete![/bold green]")
-    console.print(f"[bold]Topic:[/bold] {topic}")
-    console.print(f"[bold]Goal:[/bold] {goal}")
-    console.print(f"[bold]Total Study Time:[/bold] {duration_formatted}")
-    console.print(f"[bold]Completed Work Intervals:[/bold] {completed_work_intervals}")
-    console.print(f"[bold]Average Focus Score:[/bold] {avg_focus:.2f}/5.0")
-
-    if focus_scores:
-        table = Table(show_header=True, header_style="bold magenta")
-        table.add_column("Interval")
-        table.add_column("Timestamp")
-        table.add_column("Focus Score")
-
-        for i, score_data in enumerate(focus_scores, 1):
-            timestamp = score_data["timestamp"]
-            score = score_data["score"]
-            table.add_row(str(i), timestamp, f"{score}/5")
-
-        console.print("\n[bold]Focus Scores by Interval:[/bold]")
-        console.print(table)
-
-    session_data = {
-        "topic": topic,
-        "goal": goal,
-        "date": start_time.strftime("%Y-%m-%d %H:%M:%S"),
-        "duration": int(duration_seconds / 60),  
-        "session_type": "pomodoro",
-        "work_interval": work_minutes,
-        "short_break": short_break,
-        "long_break": long_break,
-        "completed_intervals": completed_work_intervals,
-        "actual_duration_seconds": int(duration_seconds),
-        "focus_scores": focus_scores,
-        "avg_focus": avg_focus
-    }
-
-    from logger import save_session
-    filename = save_session(session_data)
-    console.print(f"\n[bold]Session saved:[/bold] {filename}")
-    console.print("=" * 50)
-
-    show_completion_cat("Great job! You completed your Pomodoro session!", 3)
+    session = PomodoroSession(topic, goal, work_minutes, short_break, long_break, intervals, total_intervals, capture_concepts)
+    session.start()
 
 def view_past_sessions():
 
@@ -1700,6 +1514,98 @@ def view_weekly_stats():
     stats = generate_weekly_stats()
     if not stats:
         console.print("[yellow]Not enough data to generate weekly stats.[/yellow]")
+        Prompt.ask("\nPress Enter to return to the main menu")
+        return
+
+    from rich.prompt import Confirm
+
+    while Confirm.ask("\nView stats for a custom date range?", default=False):
+        today = datetime.date.today()
+
+        try:
+            start = datetime.date.fromisoformat(Prompt.ask("Start date (YYYY-MM-DD)", default=(today - datetime.timedelta(days=30)).isoformat()))
+            end = datetime.date.fromisoformat(Prompt.ask("End date (YYYY-MM-DD)", default=today.isoformat()))
+        except ValueError:
+            console.print("[bold red]Please enter dates as YYYY-MM-DD![/bold red]")
+            continue
+
+        bucket = Prompt.ask("Group by", choices=list(BUCKETS), default="day")
+        topic = Prompt.ask("Topic filter (leave blank for all topics)", default="")
+
+        try:
+            generate_range_stats(start, end, bucket, topic or None)
+        except ValueError as e:
+            console.print(f"[bold red]{e}[/bold red]")
+
+    Prompt.ask("\nPress Enter to return to the main menu")
+
+def view_focus_trends():
+
+    from analytics import FocusData
+
+    console.print(Panel(Align.center("[bold cyan]Focus Trends[/bold cyan]")))
+
+    days = IntPrompt.ask("How many days of history should be analysed? (0 for all)", default=90)
+
+    if days > 0:
+        today = datetime.date.today()
+        focus_data = FocusData.load(today - datetime.timedelta(days=days - 1), today)
+    else:
+        focus_data = FocusData.load()
+
+    if not len(focus_data):
+        console.print("[yellow]No focus scores recorded in this period yet.[/yellow]")
+        Prompt.ask("\nPress Enter to return to the main menu")
+        return
+
+    percentiles = focus_data.percentiles()
+    summary_table = Table(box=ROUNDED, show_header=False)
+    summary_table.add_column("Metric", style="bold cyan")
+    summary_table.add_column("Value")
+    summary_table.add_row("Focus ratings", str(len(focus_data)))
+    summary_table.add_row("Average focus", f"{focus_data.mean():.2f}/5.0")
+    for percentile, value in percentiles.items():
+        summary_table.add_row(f"{percentile}th percentile", f"{value:.2f}")
+    console.print(Panel(summary_table, title="[bold]Overview[/bold]", border_style="cyan", box=ROUNDED))
+
+    rolling = focus_data.rolling_average(5)
+    if len(rolling):
+        step = max(1, len(rolling) // 20)
+        console.print("\n[bold]Rolling Focus Average (5 ratings):[/bold]")
+        for i in range(0, len(rolling), step):
+            value = rolling[i]
+            color = get_color_for_focus_score(value)
+            console.print(f"{i + 1:>5}: [{color}]{'█' * int(value * 4)}[/{color}] {value:.2f}")
+
+    means, counts = focus_data.focus_by_hour()
+    hour_table = Table(box=ROUNDED, header_style="bold magenta")
+    hour_table.add_column("Hour")
+    hour_table.add_column("Ratings")
+    hour_table.add_column("Avg Focus")
+    for hour in range(24):
+        if counts[hour]:
+            color = get_color_for_focus_score(means[hour])
+            hour_table.add_row(f"{hour:02d}:00", str(counts[hour]), f"[{color}]{means[hour]:.2f}[/{color}]")
+    console.print("\n[bold]Focus by Hour of Day:[/bold]")
+    console.print(hour_table)
+
+    topic_table = Table(box=ROUNDED, header_style="bold magenta")
+    topic_table.add_column("Topic")
+    topic_table.add_column("Sessions")
+    topic_table.add_column("Minutes")
+    topic_table.add_column("Mean Focus")
+    topic_table.add_column("Variance")
+    for row in sorted(focus_data.topic_stats(), key=lambda row: row['mean'], reverse=True):
+        color = get_color_for_focus_score(row['mean'])
+        topic_table.add_row(
+            row['topic'],
+            str(row['sessions']),
+            str(row['minutes']),
+            f"[{color}]{row['mean']:.2f}[/{color}]" if row['scores'] else "N/A",
+            f"{row['variance']:.2f}" if row['scores'] else "N/A"
+        )
+    console.print("\n[bold]Focus by Topic:[/bold]")
+    console.print(topic_table)
 
     Prompt.ask("\nPress Enter to return to the main menu")
 
@@ -1707,13 +1613,7 @@ def view_learning_insights():
 
     console.print(Panel(Align.center("[bold cyan]Learning Insights[/bold cyan]")))
 
-    sessions = list_sessions()
-    topics = set()
-
-    for filename in sessions:
-        session_data = read_session(filename)
-        if session_data and 'topic' in session_data:
-            topics.add(session_data['topic'])
+    topics = study_topics()
 
     if not topics:
         console.print("[yellow]No study sessions found. Start a session first![/yellow]")
@@ -1747,10 +1647,26 @@ def view_learning_insights():
 
     console.print(table)
 
-    choice = IntPrompt.ask(
+    due_count = count_due_concepts()
+    if due_count:
+        console.print(f"\n[bold]🧠 {due_count} concepts are due for review across all topics.[/bold] Enter [cyan]a[/cyan] to review them all.")
+
+    choice = Prompt.ask(
         "\nSelect a topic to review concepts (0 to return)", 
-        default=0
-    )
+        default="0"
+    ).strip().lower()
+
+    if choice == "a":
+        if not review_all_due_concepts():
+            console.print("[yellow]No concepts are due for review.[/yellow]")
+            pause(1)
+        return
+
+    try:
+        choice = int(choice)
+    except ValueError:
+        console.print("[bold red]Please enter a topic number or 'a'![/bold red]")
+        return
 
     if choice == 0:
         return
@@ -1761,7 +1677,7 @@ def view_learning_insights():
 
         if not reviewed:
             console.print(f"[yellow]No concepts due for review for '{selected_topic}'.[/yellow]")
-            time.sleep(1)
+            pause(1)
 
 def view_knowledge_graph():
 
@@ -1769,11 +1685,27 @@ def view_knowledge_graph():
 
     show_loading_animation("Generating knowledge graph", 1)
 
-    display_knowledge_graph()
+    browse_knowledge_graph()
 
     Prompt.ask("\nPress Enter to return to the main menu")
 
+def parse_args(argv=None):
+
+    import argparse
+
+    parser = argparse.ArgumentParser(description="StudySync CLI")
+    parser.add_argument("--fast", dest="fast", action="store_const", const=True, default=None,
+                        help="Skip animations and artificial delays (also STUDYSYNC_FAST=1 or \"fast_mode\" in config.json)")
+    parser.add_argument("--no-fast", dest="fast", action="store_const", const=False,
+                        help="Always show animations, even when stdout is not a terminal")
+
+    return parser.parse_args(argv)
+
 if __name__ == "__main__":
+    args = parse_args()
+    if args.fast is not None:
+        set_fast_mode(args.fast)
+
     try:
         main_menu()
     except KeyboardInterrupt:
@@ -0,0 +1,167 @@
+import math
+
+STUDY_BREAK_SECONDS = 30
+
+PHASE_KINDS = ("work", "break", "short_break", "long_break")
+
+class Phase:
+
+    def __init__(self, kind, seconds, number, offset, work_offset):
+
+        self.kind = kind
+        self.seconds = seconds
+        self.number = number
+        self.offset = offset
+        self.work_offset = work_offset
+
+    @property
+    def end(self):
+
+        return self.offset + self.seconds
+
+    @property
+    def is_work(self):
+
+        return self.kind == "work"
+
+    def __repr__(self):
+
+        return f"Phase({self.kind!r}, {self.seconds}, {self.number}, offset={self.offset})"
+
+class SessionPlan:
+
+    def __init__(self, phases):
+
+        self.phases = []
+        offset = 0
+        work_offset = 0
+
+        for kind, seconds, number in phases:
+            self.phases.append(Phase(kind, seconds, number, offset, work_offset))
+            offset += seconds
+            if kind == "work":
+                work_offset += seconds
+
+        self.total_seconds = offset
+        self.work_seconds = work_offset
+        self.work_intervals = sum(1 for phase in self.phases if phase.is_work)
+
+        self._validate()
+
+        # Buckets no wider than the shortest phase hold at most one boundary each, so a lookup takes one index and one comparison
+        self._bucket_seconds = min(phase.seconds for phase in self.phases)
+        self._buckets = []
+        index = 0
+        for bucket in range(math.ceil(self.total_seconds / self._bucket_seconds)):
+            start = bucket * self._bucket_seconds
+            while self.phases[index].end <= start:
+                index += 1
+            self._buckets.append(index)
+
+    def _validate(self):
+
+        if not self.phases:
+            raise ValueError("Session plan has no phases")
+
+        expected_number = 0
+        for position, phase in enumerate(self.phases):
+            if phase.kind not in PHASE_KINDS:
+                raise ValueError(f"Unknown phase kind: {phase.kind}")
+            if not phase.seconds > 0:
+                raise ValueError(f"Phase {position + 1} must have a positive duration")
+
+            if phase.is_work:
+                expected_number += 1
+            elif position == 0 or not self.phases[position - 1].is_work:
+                raise ValueError("Every break must follow a work interval")
+
+            if phase.number != expected_number:
+                raise ValueError(f"Phase {position + 1} belongs to work interval {expected_number}, not {phase.number}")
+
+        if not self.phases[-1].is_work:
+            raise ValueError("Session plan must end with a work interval")
+
+    def __len__(self):
+
+        return len(self.phases)
+
+    def __iter__(self):
+
+        return iter(self.phases)
+
+    def __getitem__(self, index):
+
+        return self.phases[index]
+
+    def phase_index(self, elapsed):
+
+        if elapsed <= 0:
+            return 0
+        if elapsed >= self.total_seconds:
+            return len(self.phases) - 1
+
+        index = self._buckets[int(elapsed // self._bucket_seconds)]
+        if elapsed >= self.phases[index].end:
+            index += 1
+
+        return index
+
+    def phase_at(self, elapsed):
+
+        return self.phases[self.phase_index(elapsed)]
+
+    def work_done(self, elapsed):
+
+        # Study time covered by the first `elapsed` seconds of the plan, breaks excluded
+        phase = self.phase_at(elapsed)
+        if phase.is_work:
+            return phase.work_offset + min(phase.seconds, max(0, elapsed - phase.offset))
+
+        return phase.work_offset
+
+    def completed_work_intervals(self, elapsed):
+
+        phase = self.phase_at(elapsed)
+        if phase.is_work and elapsed < phase.end:
+            return phase.number - 1
+
+        return phase.number
+
+def compile_study_plan(duration, break_interval, break_seconds=STUDY_BREAK_SECONDS):
+
+    if duration <= 0 or not 0 < break_interval <= duration:
+        raise ValueError("Break interval must be positive and less than total duration")
+
+    total_seconds = duration * 60
+    interval_seconds = break_interval * 60
+
+    lengths = [interval_seconds] * (total_seconds // interval_seconds)
+    if total_seconds % interval_seconds:
+        lengths.append(total_seconds % interval_seconds)
+
+    phases = []
+    for number, length in enumerate(lengths, 1):
+        phases.append(("work", length, number))
+        if number < len(lengths):
+            phases.append(("break", break_seconds, number))
+
+    return SessionPlan(phases)
+
+def compile_pomodoro_plan(work_minutes=25, short_break=5, long_break=15, long_break_interval=4, total_intervals=8):
+
+    for name, value in (("Work interval", work_minutes), ("Short break", short_break), ("Long break", long_break),
+                        ("Work intervals before long break", long_break_interval), ("Total work intervals", total_intervals)):
+        if value <= 0:
+            raise ValueError(f"{name} must be positive")
+
+    phases = []
+    for number in range(1, total_intervals + 1):
+        phases.append(("work", work_minutes * 60, number))
+        if number == total_intervals:
+            break
+        if number % long_break_interval == 0:
+            phases.append(("long_break", long_break * 60, number))
+        else:
+            phases.append(("short_break", short_break * 60, number))
+
+    return SessionPlan(phases)
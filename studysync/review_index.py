@@ -0,0 +1,159 @@
+import os
+import sys
+import json
+import argparse
+import datetime
+import threading
+from bisect import bisect_right
+from rich.console import Console
+from rich.table import Table
+
+from insights import INSIGHTS_DIR, create_insights_dir, load_all_insights
+from clock import get_clock
+
+console = Console()
+
+REVIEW_INDEX_FILE = os.path.join(INSIGHTS_DIR, ".review_index")
+
+# Version 2 entries carry concept IDs; an index of any other version is rebuilt on first use
+REVIEW_INDEX_VERSION = 2
+
+_index_lock = threading.Lock()
+
+def concept_entry(concept):
+
+    # Entries sort by due date first, so every "due by" query is a prefix of the list
+    return [concept.next_review, concept.topic, concept.id, concept.content]
+
+def _read_index_file():
+
+    try:
+        with open(REVIEW_INDEX_FILE, 'r') as f:
+            index = json.load(f)
+        if isinstance(index, dict) and index.get("version") == REVIEW_INDEX_VERSION:
+            return index
+    except (json.JSONDecodeError, FileNotFoundError):
+        pass
+
+    return None
+
+def _write_index(index):
+
+    create_insights_dir()
+
+    temp_path = f"{REVIEW_INDEX_FILE}.tmp"
+
+    with open(temp_path, 'w') as f:
+        json.dump(index, f)
+
+    os.replace(temp_path, REVIEW_INDEX_FILE)
+
+def rebuild_review_index():
+
+    entries = sorted(
+        concept_entry(concept)
+        for insights in load_all_insights().values()
+        for concept in insights.concepts
+        if concept.next_review
+    )
+
+    index = {"version": REVIEW_INDEX_VERSION, "entries": entries}
+    _write_index(index)
+
+    return index
+
+def load_review_index():
+
+    index = _read_index_file()
+
+    if index is None:
+        index = rebuild_review_index()
+
+    return index
+
+def update_review_index(added=(), removed=()):
+
+    with _index_lock:
+        index = _read_index_file()
+
+        # A missing index is rebuilt from the topic files, which already hold the change
+        if index is None:
+            rebuild_review_index()
+            return
+
+        removed = {tuple(entry) for entry in removed if entry[0] is not None}
+        entries = [entry for entry in index["entries"] if tuple(entry) not in removed] if removed else index["entries"]
+
+        # Both runs are already sorted, so the sort is a single linear merge
+        entries.extend(entry for entry in added if entry[0] is not None)
+        entries.sort()
+
+        index["entries"] = entries
+        _write_index(index)
+
+def _due_position(entries, until):
+
+    # [until + "\x00"] sorts after every entry due on `until`, whatever its topic and content, and before any later date
+    return bisect_right(entries, [until + "\x00"])
+
+def due_entries(until=None, index=None):
+
+    if until is None:
+        until = get_clock().now().strftime("%Y-%m-%d")
+    if index is None:
+        index = load_review_index()
+
+    entries = index["entries"]
+
+    return entries[:_due_position(entries, until)]
+
+def due_within(days, today=None, index=None):
+
+    if today is None:
+        today = get_clock().now().date()
+
+    return due_entries((today + datetime.timedelta(days=days)).strftime("%Y-%m-%d"), index)
+
+def count_due(until=None, index=None):
+
+    if until is None:
+        until = get_clock().now().strftime("%Y-%m-%d")
+    if index is None:
+        index = load_review_index()
+
+    return _due_position(index["entries"], until)
+
+def main(argv=None):
+
+    parser = argparse.ArgumentParser(description="Maintain the StudySync spaced-repetition review index")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    subparsers.add_parser("rebuild", help="Recompute the review index from every topic file")
+    due_parser = subparsers.add_parser("due", help="List concepts due for review")
+    due_parser.add_argument("--days", type=int, default=0, help="include concepts due in the next N days")
+
+    args = parser.parse_args(argv)
+
+    if args.command == "rebuild":
+        index = rebuild_review_index()
+        console.print(f"[green]Rebuilt review index: {len(index['entries'])} scheduled concepts[/green]")
+    elif args.command == "due":
+        entries = due_within(args.days)
+
+        if not entries:
+            console.print("[green]Nothing is due for review.[/green]")
+            return 0
+
+        table = Table(show_header=True, header_style="bold magenta")
+        table.add_column("Due")
+        table.add_column("Topic")
+        table.add_column("Concept")
+
+        for next_review, topic, _, content in entries:
+            table.add_row(next_review, topic, content)
+
+        console.print(table)
+
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,112 @@
+import asyncio
+import threading
+from rich.progress import Progress, TextColumn, BarColumn, TimeRemainingColumn
+
+from timer import IntervalTimer
+
+def _resolve(future, result=None, error=None):
+
+    if future.done():
+        return
+
+    if error is not None:
+        future.set_exception(error)
+    else:
+        future.set_result(result)
+
+async def run_blocking(func, *args, **kwargs):
+
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+
+    def worker():
+        try:
+            result = func(*args, **kwargs)
+        except BaseException as e:
+            loop.call_soon_threadsafe(_resolve, future, None, e)
+        else:
+            loop.call_soon_threadsafe(_resolve, future, result)
+
+    # A daemon thread, unlike the default executor, never keeps the program alive on a pending prompt
+    threading.Thread(target=worker, name="studysync-input", daemon=True).start()
+
+    return await future
+
+async def wait_or_sleep(until, seconds, clock):
+
+    sleeper = asyncio.ensure_future(clock.async_sleep(seconds))
+
+    try:
+        await asyncio.wait({until, sleeper}, return_when=asyncio.FIRST_COMPLETED)
+    finally:
+        sleeper.cancel()
+
+    return until.done()
+
+async def render_progress(timer, description, until, tick=1.0, events=()):
+
+    clock = timer.clock
+
+    with Progress(
+        TextColumn("[bold blue]{task.description}[/bold blue]"),
+        BarColumn(),
+        TextColumn("{task.percentage:>3.0f}%"),
+        TimeRemainingColumn(),
+        auto_refresh=False,
+        disable=not clock.interactive
+    ) as progress:
+        task = progress.add_task(description, total=timer.seconds, completed=timer.elapsed())
+        event_tasks = [asyncio.ensure_future(_repeat(delay, action, progress.console, until, timer)) for delay, action in events]
+
+        try:
+            while not until.done():
+                progress.update(task, completed=timer.elapsed())
+                progress.refresh()
+
+                # A simulated clock has nobody watching, so it skips straight to the end of the interval
+                step = min(tick, timer.remaining()) if clock.interactive else timer.remaining()
+                await wait_or_sleep(until, max(0, step), clock)
+        finally:
+            for event_task in event_tasks:
+                event_task.cancel()
+
+        progress.update(task, completed=timer.elapsed())
+        progress.refresh()
+
+async def _repeat(delay, action, output, until, timer):
+
+    while True:
+        seconds = delay()
+
+        # An event due after the interval ends never fires, so it waits on the interval instead of a sleep a simulated clock would jump to
+        if seconds >= timer.remaining():
+            await asyncio.wait({until})
+            return
+
+        if await wait_or_sleep(until, seconds, timer.clock):
+            return
+
+        action(output)
+
+async def timed_interval(seconds, description, prompt=None, events=(), tick=1.0):
+
+    timer = IntervalTimer(seconds).start()
+    timer_task = asyncio.ensure_future(timer.wait())
+    answer = None
+
+    try:
+        # Prompts answered during the interval use up its time instead of postponing it
+        if prompt is not None and timer.clock.interactive:
+            answer = await run_blocking(prompt)
+        elif prompt is not None:
+            answer = prompt()
+
+        if not timer_task.done():
+            await render_progress(timer, description, timer_task, tick, events)
+
+        await timer_task
+    finally:
+        timer_task.cancel()
+        timer.stop()
+
+    return timer.elapsed(), answer
@@ -0,0 +1,315 @@
+import sys
+import math
+import argparse
+import datetime
+from abc import ABC, abstractmethod
+import numpy as np
+from rich.console import Console
+
+from clock import get_clock
+from config import load_config, save_config
+from insights import SR_INTERVALS
+
+console = Console()
+
+DEFAULT_SCHEDULER = "ladder"
+
+MAX_RETENTION_LEVEL = 5
+
+def _days(values):
+
+    # Timestamps are "YYYY-MM-DD[ HH:MM:SS]"; scheduling works in whole days
+    try:
+        return np.array([value[:10] if value else "NaT" for value in values], dtype="datetime64[D]")
+    except ValueError:
+        parsed = []
+        for value in values:
+            try:
+                parsed.append(np.datetime64(value[:10] if value else "NaT", "D"))
+            except ValueError:
+                parsed.append(np.datetime64("NaT"))
+        return np.array(parsed, dtype="datetime64[D]")
+
+class ConceptStates:
+
+    def __init__(self, concepts):
+
+        self.concepts = concepts
+        self.levels = np.array([concept.retention_level for concept in concepts], dtype=np.int64)
+        self.ease_factors = np.array([concept.ease_factor for concept in concepts], dtype=np.float64)
+        self.stability = np.array([concept.stability for concept in concepts], dtype=np.float64)
+        self.difficulty = np.array([concept.difficulty for concept in concepts], dtype=np.float64)
+
+        # Concepts are scheduled from their last review, or from their capture if they were never reviewed
+        self.anchors = _days([concept.last_reviewed or concept.created_at for concept in concepts])
+
+    def __len__(self):
+
+        return len(self.concepts)
+
+    def next_reviews(self, intervals):
+
+        days = np.rint(intervals).astype(np.int64).astype("timedelta64[D]")
+        return np.datetime_as_string(self.anchors + days, unit="D")
+
+    def apply(self, intervals):
+
+        changed = 0
+        valid = (~np.isnat(self.anchors)).tolist()
+
+        for concept, is_valid, next_review in zip(self.concepts, valid, self.next_reviews(intervals).tolist()):
+            if not is_valid or concept.next_review == next_review:
+                continue
+            concept.next_review = next_review
+            changed += 1
+
+        return changed
+
+class Scheduler(ABC):
+
+    name = None
+
+    def __init__(self, **params):
+
+        self.params = params
+
+    def update(self, concept, remembered, now):
+
+        if remembered:
+            concept.retention_level = min(MAX_RETENTION_LEVEL, concept.retention_level + 1)
+        else:
+            concept.retention_level = max(0, concept.retention_level - 1)
+
+    @abstractmethod
+    def intervals(self, states):
+
+        pass
+
+    def interval(self, concept):
+
+        return float(self.intervals(ConceptStates([concept]))[0])
+
+class LadderScheduler(Scheduler):
+
+    name = "ladder"
+
+    def __init__(self, ladder=SR_INTERVALS):
+
+        super().__init__(ladder=list(ladder))
+        self.ladder = np.array(ladder, dtype=np.float64)
+
+    def intervals(self, states):
+
+        return self.ladder[np.minimum(states.levels, len(self.ladder) - 1)]
+
+class SM2Scheduler(Scheduler):
+
+    name = "sm2"
+
+    def __init__(self, initial_ease=2.5, minimum_ease=1.3, first_interval=1, second_interval=6, pass_quality=4, fail_quality=2, max_interval=365):
+
+        super().__init__(
+            initial_ease=initial_ease, minimum_ease=minimum_ease, first_interval=first_interval,
+            second_interval=second_interval, pass_quality=pass_quality, fail_quality=fail_quality, max_interval=max_interval
+        )
+        self.initial_ease = initial_ease
+        self.minimum_ease = minimum_ease
+        self.first_interval = first_interval
+        self.second_interval = second_interval
+        self.pass_quality = pass_quality
+        self.fail_quality = fail_quality
+        self.max_interval = max_interval
+
+    def update(self, concept, remembered, now):
+
+        super().update(concept, remembered, now)
+
+        quality = self.pass_quality if remembered else self.fail_quality
+        ease = concept.ease_factor or self.initial_ease
+        ease += 0.1 - (5 - quality) * (0.08 + (5 - quality) * 0.02)
+        concept.ease_factor = max(self.minimum_ease, ease)
+
+    def intervals(self, states):
+
+        # The retention level stands in for SM-2's repetition count: I(1) = first, I(2) = second, I(n) = I(n-1) * EF
+        ease = np.where(states.ease_factors > 0, states.ease_factors, self.initial_ease)
+        repetitions = states.levels
+        grown = self.second_interval * ease ** np.maximum(repetitions - 2, 0)
+        intervals = np.where(repetitions <= 1, self.first_interval, grown)
+
+        return np.clip(intervals, 1, self.max_interval)
+
+class FSRSScheduler(Scheduler):
+
+    name = "fsrs"
+
+    def __init__(self, desired_retention=0.9, initial_stability=1.0, level_growth=2.5, initial_difficulty=5.0,
+                 success_weights=(1.49, 0.14, 0.94), lapse_weights=(1.9, 0.11, 0.29, 2.27), max_interval=365):
+
+        super().__init__(
+            desired_retention=desired_retention, initial_stability=initial_stability, level_growth=level_growth,
+            initial_difficulty=initial_difficulty, success_weights=list(success_weights),
+            lapse_weights=list(lapse_weights), max_interval=max_interval
+        )
+        if not 0 < desired_retention < 1:
+            raise ValueError("Desired retention must be between 0 and 1")
+
+        self.desired_retention = desired_retention
+        self.initial_stability = initial_stability
+        self.level_growth = level_growth
+        self.initial_difficulty = initial_difficulty
+        self.success_weights = success_weights
+        self.lapse_weights = lapse_weights
+        self.max_interval = max_interval
+
+    def _stability(self, levels, stability):
+
+        # Concepts never scheduled by this model start from a stability implied by their retention level
+        return np.where(stability > 0, stability, self.initial_stability * self.level_growth ** levels)
+
+    def update(self, concept, remembered, now):
+
+        stability = float(self._stability(np.array(concept.retention_level), np.array(concept.stability)))
+        difficulty = concept.difficulty or self.initial_difficulty
+
+        anchor = concept.last_reviewed or concept.created_at
+        try:
+            elapsed = max(0, (now.date() - datetime.date.fromisoformat(anchor[:10])).days)
+        except (TypeError, ValueError):
+            elapsed = 0
+        retrievability = (1 + elapsed / (9 * stability)) ** -1
+
+        if remembered:
+            w8, w9, w10 = self.success_weights
+            stability *= 1 + math.exp(w8) * (11 - difficulty) * stability ** -w9 * (math.exp(w10 * (1 - retrievability)) - 1)
+            difficulty = max(1.0, difficulty - 0.5)
+        else:
+            w11, w12, w13, w14 = self.lapse_weights
+            stability = min(stability, w11 * difficulty ** -w12 * ((stability + 1) ** w13 - 1) * math.exp(w14 * (1 - retrievability)))
+            difficulty = min(10.0, difficulty + 1.0)
+
+        super().update(concept, remembered, now)
+        concept.stability = max(0.1, stability)
+        concept.difficulty = difficulty
+
+    def intervals(self, states):
+
+        stability = self._stability(states.levels, states.stability)
+
+        # Days until predicted recall, R(t) = (1 + t / 9S)^-1, falls to the desired retention
+        intervals = 9 * stability * (1 / self.desired_retention - 1)
+
+        return np.clip(np.rint(intervals), 1, self.max_interval)
+
+SCHEDULERS = {
+    LadderScheduler.name: LadderScheduler,
+    SM2Scheduler.name: SM2Scheduler,
+    FSRSScheduler.name: FSRSScheduler
+}
+
+def get_scheduler(name=None, **params):
+
+    config = load_config()
+
+    if name is None:
+        name = config.get("scheduler", DEFAULT_SCHEDULER)
+        params = dict(config.get("scheduler_params") or {}, **params)
+
+    if name not in SCHEDULERS:
+        raise ValueError(f"Unknown scheduler: {name}")
+
+    return SCHEDULERS[name](**params)
+
+def set_scheduler(scheduler):
+
+    config = load_config()
+    config["scheduler"] = scheduler.name
+    config["scheduler_params"] = scheduler.params
+    save_config(config)
+
+def reschedule_concepts(concepts, scheduler):
+
+    states = ConceptStates(concepts)
+
+    if not len(states):
+        return 0
+
+    return states.apply(scheduler.intervals(states))
+
+def reschedule_all(scheduler=None):
+
+    from insights import load_all_insights, save_topic_insights
+    from review_index import rebuild_review_index
+
+    if scheduler is None:
+        scheduler = get_scheduler()
+
+    all_insights = load_all_insights()
+    concepts = [concept for insights in all_insights.values() for concept in insights.concepts]
+
+    # One vectorized pass over every concept; only topics with a moved review date are written back
+    before = {id(concept): concept.next_review for concept in concepts}
+    changed = reschedule_concepts(concepts, scheduler)
+
+    if changed:
+        for insights in all_insights.values():
+            if any(before[id(concept)] != concept.next_review for concept in insights.concepts):
+                save_topic_insights(insights)
+        rebuild_review_index()
+
+    return len(concepts), changed
+
+def _parse_param(value):
+
+    key, _, raw = value.partition("=")
+    if not key or not raw:
+        raise argparse.ArgumentTypeError(f"Expected key=value, got {value!r}")
+
+    try:
+        return key, float(raw)
+    except ValueError:
+        return key, raw
+
+def main(argv=None):
+
+    parser = argparse.ArgumentParser(description="Choose and tune the StudySync spaced-repetition scheduler")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    subparsers.add_parser("show", help="Show the configured scheduler")
+
+    use_parser = subparsers.add_parser("use", help="Switch scheduler and reschedule every concept")
+    use_parser.add_argument("scheduler", choices=sorted(SCHEDULERS))
+    use_parser.add_argument("--param", action="append", type=_parse_param, default=[], help="scheduler parameter as key=value")
+
+    subparsers.add_parser("reschedule", help="Recompute every review date with the configured scheduler")
+
+    args = parser.parse_args(argv)
+
+    if args.command == "show":
+        scheduler = get_scheduler()
+        console.print(f"[bold]Scheduler:[/bold] {scheduler.name}")
+        for key, value in scheduler.params.items():
+            console.print(f"  {key} = {value}")
+        return 0
+
+    if args.command == "use":
+        try:
+            scheduler = get_scheduler(args.scheduler, **dict(args.param))
+        except (TypeError, ValueError) as e:
+            console.print(f"[bold red]{e}[/bold red]")
+            return 1
+        set_scheduler(scheduler)
+    else:
+        scheduler = get_scheduler()
+
+    started = get_clock().monotonic()
+    total, changed = reschedule_all(scheduler)
+    console.print(
+        f"[green]Rescheduled {total} concepts with {scheduler.name}: "
+        f"{changed} review dates moved in {get_clock().monotonic() - started:.2f}s[/green]"
+    )
+
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
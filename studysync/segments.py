@@ -0,0 +1,285 @@
+import os
+import sys
+import json
+import time
+import argparse
+from rich.console import Console
+
+from logger import LOGS_DIR, create_logs_dir, _catalog_entry
+
+console = Console()
+
+SEGMENTS_DIR = os.path.join(LOGS_DIR, "segments")
+SEGMENT_INDEX_FILE = os.path.join(SEGMENTS_DIR, "index.json")
+
+SEGMENT_MAX_BYTES = 4 * 1024 * 1024
+SEGMENT_PREFIX = "segment-"
+SEGMENT_SUFFIX = ".ndjson"
+
+# Version 2 index entries carry each session's focus totals; older indexes are rebuilt from the segments
+SEGMENT_INDEX_VERSION = 2
+
+_index_cache = None
+
+def create_segments_dir():
+
+    create_logs_dir()
+
+    if not os.path.exists(SEGMENTS_DIR):
+        os.makedirs(SEGMENTS_DIR)
+
+def _segment_name(number):
+
+    return f"{SEGMENT_PREFIX}{number:06d}{SEGMENT_SUFFIX}"
+
+def _list_segment_files():
+
+    return sorted(
+        f for f in os.listdir(SEGMENTS_DIR)
+        if f.startswith(SEGMENT_PREFIX) and f.endswith(SEGMENT_SUFFIX)
+    )
+
+def _segment_sizes():
+
+    return {name: os.path.getsize(os.path.join(SEGMENTS_DIR, name)) for name in _list_segment_files()}
+
+def _index_signature():
+
+    try:
+        stat = os.stat(SEGMENT_INDEX_FILE)
+    except FileNotFoundError:
+        return None
+
+    return (stat.st_mtime_ns, stat.st_size)
+
+def load_index():
+
+    global _index_cache
+
+    create_segments_dir()
+
+    # Every write goes through _write_index, so an unchanged index file means the parsed copy is still current
+    signature = _index_signature()
+    if signature is not None and _index_cache is not None and _index_cache[0] == signature:
+        return _index_cache[1]
+
+    try:
+        with open(SEGMENT_INDEX_FILE, 'r') as f:
+            index = json.load(f)
+        if index.get("version") == SEGMENT_INDEX_VERSION and index.get("segments") == _segment_sizes():
+            _index_cache = (signature, index)
+            return index
+    except (json.JSONDecodeError, FileNotFoundError, AttributeError):
+        pass
+
+    return rebuild_index()
+
+def _write_index(index):
+
+    global _index_cache
+
+    temp_path = f"{SEGMENT_INDEX_FILE}.tmp"
+
+    with open(temp_path, 'w') as f:
+        json.dump(index, f)
+
+    os.replace(temp_path, SEGMENT_INDEX_FILE)
+
+    _index_cache = (_index_signature(), index)
+
+def rebuild_index():
+
+    create_segments_dir()
+
+    index = {"version": SEGMENT_INDEX_VERSION, "sessions": {}, "segments": {}}
+
+    for name in _list_segment_files():
+        path = os.path.join(SEGMENTS_DIR, name)
+        valid_end = 0
+
+        with open(path, 'rb') as f:
+            offset = 0
+            for line in f:
+                length = len(line)
+                if line.endswith(b"\n"):
+                    try:
+                        record = json.loads(line)
+                        session_id = record["id"]
+                        index["sessions"][session_id] = _index_entry(
+                            name, offset, length, session_id, record["session"], record.get("saved_at", 0)
+                        )
+                        valid_end = offset + length
+                    except (ValueError, KeyError, TypeError):
+                        pass
+                offset += length
+
+        # Drop a torn final record left behind by an interrupted append
+        if valid_end < os.path.getsize(path):
+            with open(path, 'r+b') as f:
+                f.truncate(valid_end)
+
+        index["segments"][name] = valid_end
+
+    _write_index(index)
+
+    return index
+
+def _index_entry(segment, offset, length, session_id, session_data, saved_at):
+
+    entry = _catalog_entry(session_id, session_data, saved_at, length)
+    entry.update({"segment": segment, "offset": offset, "length": length})
+    return entry
+
+def _active_segment(index, incoming_bytes):
+
+    names = sorted(index["segments"])
+
+    if names:
+        name = names[-1]
+        if index["segments"][name] + incoming_bytes <= SEGMENT_MAX_BYTES or index["segments"][name] == 0:
+            return name
+        number = int(name[len(SEGMENT_PREFIX):-len(SEGMENT_SUFFIX)]) + 1
+    else:
+        number = 1
+
+    name = _segment_name(number)
+    index["segments"][name] = 0
+    return name
+
+def append_sessions(records, index=None):
+
+    if index is None:
+        index = load_index()
+
+    appended = 0
+
+    for session_id, session_data in records:
+        # Sessions already in the store are skipped, so packing the same logs twice adds nothing
+        if session_id in index["sessions"]:
+            continue
+
+        saved_at = time.time()
+        line = (json.dumps({"id": session_id, "saved_at": saved_at, "session": session_data}) + "\n").encode("utf-8")
+        name = _active_segment(index, len(line))
+        path = os.path.join(SEGMENTS_DIR, name)
+
+        with open(path, 'ab') as f:
+            offset = f.tell()
+            f.write(line)
+
+        index["sessions"][session_id] = _index_entry(name, offset, len(line), session_id, session_data, saved_at)
+        index["segments"][name] = offset + len(line)
+        appended += 1
+
+    if appended:
+        _write_index(index)
+
+    return appended
+
+def append_session(session_id, session_data):
+
+    index = load_index()
+
+    if session_id in index["sessions"]:
+        raise FileExistsError(f"Session '{session_id}' already exists in segment store")
+
+    append_sessions([(session_id, session_data)], index)
+
+def list_segment_sessions():
+
+    return sorted(load_index()["sessions"], reverse=True)
+
+def segment_catalog():
+
+    entries = list(load_index()["sessions"].values())
+    entries.sort(key=lambda entry: entry["file"], reverse=True)
+    return entries
+
+def read_segment_session(session_id, index=None):
+
+    if index is None:
+        index = load_index()
+
+    entry = index["sessions"].get(session_id)
+    if entry is None:
+        raise FileNotFoundError(f"No session '{session_id}' in segment store")
+
+    with open(os.path.join(SEGMENTS_DIR, entry["segment"]), 'rb') as f:
+        f.seek(entry["offset"])
+        record = json.loads(f.read(entry["length"]))
+
+    return record["session"]
+
+def read_segment_sessions(session_ids):
+
+    index = load_index()
+    results = [None] * len(session_ids)
+    by_segment = {}
+
+    for position, session_id in enumerate(session_ids):
+        entry = index["sessions"].get(session_id)
+        if entry is None:
+            results[position] = (None, f"No session '{session_id}' in segment store")
+        else:
+            by_segment.setdefault(entry["segment"], []).append((entry["offset"], entry["length"], position))
+
+    for segment, reads in by_segment.items():
+        with open(os.path.join(SEGMENTS_DIR, segment), 'rb') as f:
+            for offset, length, position in sorted(reads):
+                f.seek(offset)
+                try:
+                    results[position] = (json.loads(f.read(length))["session"], None)
+                except (ValueError, KeyError) as e:
+                    results[position] = (None, str(e))
+
+    return results
+
+def pack_json_logs(remove_originals=False):
+
+    create_segments_dir()
+
+    json_files = sorted(f for f in os.listdir(LOGS_DIR) if f.endswith('.json'))
+    records = []
+    packed_files = []
+
+    for filename in json_files:
+        try:
+            with open(os.path.join(LOGS_DIR, filename), 'r') as f:
+                session_data = json.load(f)
+        except (json.JSONDecodeError, FileNotFoundError) as e:
+            console.print(f"[yellow]Skipping {filename}: {e}[/yellow]")
+            continue
+
+        records.append((filename, session_data))
+        packed_files.append(filename)
+
+    packed = append_sessions(records) if records else 0
+
+    if remove_originals:
+        for filename in packed_files:
+            os.remove(os.path.join(LOGS_DIR, filename))
+
+    return packed
+
+def main(argv=None):
+
+    parser = argparse.ArgumentParser(description="Manage the StudySync segmented session store")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    migrate_parser = subparsers.add_parser("migrate", help="Pack logs/*.json files into NDJSON segments")
+    migrate_parser.add_argument("--remove", action="store_true", help="Delete the JSON files after packing them")
+
+    subparsers.add_parser("reindex", help="Rebuild the segment offset index from the segment files")
+
+    args = parser.parse_args(argv)
+
+    if args.command == "migrate":
+        count = pack_json_logs(remove_originals=args.remove)
+        console.print(f"[green]Packed {count} sessions into {SEGMENTS_DIR}[/green]")
+        console.print("[dim]Set STUDYSYNC_STORAGE=segments to read and write sessions from the segment store.[/dim]")
+    elif args.command == "reindex":
+        index = rebuild_index()
+        console.print(f"[green]Indexed {len(index['sessions'])} sessions across {len(index['segments'])} segments[/green]")
+
+if __name__ == "__main__":
+    sys.exit(main())
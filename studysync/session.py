@@ -1,12 +1,17 @@
 
-import time
+import asyncio
 import datetime
+import functools
 from rich.console import Console
-from rich.progress import Progress, TextColumn, BarColumn, TimeRemainingColumn
 from rich.prompt import IntPrompt
+from rich.panel import Panel
 from rich.align import Align
 
 from logger import save_session
+from clock import get_clock
+from runtime import timed_interval
+from plan import compile_study_plan, compile_pomodoro_plan
+from checkpoint import CheckpointJournal, CHECKPOINT_INTERVAL_SECONDS
 from utils import format_time
 from animations import show_studying_cat, show_break_cat, show_completion_cat
 
@@ -21,13 +26,48 @@ class StudySession:
         self.duration = duration  
         self.break_interval = break_interval  
         self.capture_concepts = capture_concepts
+        self.plan = compile_study_plan(duration, break_interval)
         self.start_time = None
         self.end_time = None
         self.focus_scores = []
+        self.studied_seconds = 0.0
+        self.journal = CheckpointJournal()
+        self._interval_started = None
+
+    @classmethod
+    def from_checkpoint(cls, state):
+
+        session = cls(state["topic"], state["goal"], state["duration"], state["break_interval"], state.get("capture_concepts", False))
+        session.start_time = datetime.datetime.strptime(state["start_time"], "%Y-%m-%d %H:%M:%S")
+        session.studied_seconds = float(state.get("studied_seconds", 0))
+        session.focus_scores = list(state.get("focus_scores", []))
+        return session
+
+    def checkpoint_state(self):
+
+        studied_seconds = self.studied_seconds
+        if self._interval_started is not None:
+            studied_seconds += get_clock().monotonic() - self._interval_started
+
+        return {
+            "kind": "study",
+            "topic": self.topic,
+            "goal": self.goal,
+            "duration": self.duration,
+            "break_interval": self.break_interval,
+            "capture_concepts": self.capture_concepts,
+            "start_time": self.start_time.strftime("%Y-%m-%d %H:%M:%S"),
+            "studied_seconds": min(studied_seconds, self.duration * 60),
+            "focus_scores": self.focus_scores
+        }
+
+    def checkpoint(self, force=False):
+
+        self.journal.write(self.checkpoint_state(), force)
 
     def start(self):
 
-        self.start_time = datetime.datetime.now()
+        self.start_time = get_clock().now()
         console.print(f"\n[bold green]Starting study session: {self.topic}[/bold green]")
         console.print(Align.center(f"[bold]Goal:[/bold] {self.goal}"))
         console.print(Align.center(f"[bold]Total Duration:[/bold] {self.duration} minutes"))
@@ -35,39 +75,60 @@ class StudySession:
 
         show_studying_cat("Let's focus!", 2)
 
-        total_seconds = self.duration * 60
-        interval_seconds = self.break_interval * 60
-        num_intervals = total_seconds // interval_seconds
-        remaining_seconds = total_seconds % interval_seconds
+        self._run_session()
+
+    def resume(self):
+
+        console.print(f"\n[bold green]Resuming study session: {self.topic}[/bold green]")
+        console.print(Align.center(f"[bold]Goal:[/bold] {self.goal}"))
+        console.print(Align.center(f"[bold]Studied so far:[/bold] {format_time(int(self.studied_seconds))} of {self.duration} minutes\n"))
+
+        self._run_session()
 
-        for interval in range(1, num_intervals + 1):
-            self._run_interval(interval, interval_seconds)
-            if interval < num_intervals or remaining_seconds > 0:
-                self._take_break(interval)
+    def _run_session(self):
 
-        if remaining_seconds > 0:
-            self._run_interval(num_intervals + 1, remaining_seconds)
+        self.checkpoint(force=True)
 
-        self.end_time = datetime.datetime.now()
+        try:
+            asyncio.run(self._run())
+        except KeyboardInterrupt:
+            self.checkpoint(force=True)
+            console.print("\n[bold yellow]Session progress saved. Resume it from the main menu.[/bold yellow]")
+            raise
+
+        self.end_time = get_clock().now()
         self._show_summary()
 
-    def _run_interval(self, interval_num, seconds):
+    async def _run(self):
+
+        # A resumed session skips the study time it already has and any break whose focus score was recorded
+        recorded = {score_data.get("interval") for score_data in self.focus_scores}
+
+        for phase in self.plan:
+            if phase.is_work:
+                done_seconds = self.studied_seconds - phase.work_offset
+                if done_seconds < phase.seconds:
+                    await self._run_interval(phase.number, phase.seconds - max(0, done_seconds))
+            elif phase.number not in recorded:
+                await self._take_break(phase.number, phase.seconds)
+
+    async def _run_interval(self, interval_num, seconds):
 
         console.print(f"[bold cyan]Study Interval {interval_num}[/bold cyan]")
 
-        with Progress(
-            TextColumn("[bold blue]{task.description}[/bold blue]"),
-            BarColumn(),
-            TextColumn("{task.percentage:>3.0f}%"),
-            TimeRemainingColumn(),
-        ) as progress:
-            task = progress.add_task(f"Studying: {self.topic}", total=seconds)
+        # Left set if the interval is interrupted, so the final checkpoint includes the partial interval
+        self._interval_started = get_clock().monotonic()
+        elapsed, _ = await timed_interval(
+            seconds,
+            f"Studying: {self.topic}",
+            events=[(lambda: CHECKPOINT_INTERVAL_SECONDS, lambda output: self.checkpoint())]
+        )
+        self._interval_started = None
 
-            while not progress.finished:
-                progress.update(task, advance=1)
-                time.sleep(1)
+        self.studied_seconds += elapsed
+        self.checkpoint(force=True)
 
-    def _take_break(self, interval_num):
+    async def _take_break(self, interval_num, seconds):
 
         console.print("\n[bold yellow]Break Time![/bold yellow]")
 
@@ -77,6 +138,11 @@ class StudySession:
         quote = get_motivational_quote()
         console.print(Panel(f"[italic cyan]\"{quote}\"[/italic cyan]", border_style="yellow"))
 
+        # The break countdown starts now and keeps running while the focus and concept prompts are answered
+        await timed_interval(seconds, "Break time remaining", prompt=lambda: self._collect_break_input(interval_num))
+
+    def _collect_break_input(self, interval_num):
+
         while True:
             try:
                 focus_score = IntPrompt.ask(
@@ -87,7 +153,7 @@ class StudySession:
             except ValueError:
                 console.print("[bold red]Please enter a number between 1 and 5![/bold red]")
 
-        timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        timestamp = get_clock().now().strftime("%Y-%m-%d %H:%M:%S")
         self.focus_scores.append({
             "timestamp": timestamp,
             "score": focus_score,
@@ -95,26 +161,22 @@ class StudySession:
         })
 
         console.print(f"Focus score of {focus_score}/5 recorded.")
+        self.checkpoint(force=True)
 
         if self.capture_concepts:
-            from insights import capture_key_concepts
+            from insights import capture_concepts
             console.print("\n[bold cyan]Learning Insights[/bold cyan]")
             console.print("Let's capture what you've learned in this study interval.")
-            capture_key_concepts(self.topic)
+            capture_concepts(self.topic, self.goal)
 
         console.print("Take a short break and prepare for the next interval...\n")
 
-        with Progress() as progress:
-            break_task = progress.add_task("Break time remaining", total=30)
-            for _ in range(30):
-                progress.update(break_task, advance=1)
-                time.sleep(1)
-
     def _show_summary(self):
 
         from rich.table import Table
 
-        duration_seconds = (self.end_time - self.start_time).total_seconds()
+        # Only timed study intervals count, so prompts and animations do not inflate the total
+        duration_seconds = round(self.studied_seconds)
         duration_formatted = format_time(int(duration_seconds))
 
         if self.focus_scores:
@@ -155,7 +217,237 @@ class StudySession:
         }
 
         filename = save_session(session_data)
+        self.journal.clear()
+        console.print(f"\n[bold]Session saved:[/bold] {filename}")
+        console.print("=" * 50)
+
+        show_completion_cat("Great job! You completed your study session!", 3)
+
+class PomodoroSession:
+
+    def __init__(self, topic, goal, work_minutes=25, short_break=5, long_break=15, long_break_interval=4, total_intervals=8, capture_concepts=False):
+
+        self.topic = topic
+        self.goal = goal
+        self.work_minutes = work_minutes
+        self.short_break = short_break
+        self.long_break = long_break
+        self.long_break_interval = long_break_interval
+        self.total_intervals = total_intervals
+        self.capture_concepts = capture_concepts
+        self.plan = compile_pomodoro_plan(work_minutes, short_break, long_break, long_break_interval, total_intervals)
+        self.start_time = None
+        self.end_time = None
+        self.focus_scores = []
+        self.elapsed_seconds = 0.0
+        self.journal = CheckpointJournal()
+        self._interval_started = None
+
+    @classmethod
+    def from_checkpoint(cls, state):
+
+        session = cls(
+            state["topic"], state["goal"], state["work_minutes"], state["short_break"], state["long_break"],
+            state["long_break_interval"], state["total_intervals"], state.get("capture_concepts", False)
+        )
+        session.start_time = datetime.datetime.strptime(state["start_time"], "%Y-%m-%d %H:%M:%S")
+        session.elapsed_seconds = float(state.get("elapsed_seconds", 0))
+        session.focus_scores = list(state.get("focus_scores", []))
+        return session
+
+    def checkpoint_state(self):
+
+        elapsed_seconds = self.elapsed_seconds
+        if self._interval_started is not None:
+            elapsed_seconds += get_clock().monotonic() - self._interval_started
+
+        return {
+            "kind": "pomodoro",
+            "topic": self.topic,
+            "goal": self.goal,
+            "work_minutes": self.work_minutes,
+            "short_break": self.short_break,
+            "long_break": self.long_break,
+            "long_break_interval": self.long_break_interval,
+            "total_intervals": self.total_intervals,
+            "capture_concepts": self.capture_concepts,
+            "start_time": self.start_time.strftime("%Y-%m-%d %H:%M:%S"),
+            "elapsed_seconds": min(elapsed_seconds, self.plan.total_seconds),
+            "focus_scores": self.focus_scores
+        }
+
+    def checkpoint(self, force=False):
+
+        self.journal.write(self.checkpoint_state(), force)
+
+    def start(self):
+
+        self.start_time = get_clock().now()
+        console.print(f"\n[bold green]Starting Pomodoro session: {self.topic}[/bold green]")
+        console.print(Align.center(f"[bold]Goal:[/bold] {self.goal}"))
+        console.print(Align.center(f"[bold]Work interval:[/bold] {self.work_minutes} minutes"))
+        console.print(Align.center(f"[bold]Short break:[/bold] {self.short_break} minutes"))
+        console.print(Align.center(f"[bold]Long break:[/bold] {self.long_break} minutes"))
+        console.print(Align.center(f"[bold]Total work intervals:[/bold] {self.total_intervals}\n"))
+
+        show_studying_cat("Let's focus with Pomodoro!", 2)
+
+        self._run_session()
+
+    def resume(self):
+
+        completed = self.plan.completed_work_intervals(self.elapsed_seconds)
+        console.print(f"\n[bold green]Resuming Pomodoro session: {self.topic}[/bold green]")
+        console.print(Align.center(f"[bold]Goal:[/bold] {self.goal}"))
+        console.print(Align.center(f"[bold]Completed work intervals:[/bold] {completed} of {self.total_intervals}\n"))
+
+        self._run_session()
+
+    def _run_session(self):
+
+        self.checkpoint(force=True)
+
+        try:
+            asyncio.run(self._run())
+        except KeyboardInterrupt:
+            self.checkpoint(force=True)
+            console.print("\n[bold yellow]Session progress saved. Resume it from the main menu.[/bold yellow]")
+            raise
+
+        self.end_time = get_clock().now()
+        self._show_summary()
+
+    async def _run(self):
+
+        recorded = {score_data.get("interval") for score_data in self.focus_scores}
+
+        # A resumed session picks up inside the phase it was interrupted in
+        for phase in self.plan.phases[self.plan.phase_index(self.elapsed_seconds):]:
+            if self.elapsed_seconds >= phase.end:
+                continue
+
+            self._announce(phase)
+
+            # The focus rating for a work interval is asked while the following break is already counting down
+            prompt = None
+            if not phase.is_work and phase.number not in recorded:
+                prompt = functools.partial(self._record_focus, phase.number, self.capture_concepts and phase.kind == "long_break")
+
+            self._interval_started = get_clock().monotonic()
+            await timed_interval(
+                phase.end - self.elapsed_seconds,
+                f"{'Working' if phase.is_work else 'Break'}: {self.topic}",
+                prompt=prompt,
+                events=[(lambda: CHECKPOINT_INTERVAL_SECONDS, lambda output: self.checkpoint())]
+            )
+            self._interval_started = None
+
+            self.elapsed_seconds = phase.end
+            self.checkpoint(force=True)
+
+        # The last work interval has no break after it, so its rating is asked once the timer ends
+        last_interval = self.plan[-1].number
+        if last_interval not in {score_data.get("interval") for score_data in self.focus_scores}:
+            self._record_focus(last_interval, False)
+
+    def _announce(self, phase):
+
+        if phase.is_work:
+            console.print(f"\n[bold cyan]Work Interval {phase.number}/{self.total_intervals}[/bold cyan]")
+            show_studying_cat(f"Focus time! Interval {phase.number}/{self.total_intervals}", 1)
+        elif phase.kind == "short_break":
+            console.print("\n[bold yellow]Short Break![/bold yellow]")
+            show_break_cat("Quick break!", 1)
+        else:
+            console.print("\n[bold green]Long Break![/bold green]")
+            show_break_cat("Time for a longer break!", 1)
+
+            from utils import get_motivational_quote
+            quote = get_motivational_quote()
+            console.print(Panel(f"[italic cyan]\"{quote}\"[/italic cyan]", border_style="yellow"))
+
+    def _record_focus(self, interval_number, capture):
+
+        while True:
+            try:
+                focus_score = IntPrompt.ask(
+                    f"How focused were you in work interval {interval_number}?", 
+                    choices=["1", "2", "3", "4", "5"]
+                )
+                break
+            except ValueError:
+                console.print("[bold red]Please enter a number between 1 and 5![/bold red]")
+
+        timestamp = get_clock().now().strftime("%Y-%m-%d %H:%M:%S")
+        self.focus_scores.append({
+            "timestamp": timestamp,
+            "score": focus_score,
+            "interval": interval_number
+        })
+
+        console.print(f"Focus score of {focus_score}/5 recorded.")
+        self.checkpoint(force=True)
+
+        if capture:
+            from insights import capture_concepts
+            console.print("\n[bold cyan]Learning Insights[/bold cyan]")
+            console.print("Let's capture what you've learned so far.")
+            capture_concepts(self.topic, self.goal)
+
+    def _show_summary(self):
+
+        from rich.table import Table
+
+        # The session length is the sum of its timed work and break intervals, excluding prompts
+        duration_seconds = round(self.elapsed_seconds)
+        duration_formatted = format_time(int(duration_seconds))
+        completed_work_intervals = self.plan.completed_work_intervals(self.elapsed_seconds)
+
+        if self.focus_scores:
+            avg_focus = sum(score["score"] for score in self.focus_scores) / len(self.focus_scores)
+        else:
+            avg_focus = 0
+
+        console.print("\n" + "=" * 50)
+        console.print("[bold green]Pomodoro Session Complete![/bold green]")
+        console.print(f"[bold]Topic:[/bold] {self.topic}")
+        console.print(f"[bold]Goal:[/bold] {self.goal}")
+        console.print(f"[bold]Total Study Time:[/bold] {duration_formatted}")
+        console.print(f"[bold]Completed Work Intervals:[/bold] {completed_work_intervals}")
+        console.print(f"[bold]Average Focus Score:[/bold] {avg_focus:.2f}/5.0")
+
+        if self.focus_scores:
+            table = Table(show_header=True, header_style="bold magenta")
+            table.add_column("Interval")
+            table.add_column("Timestamp")
+            table.add_column("Focus Score")
+
+            for i, score_data in enumerate(self.focus_scores, 1):
+                timestamp = score_data["timestamp"]
+                score = score_data["score"]
+                table.add_row(str(i), timestamp, f"{score}/5")
+
+            console.print("\n[bold]Focus Scores by Interval:[/bold]")
+            console.print(table)
+
+        session_data = {
+            "topic": self.topic,
+            "goal": self.goal,
+            "date": self.start_time.strftime("%Y-%m-%d %H:%M:%S"),
+            "duration": int(duration_seconds / 60),  
+            "session_type": "pomodoro",
+            "work_interval": self.work_minutes,
+            "short_break": self.short_break,
+            "long_break": self.long_break,
+            "completed_intervals": completed_work_intervals,
+            "actual_duration_seconds": int(duration_seconds),
+            "focus_scores": self.focus_scores,
+            "avg_focus": avg_focus
+        }
+
+        filename = save_session(session_data)
+        self.journal.clear()
         console.print(f"\n[bold]Session saved:[/bold] {filename}")
         console.print("=" * 50)
 
-        show_completion_cat("Great job! You completed your study session!", 3)
\ No newline at end of file
+        show_completion_cat("Great job! You completed your Pomodoro session!", 3)
\ No newline at end of file
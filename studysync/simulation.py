@@ -0,0 +1,206 @@
+import os
+import sys
+import time
+import random
+import argparse
+import datetime
+import tempfile
+from contextlib import contextmanager
+from rich.console import Console
+from rich.prompt import PromptBase
+
+from clock import SimulatedClock, use_clock
+
+console = Console()
+
+SIMULATED_TOPICS = [
+    "Physics - Mechanics",
+    "Calculus - Integrals",
+    "Algorithms - Graphs",
+    "Spanish - Vocabulary",
+    "History - Cold War",
+    "Chemistry - Bonding"
+]
+
+DATA_DIR_ENV = "STUDYSYNC_LOGS_DIR"
+
+QUIET_MODULES = ["main", "session", "insights", "animations", "logger", "utils", "runtime", "dashboard"]
+
+class ScriptedAnswers:
+
+    def __init__(self, topic, goal, rng=None, concepts_per_break=1, answers=None):
+
+        self.topic = topic
+        self.goal = goal
+        self.rng = rng if rng is not None else random.Random()
+        self.concepts_per_break = concepts_per_break
+        self.answers = dict(answers or {})
+        self.concepts_captured = 0
+        self.prompts_answered = 0
+
+    def __call__(self, prompt):
+
+        self.prompts_answered += 1
+
+        for prefix, answer in self.answers.items():
+            if prompt.startswith(prefix):
+                return str(answer)
+
+        if prompt.startswith("Topic"):
+            return self.topic
+        if prompt.startswith("Goal"):
+            return self.goal
+        if prompt.startswith("How focused"):
+            return str(self.rng.choices([1, 2, 3, 4, 5], weights=[1, 2, 4, 5, 3])[0])
+        if prompt.startswith("Concept "):
+            number = int(prompt.split()[1])
+            if number > self.concepts_per_break:
+                return ""
+            self.concepts_captured += 1
+            return f"{self.topic} concept {self.concepts_captured}"
+
+        # Everything else takes its default
+        return ""
+
+@contextmanager
+def scripted_prompts(answer):
+
+    original = PromptBase.__dict__["get_input"]
+
+    # Only the terminal read is replaced, so the real prompt parsing and validation still run
+    def get_input(cls, console, prompt, password, stream=None):
+        return answer(prompt.plain if hasattr(prompt, "plain") else str(prompt))
+
+    PromptBase.get_input = classmethod(get_input)
+
+    try:
+        yield answer
+    finally:
+        PromptBase.get_input = original
+
+@contextmanager
+def quiet_output():
+
+    import rich
+    import importlib
+    from config import fast_mode_enabled, set_fast_mode
+
+    consoles = [rich.get_console()]
+    for name in QUIET_MODULES:
+        module = importlib.import_module(name)
+        if isinstance(getattr(module, "console", None), Console):
+            consoles.append(module.console)
+
+    previous = [(target, target.quiet) for target in consoles]
+    fast_mode = fast_mode_enabled()
+
+    for target in consoles:
+        target.quiet = True
+    set_fast_mode(True)
+
+    try:
+        yield
+    finally:
+        for target, quiet in previous:
+            target.quiet = quiet
+        set_fast_mode(fast_mode)
+
+def run_study_session(topic, goal, duration, break_interval, capture_concepts, journal_path):
+
+    from session import StudySession
+    from checkpoint import CheckpointJournal
+
+    session = StudySession(topic, goal, duration, break_interval, capture_concepts)
+    session.journal = CheckpointJournal(journal_path)
+    session.start()
+
+def run_pomodoro_session(topic, goal, total_intervals, capture_concepts, journal_path):
+
+    from session import PomodoroSession
+    from checkpoint import CheckpointJournal
+
+    session = PomodoroSession(topic, goal, total_intervals=total_intervals, capture_concepts=capture_concepts)
+    session.journal = CheckpointJournal(journal_path)
+    session.start()
+
+def use_data_dir(data_dir):
+
+    logs_dir = os.path.join(os.path.abspath(data_dir), "logs")
+
+    # Every data path is fixed when logger is imported, so the directory can only be chosen before that
+    logger = sys.modules.get("logger")
+    if logger is not None and os.path.abspath(logger.LOGS_DIR) != logs_dir:
+        raise RuntimeError(f"StudySync data is already loaded from {os.path.dirname(logger.LOGS_DIR)}")
+
+    os.environ[DATA_DIR_ENV] = logs_dir
+
+    return logs_dir
+
+def run_synthetic_sessions(count, kind="study", start=None, days=30, seed=None, concepts_per_break=1, total_intervals=8, answers=None):
+
+    if not os.environ.get(DATA_DIR_ENV):
+        raise RuntimeError(f"Refusing to write synthetic sessions into the real StudySync data; call use_data_dir() or set {DATA_DIR_ENV}")
+
+    rng = random.Random(seed)
+    start = start if start is not None else datetime.datetime.now().replace(hour=0, minute=0, second=0, microsecond=0) - datetime.timedelta(days=days)
+    stats = {"sessions": 0, "simulated_seconds": 0.0, "prompts": 0, "concepts": 0}
+
+    with tempfile.TemporaryDirectory() as scratch, quiet_output():
+        journal_path = os.path.join(scratch, ".checkpoint")
+
+        for number in range(count):
+            started_at = start + datetime.timedelta(days=rng.randrange(max(1, days)), hours=rng.randint(7, 21), minutes=rng.randrange(60))
+            topic = rng.choice(SIMULATED_TOPICS)
+            script = ScriptedAnswers(topic, f"Synthetic goal {number + 1}", rng, concepts_per_break, answers)
+            clock = SimulatedClock(started_at)
+
+            with use_clock(clock), scripted_prompts(script):
+                if kind == "pomodoro":
+                    run_pomodoro_session(topic, script.goal, total_intervals, concepts_per_break > 0, journal_path)
+                else:
+                    run_study_session(topic, script.goal, rng.choice([30, 45, 60, 90, 120]), rng.choice([20, 25, 30]), concepts_per_break > 0, journal_path)
+
+            stats["sessions"] += 1
+            stats["simulated_seconds"] += clock.elapsed
+            stats["prompts"] += script.prompts_answered
+            stats["concepts"] += script.concepts_captured
+
+    return stats
+
+def main(argv=None):
+
+    parser = argparse.ArgumentParser(description="Run synthetic StudySync sessions on a simulated clock")
+    parser.add_argument("--sessions", type=int, default=100, help="number of sessions to run")
+    parser.add_argument("--kind", choices=["study", "pomodoro"], default="study")
+    parser.add_argument("--days", type=int, default=30, help="spread the sessions over this many days")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--concepts", type=int, default=1, help="concepts captured per break (0-3)")
+    parser.add_argument("--intervals", type=int, default=8, help="total Pomodoro work intervals")
+    parser.add_argument("--data-dir", default=None, help="keep the synthetic logs and insights here (default: a temporary directory removed afterwards)")
+
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory(prefix="studysync-sim-") as scratch:
+        data_dir = args.data_dir or scratch
+        try:
+            use_data_dir(data_dir)
+        except RuntimeError as e:
+            console.print(f"[bold red]{e}[/bold red]")
+            return 1
+
+        started = time.perf_counter()
+        stats = run_synthetic_sessions(args.sessions, args.kind, days=args.days, seed=args.seed, concepts_per_break=args.concepts, total_intervals=args.intervals)
+        wall_seconds = time.perf_counter() - started
+
+    if args.data_dir:
+        console.print(f"[dim]Synthetic data written to {os.path.abspath(args.data_dir)}[/dim]")
+
+    console.print(f"[bold green]Simulated {stats['sessions']} {args.kind} sessions[/bold green]")
+    console.print(f"Simulated study time: {stats['simulated_seconds'] / 3600:.1f} hours")
+    console.print(f"Prompts answered: {stats['prompts']}, concepts captured: {stats['concepts']}")
+    console.print(f"Wall time: {wall_seconds:.2f}s ({stats['sessions'] / max(wall_seconds, 1e-9):.0f} sessions/s)")
+
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,130 +1,184 @@
 
-import os
-import json
 import datetime
-from collections import defaultdict
 from rich.console import Console
 from rich.table import Table
 
-from logger import list_sessions, read_session, LOGS_DIR
+from logger import list_sessions, daily_summary, query_sessions
+from analytics import FocusData
 
 console = Console()
 
-def generate_weekly_stats():
+BUCKETS = ("day", "week", "month", "year")
 
-    session_files = list_sessions()
+def generate_weekly_stats():
 
-    if not session_files:
+    if not list_sessions():
         return False
 
-    sessions = []
-    for filename in session_files:
-        session_data = read_session(filename)
-        if session_data:
-            sessions.append(session_data)
+    today = datetime.datetime.now().date()
+    week_start = today - datetime.timedelta(days=6)
+    rows = compute_range_stats(week_start, today, "day")
+
+    _display_weekly_overview(rows)
+
+    _display_focus_trend(rows)
+
+    _display_focus_distribution(FocusData.load(week_start, today))
 
-    if not sessions:
+    return True
+
+def generate_range_stats(start, end, bucket="day", topic=None):
+
+    if not list_sessions():
         return False
 
-    days_data = _group_sessions_by_day(sessions)
+    rows = compute_range_stats(start, end, bucket, topic)
 
-    _display_weekly_overview(days_data)
+    title = f"{bucket.capitalize()} Stats: {start} to {end}"
+    if topic:
+        title += f" ({topic})"
 
-    _display_focus_trend(days_data)
+    _display_bucket_table(rows, title, bucket.capitalize())
+
+    console.print("\n[bold]Focus Trend:[/bold]")
+    _display_ascii_chart([row['short_label'] for row in rows], [row['avg_focus'] for row in rows])
 
     return True
 
-def _group_sessions_by_day(sessions):
+def compute_range_stats(start, end, bucket="day", topic=None):
+
+    if bucket not in BUCKETS:
+        raise ValueError(f"Unknown bucket '{bucket}', expected one of: {', '.join(BUCKETS)}")
+    if start > end:
+        raise ValueError("Start date must not be after end date")
+
+    if topic is None:
+        daily = daily_summary(start, end)
+    else:
+        daily = FocusData(query_sessions(start, end, topic)).daily_summary()
+
+    rows = {}
+    bucket_start = _bucket_start(start, bucket)
+    while bucket_start <= end:
+        rows[bucket_start] = {
+            'start': bucket_start,
+            'label': _bucket_label(bucket_start, bucket),
+            'short_label': _bucket_label(bucket_start, bucket, short=True),
+            'sessions': 0,
+            'total_duration': 0,
+            'focus_total': 0,
+            'focus_count': 0,
+            'avg_focus': 0
+        }
+        bucket_start = _next_bucket(bucket_start, bucket)
+
+    for day, summary in daily.items():
+        try:
+            day_date = datetime.date.fromisoformat(day)
+        except ValueError:
+            continue
+
+        row = rows.get(_bucket_start(day_date, bucket))
+        if row is None:
+            continue
 
-    days_data = defaultdict(lambda: {
-        'sessions': 0,
-        'total_duration': 0,
-        'focus_scores': [],
-        'avg_focus': 0
-    })
+        row['sessions'] += summary['sessions']
+        row['total_duration'] += summary['total_duration']
+        row['focus_total'] += summary['avg_focus'] * summary['focus_count']
+        row['focus_count'] += summary['focus_count']
 
-    today = datetime.datetime.now().date()
+    for row in rows.values():
+        if row['focus_count']:
+            row['avg_focus'] = row['focus_total'] / row['focus_count']
 
-    for session in sessions:
-        try:
+    return list(rows.values())
 
-            session_date = datetime.datetime.strptime(
-                session.get('date', ''), 
-                "%Y-%m-%d %H:%M:%S"
-            ).date()
+def _bucket_start(day, bucket):
 
-            days_ago = (today - session_date).days
-            if days_ago > 7:
-                continue
+    if bucket == "week":
+        return day - datetime.timedelta(days=day.weekday())
+    elif bucket == "month":
+        return day.replace(day=1)
+    elif bucket == "year":
+        return day.replace(month=1, day=1)
+    return day
 
-            day_name = session_date.strftime("%A")
+def _next_bucket(bucket_start, bucket):
 
-            days_data[day_name]['sessions'] += 1
-            days_data[day_name]['total_duration'] += session.get('duration', 0)
+    if bucket == "week":
+        return bucket_start + datetime.timedelta(days=7)
+    elif bucket == "month":
+        if bucket_start.month == 12:
+            return bucket_start.replace(year=bucket_start.year + 1, month=1)
+        return bucket_start.replace(month=bucket_start.month + 1)
+    elif bucket == "year":
+        return bucket_start.replace(year=bucket_start.year + 1)
+    return bucket_start + datetime.timedelta(days=1)
 
-            if 'focus_scores' in session:
-                for score_data in session['focus_scores']:
-                    days_data[day_name]['focus_scores'].append(score_data.get('score', 0))
-        except (ValueError, KeyError):
+def _bucket_label(bucket_start, bucket, short=False):
 
-            continue
+    if bucket == "week":
+        return bucket_start.strftime("W%V %m-%d") if short else f"Week of {bucket_start.isoformat()}"
+    elif bucket == "month":
+        return bucket_start.strftime("%b %Y")
+    elif bucket == "year":
+        return str(bucket_start.year)
+    return bucket_start.strftime("%a %m-%d") if short else bucket_start.strftime("%A %Y-%m-%d")
 
-    for day, data in days_data.items():
-        if data['focus_scores']:
-            data['avg_focus'] = sum(data['focus_scores']) / len(data['focus_scores'])
+def _display_weekly_overview(rows):
 
-    return days_data
+    _display_bucket_table(rows, "Weekly Overview", "Day")
 
-def _display_weekly_overview(days_data):
+def _display_bucket_table(rows, title, period_header):
 
     table = Table(show_header=True, header_style="bold magenta")
-    table.add_column("Day")
+    table.add_column(period_header)
     table.add_column("Sessions")
     table.add_column("Total Duration (min)")
     table.add_column("Avg Focus Score")
 
-    days_order = [
-        "Monday", "Tuesday", "Wednesday", "Thursday", 
-        "Friday", "Saturday", "Sunday"
-    ]
-
-    for day in days_order:
-        if day in days_data:
-            data = days_data[day]
-            avg_focus = f"{data['avg_focus']:.2f}/5.0" if data['avg_focus'] else "N/A"
-            table.add_row(
-                day,
-                str(data['sessions']),
-                str(data['total_duration']),
-                avg_focus
-            )
-        else:
-            table.add_row(day, "0", "0", "N/A")
+    for row in rows:
+        avg_focus = f"{row['avg_focus']:.2f}/5.0" if row['avg_focus'] else "N/A"
+        table.add_row(
+            row['label'],
+            str(row['sessions']),
+            str(row['total_duration']),
+            avg_focus
+        )
 
-    console.print("\n[bold]Weekly Overview:[/bold]")
+    console.print(f"\n[bold]{title}:[/bold]")
     console.print(table)
 
-def _display_focus_trend(days_data):
+def _display_focus_trend(rows):
 
-    days_order = [
-        "Monday", "Tuesday", "Wednesday", "Thursday", 
-        "Friday", "Saturday", "Sunday"
-    ]
+    console.print("\n[bold]Weekly Focus Trend:[/bold]")
+    _display_ascii_chart([row['short_label'] for row in rows], [row['avg_focus'] for row in rows])
 
-    focus_scores = []
-    for day in days_order:
-        if day in days_data and days_data[day]['avg_focus']:
-            focus_scores.append(days_data[day]['avg_focus'])
-        else:
-            focus_scores.append(0)
+def _display_focus_distribution(focus_data):
 
-    console.print("\n[bold]Weekly Focus Trend:[/bold]")
-    _display_ascii_chart(days_order, focus_scores)
+    if not len(focus_data):
+        return
+
+    percentiles = focus_data.percentiles((25, 50, 90))
+    topic_stats = [row for row in focus_data.topic_stats() if row['scores']]
+
+    console.print("\n[bold]Focus Distribution:[/bold]")
+    console.print(
+        f"Median {percentiles[50]:.2f} · 25th percentile {percentiles[25]:.2f} · "
+        f"90th percentile {percentiles[90]:.2f} across {len(focus_data)} focus ratings"
+    )
+
+    if topic_stats:
+        best = max(topic_stats, key=lambda row: row['mean'])
+        steadiest = min(topic_stats, key=lambda row: row['variance'])
+        console.print(f"Best focus: [green]{best['topic']}[/green] ({best['mean']:.2f}/5.0)")
+        console.print(f"Most consistent: [cyan]{steadiest['topic']}[/cyan] (variance {steadiest['variance']:.2f})")
 
 def _display_ascii_chart(labels, values):
 
     max_value = 5  
     chart_width = 20
+    label_width = max((len(label) for label in labels), default=0)
 
     for i, (label, value) in enumerate(zip(labels, values)):
 
@@ -141,5 +195,4 @@ def _display_ascii_chart(labels, values):
 
         bar = f"[{color}]{'█' * bar_length}[/{color}]"
 
-        day_abbr = label[:3]
-        console.print(f"{day_abbr}: {bar} {value:.2f}/5.0" if value > 0 else f"{day_abbr}: {bar} N/A")
\ No newline at end of file
+        console.print(f"{label:<{label_width}}: {bar} {value:.2f}/5.0" if value > 0 else f"{label:<{label_width}}: {bar} N/A")
\ No newline at end of file
@@ -0,0 +1,145 @@
+import os
+import json
+import datetime
+import threading
+
+from logger import LOGS_DIR, create_logs_dir
+
+STREAK_FILE = os.path.join(LOGS_DIR, ".streak")
+BUDDY_PROFILE_FILE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "buddy_profile.json")
+
+_streak_lock = threading.Lock()
+
+def empty_streak():
+
+    return {
+        "current_streak": 0,
+        "longest_streak": 0,
+        "last_study_date": None
+    }
+
+def update_streak(state, day):
+
+    last_date = state.get("last_study_date")
+
+    if last_date is None:
+        state["current_streak"] = 1
+    else:
+        delta = (day - datetime.date.fromisoformat(last_date)).days
+
+        # Only later days are applied here; record_study_day recounts the streak for back-dated ones
+        if delta <= 0:
+            return state
+        elif delta == 1:
+            state["current_streak"] += 1
+        else:
+            state["current_streak"] = 1
+
+    state["last_study_date"] = day.isoformat()
+    state["longest_streak"] = max(state["longest_streak"], state["current_streak"])
+
+    return state
+
+def _read_streak_file():
+
+    try:
+        with open(STREAK_FILE, 'r') as f:
+            state = json.load(f)
+        if isinstance(state, dict) and "current_streak" in state:
+            return state
+    except (json.JSONDecodeError, FileNotFoundError):
+        pass
+
+    return None
+
+def _write_streak(state):
+
+    create_logs_dir()
+
+    temp_path = f"{STREAK_FILE}.tmp"
+
+    with open(temp_path, 'w') as f:
+        json.dump(state, f)
+
+    os.replace(temp_path, STREAK_FILE)
+
+def _buddy_days():
+
+    try:
+        with open(BUDDY_PROFILE_FILE, 'r') as f:
+            profile = json.load(f)
+        return {session["date"][:10] for session in profile.get("study_sessions", []) if session.get("date")}
+    except (json.JSONDecodeError, FileNotFoundError, AttributeError, KeyError, TypeError):
+        return set()
+
+def rebuild_streak(extra_days=()):
+
+    from logger import daily_summary
+
+    state = empty_streak()
+
+    # Study Buddy sessions are kept in the buddy profile rather than the session store, but count toward the streak too
+    days = set(daily_summary()) | _buddy_days() | {day.isoformat() for day in extra_days}
+
+    for day in sorted(days):
+        try:
+            update_streak(state, datetime.date.fromisoformat(day))
+        except ValueError:
+            continue
+
+    _write_streak(state)
+
+    return state
+
+def load_streak():
+
+    state = _read_streak_file()
+
+    if state is None:
+        state = rebuild_streak()
+
+    return state
+
+def record_study_day(day=None):
+
+    if day is None:
+        day = datetime.date.today()
+
+    with _streak_lock:
+        state = _read_streak_file()
+
+        # A missing file is rebuilt from every study day; so is a back-dated day, which can join or split earlier runs
+        if state is None or (state["last_study_date"] and day.isoformat() < state["last_study_date"]):
+            return rebuild_streak(extra_days=[day])
+
+        previous_streak = state["current_streak"]
+        previous_date = state["last_study_date"]
+        update_streak(state, day)
+
+        if state["current_streak"] != previous_streak or state["last_study_date"] != previous_date:
+            _write_streak(state)
+
+    return state
+
+def current_streak(state=None, today=None):
+
+    if state is None:
+        state = load_streak()
+    if today is None:
+        today = datetime.date.today()
+
+    if not state.get("last_study_date"):
+        return 0
+
+    # A streak is still alive until a full day passes without studying
+    if (today - datetime.date.fromisoformat(state["last_study_date"])).days > 1:
+        return 0
+
+    return state["current_streak"]
+
+def session_day(session_data):
+
+    try:
+        return datetime.datetime.strptime(session_data.get("date", ""), "%Y-%m-%d %H:%M:%S").date()
+    except (TypeError, ValueError):
+        return datetime.date.today()
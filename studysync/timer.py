@@ -0,0 +1,51 @@
+from clock import get_clock
+
+class IntervalTimer:
+
+    def __init__(self, seconds, clock=None):
+
+        self.seconds = seconds
+        self.clock = clock if clock is not None else get_clock()
+        self.started_at = None
+        self.stopped_at = None
+
+    def start(self):
+
+        if self.started_at is None:
+            self.started_at = self.clock.monotonic()
+
+        return self
+
+    def stop(self):
+
+        if self.started_at is not None and self.stopped_at is None:
+            self.stopped_at = self.clock.monotonic()
+
+    def elapsed(self):
+
+        if self.started_at is None:
+            return 0.0
+
+        now = self.stopped_at if self.stopped_at is not None else self.clock.monotonic()
+        return min(now - self.started_at, self.seconds)
+
+    def remaining(self):
+
+        return self.seconds - self.elapsed()
+
+    @property
+    def finished(self):
+
+        return self.elapsed() >= self.seconds
+
+    async def wait(self):
+
+        self.start()
+
+        end = self.started_at + self.seconds
+        delay = end - self.clock.monotonic()
+        while delay > 0:
+            await self.clock.async_sleep(delay)
+            delay = end - self.clock.monotonic()
+
+        self.stopped_at = end
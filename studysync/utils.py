@@ -51,36 +51,4 @@ def get_motivational_quote():
     ]
 
     import random
-    return random.choice(quotes)
-
-class PomodoroTimer:
-
-    def __init__(self, work_minutes=25, short_break_minutes=5, long_break_minutes=15, long_break_interval=4):
-
-        self.work_minutes = work_minutes
-        self.short_break_minutes = short_break_minutes
-        self.long_break_minutes = long_break_minutes
-        self.long_break_interval = long_break_interval
-        self.completed_intervals = 0
-
-    def get_next_interval_type(self):
-
-        if self.completed_intervals % (self.long_break_interval * 2 - 1) == 0 and self.completed_intervals > 0:
-            return 'long_break', self.long_break_minutes
-        elif self.completed_intervals % 2 == 0:
-            return 'work', self.work_minutes
-        else:
-            return 'short_break', self.short_break_minutes
-
-    def complete_current_interval(self):
-
-        self.completed_intervals += 1
-
-    def get_session_progress(self):
-
-        work_intervals = (self.completed_intervals + 1) // 2
-        return {
-            'completed_work_intervals': work_intervals,
-            'completed_breaks': self.completed_intervals // 2,
-            'total_work_minutes': work_intervals * self.work_minutes
-        }
\ No newline at end of file
+    return random.choice(quotes)
\ No newline at end of file
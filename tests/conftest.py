@@ -0,0 +1,8 @@
+import os
+import sys
+import tempfile
+
+# Modules resolve their data directories at import time, so point them at a scratch directory before any import
+os.environ["STUDYSYNC_LOGS_DIR"] = os.path.join(tempfile.mkdtemp(prefix="studysync-tests-"), "logs")
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "studysync"))
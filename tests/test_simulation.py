@@ -0,0 +1,43 @@
+import datetime
+
+import pytest
+
+from clock import SimulatedClock, use_clock
+from plan import compile_pomodoro_plan, compile_study_plan
+from simulation import ScriptedAnswers, quiet_output, scripted_prompts, run_pomodoro_session, run_study_session
+
+START = datetime.datetime(2024, 1, 1, 9, 0, 0)
+
+def _simulate(run, tmp_path):
+
+    clock = SimulatedClock(START)
+    script = ScriptedAnswers("Physics", "Goal")
+
+    with quiet_output(), use_clock(clock), scripted_prompts(script):
+        run(str(tmp_path / ".checkpoint"))
+
+    return clock
+
+@pytest.mark.parametrize("total_intervals", [1, 4, 8])
+def test_pomodoro_ends_when_its_plan_does(tmp_path, total_intervals):
+
+    clock = _simulate(lambda journal: run_pomodoro_session("Physics", "Goal", total_intervals, False, journal), tmp_path)
+
+    assert clock.elapsed == compile_pomodoro_plan(total_intervals=total_intervals).total_seconds
+
+@pytest.mark.parametrize("duration, break_interval", [(60, 30), (45, 20), (30, 30)])
+def test_study_session_ends_when_its_plan_does(tmp_path, duration, break_interval):
+
+    clock = _simulate(lambda journal: run_study_session("Physics", "Goal", duration, break_interval, False, journal), tmp_path)
+
+    assert clock.elapsed == compile_study_plan(duration, break_interval).total_seconds
+
+def test_focus_is_recorded_when_the_work_interval_ends(tmp_path):
+
+    from logger import list_sessions, read_session
+
+    _simulate(lambda journal: run_study_session("Physics", "Goal", 60, 30, False, journal), tmp_path)
+
+    session_data = read_session(list_sessions()[0])
+
+    assert session_data["focus_scores"][0]["timestamp"] == "2024-01-01 09:30:00"